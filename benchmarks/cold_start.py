@@ -0,0 +1,74 @@
+"""Cold-start benchmark for langchain-scrapegraph.
+
+Measures, each in a fresh interpreter:
+
+* import time of ``langchain_scrapegraph.tools``
+* import time of a single tool (``ScrapeTool``)
+* construction time of that tool
+* latency of its first ``invoke`` (client construction + a mocked request)
+
+The first call runs against the SDK's built-in mock mode, so no network access
+or API key is needed. Run with:
+
+    python benchmarks/cold_start.py [--runs N]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_PROBE = """
+import json, time
+
+t0 = time.perf_counter()
+import langchain_scrapegraph.tools as tools
+t1 = time.perf_counter()
+from langchain_scrapegraph.tools import ScrapeTool
+t2 = time.perf_counter()
+tool = ScrapeTool(api_key="sgai-00000000-0000-0000-0000-000000000000")
+t3 = time.perf_counter()
+
+from functools import partial
+from scrapegraph_py import Client
+import langchain_scrapegraph.clients as clients
+clients.Client = partial(Client, mock=True)
+
+t4 = time.perf_counter()
+tool.invoke({"website_url": "https://example.com"})
+t5 = time.perf_counter()
+
+print(json.dumps({
+    "import package": t1 - t0,
+    "import ScrapeTool": t2 - t1,
+    "construct tool": t3 - t2,
+    "first invoke": t5 - t4,
+}))
+"""
+
+
+def run(runs: int) -> dict:
+    samples: dict = {}
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", _PROBE], text=True)
+        for name, seconds in json.loads(output.strip().splitlines()[-1]).items():
+            samples.setdefault(name, []).append(seconds * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'phase':<20}{'median ms':>12}{'min ms':>12}{'max ms':>12}")
+    for name, values in run(args.runs).items():
+        print(
+            f"{name:<20}{statistics.median(values):>12.2f}"
+            f"{min(values):>12.2f}{max(values):>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
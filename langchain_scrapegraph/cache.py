@@ -0,0 +1,410 @@
+"""Response caches that tools can use to skip repeated API calls."""
+
+import copy
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_WHITESPACE = re.compile(r"\s+")
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so that trivially different spellings share a cache key.
+
+    Lower-cases the scheme and host, drops default ports and the fragment,
+    sorts query parameters and ensures an empty path becomes ``/``.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    if parts.username:
+        userinfo = parts.username
+        if parts.password:
+            userinfo = f"{userinfo}:{parts.password}"
+        host = f"{userinfo}@{host}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace and case so equivalent prompts share a cache key."""
+    return _WHITESPACE.sub(" ", prompt).strip().casefold()
+
+
+def hash_value(value: Any) -> Optional[str]:
+    """Return a stable SHA-256 digest of a string or JSON-serializable value."""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a cache key from the given request components."""
+    return hash_value(list(parts))
+
+
+class CacheStats:
+    """Hit/miss counters for a cache."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __repr__(self) -> str:
+        return f"CacheStats({self.as_dict()})"
+
+
+class BaseCache(ABC):
+    """Interface shared by the response cache backends.
+
+    Values are JSON-compatible API responses. ``get`` returns ``None`` on a
+    miss, so ``None`` itself is never cached.
+    """
+
+    stats: CacheStats
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or ``None`` if absent or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, optionally overriding the default TTL."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` from the cache if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+
+
+class InMemoryCache(BaseCache):
+    """Thread-safe in-process cache with TTL expiry and LRU eviction.
+
+    Args:
+        maxsize: Maximum number of entries kept before the least recently used
+            one is evicted.
+        ttl: Default time-to-live in seconds. ``None`` keeps entries until
+            they are evicted.
+        max_bytes: Optional bound on the total JSON-encoded size of the cached
+            values; least recently used entries are evicted to stay under it.
+        timer: Clock used for expiry, mainly to ease testing.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = 3600.0,
+        max_bytes: Optional[int] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._timer = timer
+        self._lock = threading.Lock()
+        # key -> (expires_at, size, value)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], int, Any]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, _, value = entry
+            if expires_at is not None and expires_at <= self._timer():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if value is None:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        size = len(json.dumps(value, default=str)) if self.max_bytes else 0
+        if self.max_bytes and size > self.max_bytes:
+            return
+        expires_at = self._timer() + ttl if ttl is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, size, value)
+            self._bytes += size
+            while len(self._entries) > self.maxsize or (
+                self.max_bytes and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+# Triggers keeping cache_size.total equal to the sum of the entries' sizes.
+_SIZE_TRIGGERS = (
+    ("cache_size_insert", "INSERT", "total + new.size"),
+    ("cache_size_delete", "DELETE", "total - old.size"),
+    ("cache_size_update", "UPDATE OF size", "total + new.size - old.size"),
+)
+# Oldest entries read at a time while evicting.
+_EVICTION_BATCH = 64
+
+
+class SQLiteCache(BaseCache):
+    """Disk-backed cache shared by every process that opens the same file.
+
+    Entries live in a SQLite database in WAL mode, so many worker processes can
+    read concurrently while one writes. Values are stored as zlib-compressed
+    JSON, every entry carries its own expiry time, and once the total
+    compressed size exceeds ``max_bytes`` the least recently used entries are
+    evicted. Hit/miss statistics are tracked per process.
+
+    The total size is kept up to date by triggers, so a write only walks the
+    oldest entries, through the index on access time, when it has to evict.
+    Reads record their access time at most once per ``touch_interval``
+    seconds per entry, which keeps most hits from taking the write lock at
+    the cost of a coarser LRU order.
+
+    Args:
+        path: Database file; created if missing.
+        ttl: Default time-to-live in seconds. ``None`` keeps entries until
+            they are evicted.
+        max_bytes: Bound on the total compressed size of the cached values.
+        compression_level: zlib compression level (0-9).
+        timeout: Seconds to wait for a lock held by another process.
+        touch_interval: Seconds between access-time updates of an entry.
+        timer: Wall clock used for expiry; must agree across processes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = 3600.0,
+        max_bytes: int = 256 * 1024 * 1024,
+        compression_level: int = 6,
+        timeout: float = 30.0,
+        touch_interval: float = 60.0,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.timeout = timeout
+        self.touch_interval = touch_interval
+        self.stats = CacheStats()
+        self._timer = timer
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires_at REAL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)"
+        )
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_size ("
+                " id INTEGER PRIMARY KEY CHECK (id = 0),"
+                " total INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO cache_size (id, total)"
+                " SELECT 0, COALESCE(SUM(size), 0) FROM cache"
+            )
+            for name, event, total in _SIZE_TRIGGERS:
+                conn.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON cache"
+                    f" BEGIN UPDATE cache_size SET total = {total}; END"
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections must not cross threads or forks, so keep one per
+        # thread and reopen it in a forked child.
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        return self._total(self._connect())
+
+    @staticmethod
+    def _total(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT total FROM cache_size").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        conn = self._connect()
+        now = self._timer()
+        row = conn.execute(
+            "SELECT value, expires_at, accessed_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+        blob, expires_at, accessed_at = row
+        if expires_at is not None and expires_at <= now:
+            conn.execute(
+                "DELETE FROM cache WHERE key = ? AND expires_at <= ?", (key, now)
+            )
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        if now - accessed_at >= self.touch_interval:
+            conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+        self.stats.hits += 1
+        return json.loads(zlib.decompress(blob))
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if value is None:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        blob = zlib.compress(
+            json.dumps(value, default=str).encode("utf-8"), self.compression_level
+        )
+        if len(blob) > self.max_bytes:
+            return
+        now = self._timer()
+        expires_at = now + ttl if ttl is not None else None
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # An upsert rather than INSERT OR REPLACE: REPLACE deletes
+            # without firing the size triggers.
+            conn.execute(
+                "INSERT INTO cache (key, value, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET value = excluded.value,"
+                " size = excluded.size, expires_at = excluded.expires_at,"
+                " accessed_at = excluded.accessed_at",
+                (key, blob, len(blob), expires_at, now),
+            )
+            evicted = 0
+            if self._total(conn) > self.max_bytes:
+                conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+                evicted = self._evict(conn, self._total(conn) - self.max_bytes)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self.stats.evictions += evicted
+
+    def _evict(self, conn: sqlite3.Connection, excess: int) -> int:
+        """Delete least recently used entries until ``excess`` bytes are freed."""
+        evicted = 0
+        while excess > 0:
+            rows = conn.execute(
+                "SELECT rowid, size FROM cache ORDER BY accessed_at LIMIT ?",
+                (_EVICTION_BATCH,),
+            ).fetchall()
+            if not rows:
+                break
+            victims = []
+            for rowid, size in rows:
+                if excess <= 0:
+                    break
+                victims.append((rowid,))
+                excess -= size
+            conn.executemany("DELETE FROM cache WHERE rowid = ?", victims)
+            evicted += len(victims)
+        return evicted
+
+    def delete(self, key: str) -> None:
+        self._connect().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        """Close this thread's connection to the database."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,264 @@
+"""Circuit breakers that fail fast while a ScrapeGraph service is degraded."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from langchain_core.tools import ToolException
+
+from .concurrency import is_overload_error
+from .deadline import DeadlineExceeded
+from .ratelimit import RateLimitCancelled
+
+R = TypeVar("R")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ToolException):
+    """Raised instead of calling a service whose circuit is open.
+
+    It is a ``ToolException``, so tools created with ``handle_tool_error=True``
+    report it to the agent, which can then route around the service.
+    """
+
+    def __init__(self, service: str, retry_after: float) -> None:
+        self.service = service
+        self.retry_after = retry_after
+        super().__init__(
+            f"The {service} service is temporarily unavailable; "
+            f"retry in {retry_after:.0f}s or use another tool."
+        )
+
+
+def is_service_failure(error: BaseException) -> bool:
+    """Whether ``error`` points at the service rather than at the request.
+
+    A 429 does not: it means one API key is over its quota, which the rate
+    limiter, AIMD and retries deal with, and it must not cut off every other
+    key using the service.
+    """
+    if getattr(error, "status_code", None) == 429:
+        return False
+    return is_overload_error(error) or isinstance(error, ConnectionError)
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker over a sliding window of calls.
+
+    While closed, the outcomes of the last ``window_size`` calls are kept.
+    Once at least ``min_calls`` have been seen and the share of failures
+    reaches ``failure_rate_threshold``, the circuit opens and calls fail
+    immediately with ``CircuitOpenError``. After ``open_duration`` seconds it
+    becomes half-open and lets ``half_open_calls`` trial calls through: if
+    they all succeed it closes again, and any failure reopens it.
+
+    Only service failures (5xx, timeouts, connection errors) count; errors
+    caused by the request itself, such as a 400 or a 429 for one key's
+    quota, count as successes of the service. A deadline that passes while waiting on the API counts
+    as a failure; one that passes before the request is sent, e.g. in the
+    rate limiter, is not counted at all.
+
+    Args:
+        failure_rate_threshold: Failure share (0-1) that opens the circuit.
+        window_size: Number of recent calls considered.
+        min_calls: Calls needed in the window before the rate is trusted.
+        open_duration: Seconds to stay open before probing again.
+        half_open_calls: Trial calls allowed while half-open.
+        name: Service name used in error messages.
+        timer: Monotonic clock, mainly to ease testing.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 1,
+        name: str = "service",
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.name = name
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+
+    @property
+    def state(self) -> str:
+        """``"closed"``, ``"open"`` or ``"half_open"``."""
+        with self._lock:
+            return self._current_state()
+
+    @property
+    def failure_rate(self) -> float:
+        with self._lock:
+            if not self._outcomes:
+                return 0.0
+            return self._outcomes.count(False) / len(self._outcomes)
+
+    def _current_state(self) -> str:
+        if (
+            self._state == OPEN
+            and self._timer() - self._opened_at >= self.open_duration
+        ):
+            self._state = HALF_OPEN
+            self._trials = 0
+            self._trial_successes = 0
+        return self._state
+
+    def allow(self) -> None:
+        """Admit a call, or raise ``CircuitOpenError`` if the circuit is open."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._trials < self.half_open_calls:
+                self._trials += 1
+                return
+            retry_after = max(0.0, self._opened_at + self.open_duration - self._timer())
+        raise CircuitOpenError(self.name, retry_after)
+
+    def record(self, error: Optional[BaseException] = None) -> None:
+        """Record the outcome of an admitted call."""
+        if isinstance(error, RateLimitCancelled) or (
+            isinstance(error, DeadlineExceeded) and not error.during_request
+        ):
+            # The call gave up before reaching the service.
+            self._release_trial()
+            return
+        failed = error is not None and is_service_failure(error)
+        with self._lock:
+            state = self._current_state()
+            if state == HALF_OPEN:
+                if failed:
+                    self._open()
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self.half_open_calls:
+                        self._state = CLOSED
+                        self._outcomes.clear()
+                return
+            if state == OPEN:
+                return
+            self._outcomes.append(not failed)
+            failures = self._outcomes.count(False)
+            if (
+                len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_rate_threshold
+            ):
+                self._open()
+
+    def _release_trial(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN and self._trials:
+                self._trials -= 1
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._timer()
+        self._outcomes.clear()
+
+    def reset(self) -> None:
+        """Close the circuit and forget past outcomes."""
+        with self._lock:
+            self._state = CLOSED
+            self._outcomes.clear()
+
+    def call(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Call ``fn`` through the breaker; interrupted calls are not counted."""
+        self.allow()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self.record(e)
+            raise
+        except BaseException:
+            self._release_trial()
+            raise
+        self.record()
+        return result
+
+    async def acall(
+        self, fn: Callable[..., Awaitable[R]], *args: Any, **kwargs: Any
+    ) -> R:
+        """Await ``fn`` through the breaker; cancelled calls are not counted."""
+        self.allow()
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            self._release_trial()
+            raise
+        except Exception as e:
+            self.record(e)
+            raise
+        self.record()
+        return result
+
+
+class CircuitBreakerRegistry:
+    """One circuit breaker per service, created on first use.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.circuit_breaker import circuit_breakers
+
+            if circuit_breakers.state("crawl") == "open":
+                ...  # use SmartScraper on a few pages instead
+
+            circuit_breakers.configure("agenticscraper", open_duration=120)
+    """
+
+    def __init__(self, **defaults: Any) -> None:
+        self._defaults = defaults
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def configure(self, service: str, **settings: Any) -> CircuitBreaker:
+        """Replace the breaker of ``service`` with one built from ``settings``."""
+        breaker = CircuitBreaker(name=service, **{**self._defaults, **settings})
+        with self._lock:
+            self._breakers[service] = breaker
+        return breaker
+
+    def get(self, service: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(service)
+            if breaker is None:
+                breaker = self._breakers[service] = CircuitBreaker(
+                    name=service, **self._defaults
+                )
+            return breaker
+
+    def state(self, service: str) -> str:
+        """Current state of the circuit for ``service``."""
+        return self.get(service).state
+
+    def states(self) -> Dict[str, str]:
+        """Current state of every circuit seen so far."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {service: breaker.state for service, breaker in breakers.items()}
+
+    def reset(self) -> None:
+        """Close every circuit."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+
+circuit_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,208 @@
+"""Process-wide registry of pooled ScrapeGraph SDK clients."""
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from scrapegraph_py import AsyncClient, Client
+
+
+class ClientRegistry:
+    """Share one pooled SDK client per API key and transport settings.
+
+    Every tool built with the same API key and settings reuses the same
+    ``Client`` (and therefore the same HTTP connection pool) instead of opening
+    its own session. Clients are reference counted: each ``acquire`` is paired
+    with a ``release`` and the session is closed once the last user releases it.
+
+    Async clients are additionally keyed by event loop, because an aiohttp
+    session can only be used from the loop it was created on.
+
+    Transport settings are the keyword arguments accepted by ``Client`` and
+    ``AsyncClient`` (``verify_ssl``, ``timeout``, ``max_retries``, ``retry_delay``),
+    plus ``pool_maxsize``, the number of connections a sync client keeps per
+    host (async clients' aiohttp sessions already pool up to 100). A sync
+    client built with ``max_retries=0`` sends each request exactly once and
+    hands 5xx responses back to the SDK's error handling.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple, Client] = {}
+        self._async_clients: Dict[Tuple, AsyncClient] = {}
+        self._async_loops: Dict[int, asyncio.AbstractEventLoop] = {}
+        self._keys: Dict[int, Tuple] = {}
+        self._refcounts: Dict[int, int] = {}
+        self._closing: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def _make_key(api_key: str, settings: Dict[str, Any]) -> Tuple:
+        return (api_key, tuple(sorted(settings.items())))
+
+    def acquire(self, api_key: str, **settings: Any) -> Client:
+        """Return the shared sync client for ``api_key`` and ``settings``."""
+        key = self._make_key(api_key, settings)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = _build_client(api_key, settings)
+                self._clients[key] = client
+                self._keys[id(client)] = key
+                self._refcounts[id(client)] = 0
+            self._refcounts[id(client)] += 1
+            return client
+
+    def release(self, client: Client) -> None:
+        """Drop one reference to ``client``, closing it when none remain.
+
+        Clients that were not handed out by this registry are ignored.
+        """
+        with self._lock:
+            if not self._decref(client):
+                return
+            self._clients.pop(self._keys.pop(id(client)), None)
+        client.close()
+
+    def acquire_async(self, api_key: str, **settings: Any) -> AsyncClient:
+        """Return the shared async client for the running event loop.
+
+        Must be called from a coroutine running on that loop.
+        """
+        loop = asyncio.get_running_loop()
+        settings.pop("pool_maxsize", None)
+        key = self._make_key(api_key, settings) + (id(loop),)
+        with self._lock:
+            self._forget_closed_loops()
+            client = self._async_clients.get(key)
+            if client is None:
+                client = AsyncClient(api_key=api_key, **settings)
+                self._async_clients[key] = client
+                self._async_loops[id(client)] = loop
+                self._keys[id(client)] = key
+                self._refcounts[id(client)] = 0
+            self._refcounts[id(client)] += 1
+            return client
+
+    def release_async(self, client: AsyncClient) -> None:
+        """Drop one reference to ``client`` without waiting for it to close.
+
+        When the last reference goes away the session is closed on the loop it
+        belongs to. Use ``arelease`` to wait for the close to finish.
+        """
+        loop = self._pop_async(client)
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            task = loop.create_task(client.close())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(client.close(), loop)
+
+    async def arelease(self, client: AsyncClient) -> None:
+        """Drop one reference to ``client`` and await its close if it was the last."""
+        loop = self._pop_async(client)
+        if loop is None or loop.is_closed():
+            return
+        if loop is asyncio.get_running_loop():
+            await client.close()
+        else:
+            future = asyncio.run_coroutine_threadsafe(client.close(), loop)
+            await asyncio.wrap_future(future)
+
+    def close(self) -> None:
+        """Close every pooled sync client, regardless of outstanding references."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            for client in clients:
+                self._forget(client)
+        for client in clients:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close every pooled async client owned by the running event loop."""
+        loop = asyncio.get_running_loop()
+        clients: List[AsyncClient] = []
+        with self._lock:
+            self._forget_closed_loops()
+            for key, client in list(self._async_clients.items()):
+                if self._async_loops.get(id(client)) is loop:
+                    del self._async_clients[key]
+                    self._forget(client)
+                    clients.append(client)
+        for client in clients:
+            await client.close()
+
+    def _decref(self, client: Any) -> bool:
+        """Decrement the refcount of ``client``; True if it dropped to zero."""
+        count = self._refcounts.get(id(client))
+        if count is None:
+            return False
+        if count > 1:
+            self._refcounts[id(client)] = count - 1
+            return False
+        del self._refcounts[id(client)]
+        return True
+
+    def _pop_async(self, client: AsyncClient) -> Optional[asyncio.AbstractEventLoop]:
+        with self._lock:
+            if not self._decref(client):
+                return None
+            self._async_clients.pop(self._keys.pop(id(client)), None)
+            return self._async_loops.pop(id(client), None)
+
+    def _forget(self, client: Any) -> None:
+        self._keys.pop(id(client), None)
+        self._refcounts.pop(id(client), None)
+        self._async_loops.pop(id(client), None)
+
+    def _forget_closed_loops(self) -> None:
+        # Sessions bound to a loop that no longer exists can neither be used
+        # nor closed, so just drop them.
+        for key, client in list(self._async_clients.items()):
+            loop = self._async_loops.get(id(client))
+            if loop is None or loop.is_closed():
+                del self._async_clients[key]
+                self._forget(client)
+
+
+def _build_client(api_key: str, settings: Dict[str, Any]) -> Client:
+    settings = dict(settings)
+    pool_maxsize = settings.pop("pool_maxsize", None)
+    client = Client(api_key=api_key, **settings)
+    session = getattr(client, "session", None)
+    no_retries = settings.get("max_retries") == 0
+    if not isinstance(session, requests.Session) or not (no_retries or pool_maxsize):
+        return client
+    for prefix in ("https://", "http://"):
+        # The SDK mounts urllib3 Retry(total=0, status_forcelist=5xx), which
+        # still turns a 5xx into RetryError; plain adapters retry nothing.
+        max_retries = 0 if no_retries else session.get_adapter(prefix).max_retries
+        session.mount(
+            prefix,
+            HTTPAdapter(
+                max_retries=max_retries,
+                pool_maxsize=pool_maxsize or requests.adapters.DEFAULT_POOLSIZE,
+            ),
+        )
+    return client
+
+
+client_registry = ClientRegistry()
+
+
+def close_clients() -> None:
+    """Close every pooled sync client in the default registry."""
+    client_registry.close()
+
+
+async def aclose_clients() -> None:
+    """Close every pooled async client of the running loop in the default registry."""
+    await client_registry.aclose()
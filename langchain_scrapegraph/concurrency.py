@@ -0,0 +1,490 @@
+"""Concurrency primitives shared by the ScrapeGraph tools."""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import copy
+import itertools
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .cache import hash_value
+from .deadline import DeadlineExceeded, current_deadline
+from .metrics import metrics
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight wait for that result instead of issuing their own request. If
+    the call raises, every waiter receives the same exception. Once the call
+    finishes the key is forgotten, so later calls run again.
+
+    Sync callers (``do``) and async callers (``ado``) are tracked separately:
+    sync calls coalesce across threads, async calls across tasks of one loop.
+    A sync waiter stops waiting with ``DeadlineExceeded`` once its own
+    deadline passes.
+    Waiters other than the first receive a deep copy of the result so they
+    cannot mutate each other's data.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, concurrent.futures.Future] = {}
+        self._async_calls: Dict[Tuple[int, str], "_AsyncCall"] = {}
+
+    def do(self, key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``fn(*args, **kwargs)`` unless a call for ``key`` is in flight."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._calls[key] = future
+        if not leader:
+            current = current_deadline()
+            try:
+                result = future.result(
+                    timeout=None if current is None else current.remaining()
+                )
+            except concurrent.futures.TimeoutError:
+                raise DeadlineExceeded(
+                    "deadline exceeded waiting for a coalesced call"
+                ) from None
+            return copy.deepcopy(result)
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def ado(
+        self, key: str, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Await ``fn(*args, **kwargs)`` unless a call for ``key`` is in flight.
+
+        The shared call runs in its own task. A waiter that is cancelled stops
+        waiting without affecting the others; the shared call itself is only
+        cancelled once every waiter has gone away.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            call = self._async_calls.get(flight_key)
+            leader = call is None
+            if leader:
+                call = _AsyncCall(loop.create_task(fn(*args, **kwargs)))
+                self._async_calls[flight_key] = call
+                call.task.add_done_callback(
+                    lambda _: self._forget_async(flight_key, call)
+                )
+            call.waiters += 1
+
+        try:
+            result = await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            call.waiters -= 1
+            if call.waiters == 0:
+                call.task.cancel()
+            raise
+        call.waiters -= 1
+        return result if leader else copy.deepcopy(result)
+
+    def _forget_async(self, flight_key: Tuple[int, str], call: "_AsyncCall") -> None:
+        with self._lock:
+            if self._async_calls.get(flight_key) is call:
+                del self._async_calls[flight_key]
+
+
+class _AsyncCall:
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+request_coalescer = SingleFlight()
+
+
+def map_as_completed(
+    fn: Callable[[T], R], items: Iterable[T], max_concurrency: int
+) -> Iterator[Tuple[T, Optional[R], Optional[BaseException]]]:
+    """Run ``fn`` over ``items`` on a thread pool, yielding as calls finish.
+
+    At most ``max_concurrency`` calls are in flight and ``items`` is consumed
+    lazily, so very large inputs are never materialized. Each result is
+    yielded as ``(item, result, None)``, or ``(item, None, error)`` if the
+    call raised; one failure never stops the others. Closing the generator
+    early cancels the calls that have not started yet.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    iterator = iter(items)
+    pending: Dict[concurrent.futures.Future, T] = {}
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency)
+    # Calls see the caller's context variables, such as its deadline.
+    context = contextvars.copy_context()
+    try:
+        for item in itertools.islice(iterator, max_concurrency):
+            pending[executor.submit(context.copy().run, fn, item)] = item
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                item = pending.pop(future)
+                for refill in itertools.islice(iterator, 1):
+                    pending[executor.submit(context.copy().run, fn, refill)] = refill
+                error = future.exception()
+                yield item, None if error else future.result(), error
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def amap_as_completed(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T], max_concurrency: int
+) -> AsyncIterator[Tuple[T, Optional[R], Optional[BaseException]]]:
+    """Async counterpart of :func:`map_as_completed` running ``fn`` as tasks.
+
+    Closing the iterator early cancels the tasks still in flight.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    iterator = iter(items)
+    pending: Dict[asyncio.Task, T] = {}
+    try:
+        for item in itertools.islice(iterator, max_concurrency):
+            pending[asyncio.ensure_future(fn(item))] = item
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = pending.pop(task)
+                for refill in itertools.islice(iterator, 1):
+                    pending[asyncio.ensure_future(fn(refill))] = refill
+                if task.cancelled():
+                    error: Optional[BaseException] = asyncio.CancelledError()
+                else:
+                    error = task.exception()
+                yield item, None if error else task.result(), error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether ``error`` signals that the API is overloaded.
+
+    That is a 429 or 5xx ``APIError`` from the SDK, or a timeout. A
+    ``DeadlineExceeded`` only counts if the deadline passed while waiting on
+    the API; otherwise the caller ran out of time before reaching it.
+    """
+    if isinstance(error, DeadlineExceeded):
+        return error.during_request
+    status_code = getattr(error, "status_code", None)
+    if status_code is not None:
+        return status_code == 429 or status_code >= 500
+    return isinstance(error, (TimeoutError, asyncio.TimeoutError))
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limit in-flight calls with a window that adapts to the API's health.
+
+    The window follows AIMD (additive increase, multiplicative decrease).
+    Once a full window of calls has completed, their latency percentile is
+    compared with a slowly moving baseline: if it stays within
+    ``latency_tolerance`` times the baseline, the window grows by
+    ``increase``; otherwise it shrinks by ``backoff``. Any overload error (see
+    :func:`is_overload_error`) also shrinks it, once per burst: calls that
+    started before the last decrease are not counted again.
+
+    Callers queue in arrival order when the window is full, from threads
+    (``acquire``) or event loops (``aacquire``) alike. The current window is
+    published as the ``"<name>.concurrency_limit"`` gauge in
+    ``langchain_scrapegraph.metrics``.
+
+    Args:
+        initial_limit: Window to start with.
+        min_limit: The window never shrinks below this.
+        max_limit: The window never grows above this.
+        increase: Slots added after a healthy window of calls.
+        backoff: Factor applied to the window on overload.
+        latency_tolerance: Allowed ratio between a window's latency
+            percentile and the baseline before it counts as a spike.
+        percentile: Latency percentile to watch (0-100).
+        min_samples: Minimum calls per evaluation window.
+        name: Prefix of the published gauge; ``None`` publishes nothing.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        percentile: float = 95.0,
+        min_samples: int = 10,
+        name: Optional[str] = None,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.name = name
+        self._lock = threading.Lock()
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._samples: List[float] = []
+        self._baseline: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._publish()
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a slot is free; False if ``timeout`` expires first."""
+        with self._lock:
+            if not self._waiters and self._in_flight < self.limit:
+                self._in_flight += 1
+                return True
+            waiter = _Waiter(event=threading.Event())
+            self._waiters.append(waiter)
+        if waiter.event.wait(timeout):
+            return True
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            return False
+
+    async def aacquire(self) -> None:
+        """Wait for a slot without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self._in_flight < self.limit:
+                self._in_flight += 1
+                return
+            waiter = _Waiter(loop=loop, future=loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._in_flight -= 1
+                    self._grant()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: float, error: Optional[BaseException] = None) -> None:
+        """Free a slot and feed the call's outcome into the window."""
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight -= 1
+            if error is not None:
+                if is_overload_error(error) and now - latency >= self._last_decrease:
+                    self._decrease(now)
+            else:
+                self._samples.append(latency)
+                if len(self._samples) >= max(self.min_samples, self.limit):
+                    self._evaluate(now)
+            self._grant()
+
+    def call(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Run ``fn`` inside a slot, recording its latency and outcome.
+
+        Waiting for the slot is bounded by the current ``deadline``, if any.
+        """
+        current = current_deadline()
+        if not self.acquire(None if current is None else current.remaining()):
+            raise DeadlineExceeded("deadline exceeded waiting for a concurrency slot")
+        started = time.monotonic()
+        error = None
+        try:
+            return fn(*args, **kwargs)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.release(time.monotonic() - started, error)
+
+    async def acall(
+        self, fn: Callable[..., Awaitable[R]], *args: Any, **kwargs: Any
+    ) -> R:
+        """Await ``fn`` inside a slot, recording its latency and outcome."""
+        await self.aacquire()
+        started = time.monotonic()
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            # A cancelled call says nothing about the API's health.
+            with self._lock:
+                self._in_flight -= 1
+                self._grant()
+            raise
+        except BaseException as e:
+            self.release(time.monotonic() - started, e)
+            raise
+        self.release(time.monotonic() - started)
+        return result
+
+    def _evaluate(self, now: float) -> None:
+        samples = sorted(self._samples)
+        self._samples.clear()
+        observed = samples[
+            min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+        ]
+        if (
+            self._baseline is not None
+            and observed > self._baseline * self.latency_tolerance
+        ):
+            self._decrease(now)
+            return
+        self._baseline = (
+            observed
+            if self._baseline is None
+            else 0.9 * self._baseline + 0.1 * observed
+        )
+        self._limit = min(self.max_limit, self._limit + self.increase)
+        self._publish()
+
+    def _decrease(self, now: float) -> None:
+        self._limit = max(self.min_limit, self._limit * self.backoff)
+        self._last_decrease = now
+        self._samples.clear()
+        self._publish()
+
+    def _grant(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            self._in_flight += 1
+            if waiter.event is not None:
+                waiter.event.set()
+                continue
+            try:
+                waiter.loop.call_soon_threadsafe(_resolve, waiter.future)
+            except RuntimeError:
+                # The waiter's loop is closed; nobody is left to use the slot.
+                self._in_flight -= 1
+
+    def _publish(self) -> None:
+        if self.name is not None:
+            metrics.set_gauge(f"{self.name}.concurrency_limit", self.limit)
+
+
+class _Waiter:
+    def __init__(
+        self,
+        event: Optional[threading.Event] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        future: Optional[asyncio.Future] = None,
+    ) -> None:
+        self.event = event
+        self.loop = loop
+        self.future = future
+        self.granted = False
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveConcurrencyRegistry:
+    """Adaptive limiters keyed by API key and, optionally, service.
+
+    Calls use the limiter configured for their service if there is one, and
+    otherwise the key-wide limiter. Keys without a limiter are not limited.
+    Unless given a ``name``, a limiter publishes its gauge as
+    ``"<service or default>.<key fingerprint>"``, where the fingerprint is
+    the first 8 hex digits of the key's SHA-256, so limiters of different
+    keys never overwrite each other's gauge.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.concurrency import adaptive_concurrency
+            from langchain_scrapegraph.metrics import metrics
+
+            limiter = adaptive_concurrency.configure(
+                "your-api-key", service="markdownify", initial_limit=8
+            )
+            ...
+            metrics.gauge(f"{limiter.name}.concurrency_limit")
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._limiters: Dict[Tuple[str, Optional[str]], AdaptiveConcurrencyLimiter] = {}
+
+    def configure(
+        self, api_key: str, service: Optional[str] = None, **settings: Any
+    ) -> AdaptiveConcurrencyLimiter:
+        """Install a limiter built from ``settings`` for ``api_key``/``service``."""
+        settings.setdefault("name", f"{service or 'default'}.{hash_value(api_key)[:8]}")
+        limiter = AdaptiveConcurrencyLimiter(**settings)
+        with self._lock:
+            self._limiters[(api_key, service)] = limiter
+        return limiter
+
+    def get(
+        self, api_key: str, service: Optional[str] = None
+    ) -> Optional[AdaptiveConcurrencyLimiter]:
+        with self._lock:
+            return self._limiters.get((api_key, service)) or self._limiters.get(
+                (api_key, None)
+            )
+
+    def remove(self, api_key: str, service: Optional[str] = None) -> None:
+        with self._lock:
+            self._limiters.pop((api_key, service), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._limiters.clear()
+
+
+adaptive_concurrency = AdaptiveConcurrencyRegistry()
@@ -0,0 +1,261 @@
+"""Cron expressions evaluated locally: validation, next fire times, hotspots."""
+
+import calendar
+import functools
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+_MONTHS = "jan feb mar apr may jun jul aug sep oct nov dec".split()
+_DAYS = "sun mon tue wed thu fri sat".split()
+# name, lowest value, highest value, value of each name
+_FIELDS: Tuple[Tuple[str, int, int, Dict[str, int]], ...] = (
+    ("minute", 0, 59, {}),
+    ("hour", 0, 23, {}),
+    ("day of month", 1, 31, {}),
+    ("month", 1, 12, {name: i for i, name in enumerate(_MONTHS, 1)}),
+    ("day of week", 0, 7, {name: i for i, name in enumerate(_DAYS)}),
+)
+_DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _next_bit(mask: int, start: int) -> Optional[int]:
+    """Lowest set bit of ``mask`` at or above ``start``."""
+    rest = mask >> start
+    if not rest:
+        return None
+    return start + (rest & -rest).bit_length() - 1
+
+
+def _value(token: str, name: str, low: int, high: int, names: Dict[str, int]) -> int:
+    value = names.get(token.lower())
+    if value is None:
+        if not token.isdigit():
+            raise ValueError(f"Invalid {name} {token!r}")
+        value = int(token)
+    if not low <= value <= high:
+        raise ValueError(f"{name.capitalize()} {value} is not within {low}-{high}")
+    return value
+
+
+def _parse_field(
+    text: str, name: str, low: int, high: int, names: Dict[str, int]
+) -> int:
+    """Bitset of the values one cron field matches."""
+    mask = 0
+    for part in text.split(","):
+        spec, _, step_text = part.partition("/")
+        step = 1
+        if step_text:
+            if not step_text.isdigit() or int(step_text) < 1:
+                raise ValueError(f"Invalid step {step_text!r} in {name} {text!r}")
+            step = int(step_text)
+        if spec in ("*", "?"):
+            start, end = low, high
+        elif "-" in spec:
+            first, _, last = spec.partition("-")
+            start = _value(first, name, low, high, names)
+            end = _value(last, name, low, high, names)
+            if start > end:
+                raise ValueError(f"Invalid range {spec!r} in {name} {text!r}")
+        else:
+            start = _value(spec, name, low, high, names)
+            end = high if step_text else start
+        for value in range(start, end + 1, step):
+            mask |= 1 << value
+    return mask
+
+
+class CronExpression:
+    """A standard five-field cron expression, parsed into bitsets.
+
+    Fields are minute, hour, day of month, month and day of week, each made
+    of comma-separated values, ``a-b`` ranges, ``*`` (or ``?``) and ``/n``
+    steps; months and days of week also take three-letter names, and 7 is
+    Sunday like 0. The ``@hourly``, ``@daily``, ``@weekly``, ``@monthly``
+    and ``@yearly`` macros are accepted. As in Vixie cron, when both day
+    fields are restricted a day matches if either does; a field starting
+    with ``*``, such as ``*/2``, is unrestricted and a day must then match
+    both.
+
+    Each field is held as an integer bitset, so finding the next fire time
+    jumps straight to the next matching month, day, hour and minute instead
+    of stepping through time. Times are wall-clock times in the time zone of
+    the datetime passed in (UTC by default).
+
+    Args:
+        expression: The cron expression.
+
+    Raises:
+        ValueError: If the expression is malformed or can never fire.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.cron import CronExpression
+
+            CronExpression("*/15 9-17 * * mon-fri").next_times(3)
+    """
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        text = MACROS.get(expression.strip().lower(), expression)
+        fields = text.split()
+        if len(fields) != 5:
+            raise ValueError(
+                f"Cron expression {expression!r} must have 5 fields, not {len(fields)}"
+            )
+        masks = [_parse_field(field, *spec) for field, spec in zip(fields, _FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = masks
+        # Sunday is both 0 and 7.
+        self.weekdays = (weekdays | weekdays >> 7) & 0x7F
+        # A day field starting with "*", even "*/2", leaves the day
+        # unrestricted, so the two day fields then both apply.
+        self.any_day = fields[2].startswith(("*", "?"))
+        self.any_weekday = fields[4].startswith(("*", "?"))
+        first_day = _next_bit(self.days, 1) or 32
+        if self.any_weekday and not any(
+            first_day <= _DAYS_IN_MONTH[month - 1]
+            for month in range(1, 13)
+            if self.months >> month & 1
+        ):
+            raise ValueError(f"Cron expression {expression!r} never fires")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.expression!r})"
+
+    def _day_mask(self, year: int, month: int) -> int:
+        return _day_mask(
+            self.days,
+            self.weekdays,
+            self.any_day,
+            self.any_weekday,
+            year,
+            month,
+        )
+
+    def matches(self, when: datetime) -> bool:
+        """Whether the expression fires in the minute of ``when``."""
+        return bool(
+            self.minutes >> when.minute & 1
+            and self.hours >> when.hour & 1
+            and self.months >> when.month & 1
+            and self._day_mask(when.year, when.month) >> when.day & 1
+        )
+
+    def times(self, after: Optional[datetime] = None) -> Iterator[datetime]:
+        """Yield the fire times strictly after ``after`` (default: now, UTC)."""
+        if after is None:
+            after = datetime.now(timezone.utc)
+        tzinfo = after.tzinfo
+        start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        year, month, day = start.year, start.month, start.day
+        hour, minute = start.hour, start.minute
+        while True:
+            found = _next_bit(self.months, month)
+            if found is None:
+                year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+                continue
+            if found != month:
+                month, day, hour, minute = found, 1, 0, 0
+            found = _next_bit(self._day_mask(year, month), day)
+            if found is None:
+                month, day, hour, minute = month + 1, 1, 0, 0
+                continue
+            if found != day:
+                day, hour, minute = found, 0, 0
+            found = _next_bit(self.hours, hour)
+            if found is None:
+                day, hour, minute = day + 1, 0, 0
+                continue
+            if found != hour:
+                hour, minute = found, 0
+            found = _next_bit(self.minutes, minute)
+            if found is None:
+                hour, minute = hour + 1, 0
+                continue
+            yield datetime(year, month, day, hour, found, tzinfo=tzinfo)
+            minute = found + 1
+
+    def next_times(
+        self, count: int, after: Optional[datetime] = None
+    ) -> List[datetime]:
+        """The next ``count`` fire times after ``after`` (default: now, UTC)."""
+        times = self.times(after)
+        return [next(times) for _ in range(count)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _day_mask(
+    days: int, weekdays: int, any_day: bool, any_weekday: bool, year: int, month: int
+) -> int:
+    """Bitset of the days of ``month`` that match both day fields."""
+    length = calendar.monthrange(year, month)[1]
+    valid = ((1 << length) - 1) << 1
+    # Cron counts weekdays from Sunday, Python from Monday.
+    first = (calendar.weekday(year, month, 1) + 1) % 7
+    by_weekday = 0
+    for day in range(1, length + 1):
+        if weekdays >> (first + day - 1) % 7 & 1:
+            by_weekday |= 1 << day
+    if any_day or any_weekday:
+        return days & by_weekday & valid
+    return (days | by_weekday) & valid
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_cron(expression: str) -> CronExpression:
+    """Parse ``expression``, reusing earlier results; see ``CronExpression``."""
+    return CronExpression(expression)
+
+
+def validate_cron(expression: str) -> str:
+    """Return ``expression`` unchanged, raising ``ValueError`` if invalid."""
+    parse_cron(expression)
+    return expression
+
+
+def find_hotspots(
+    schedules: Mapping[str, str],
+    threshold: int = 2,
+    start: Optional[datetime] = None,
+    horizon: timedelta = timedelta(days=1),
+) -> List[Dict[str, object]]:
+    """Find the minutes in which many jobs fire together.
+
+    Args:
+        schedules: Cron expression per job name, e.g.
+            ``{job["job_name"]: job["cron_expression"] for job in jobs}``.
+        threshold: Jobs firing in the same minute that make it a hotspot.
+        start: Start of the period examined; defaults to now, UTC.
+        horizon: Length of the period examined.
+
+    Returns:
+        list: ``{"time", "count", "jobs"}`` per hotspot minute, busiest
+        first, where ``jobs`` are the names of the jobs firing then.
+    """
+    if start is None:
+        start = datetime.now(timezone.utc)
+    end = start + horizon
+    firing: Dict[datetime, List[str]] = defaultdict(list)
+    for name, expression in schedules.items():
+        for when in parse_cron(expression).times(start - timedelta(minutes=1)):
+            if when >= end:
+                break
+            firing[when].append(name)
+    hotspots = [
+        {"time": when, "count": len(names), "jobs": sorted(names)}
+        for when, names in firing.items()
+        if len(names) >= threshold
+    ]
+    hotspots.sort(key=lambda spot: (-spot["count"], spot["time"]))
+    return hotspots
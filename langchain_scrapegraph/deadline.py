@@ -0,0 +1,136 @@
+"""Deadlines that bound a tool call end to end, down to the HTTP transport."""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call runs past its deadline.
+
+    ``during_request`` is True when the deadline passed while a request was
+    waiting on the API, which points at a slow service; otherwise the call
+    ran out of time before reaching it.
+    """
+
+    def __init__(self, *args: Any, during_request: bool = False) -> None:
+        super().__init__(*args)
+        self.during_request = during_request
+
+
+class Deadline:
+    """A point in time by which a call must have finished.
+
+    Args:
+        timeout: Seconds from now until the deadline.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self.expires_at = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        """Raise ``DeadlineExceeded`` if the deadline has passed."""
+        if self.expired:
+            raise DeadlineExceeded("deadline exceeded")
+
+
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "scrapegraph_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline governing the current context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def deadline(timeout: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """Bound every ScrapeGraph call made inside the block to ``timeout`` seconds.
+
+    Deadlines nest: an inner block can only shorten the time available.
+    ``None`` leaves the current deadline unchanged. The deadline follows the
+    context into tasks started inside the block.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.deadline import deadline
+
+            with deadline(10):
+                tool.invoke({"website_url": "https://example.com"})
+    """
+    outer = _current.get()
+    if timeout is None:
+        yield outer
+        return
+    inner = Deadline(timeout)
+    if outer is not None and outer.expires_at <= inner.expires_at:
+        inner = outer
+    token = _current.set(inner)
+    try:
+        yield inner
+    finally:
+        _current.reset(token)
+
+
+class DeadlineAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that shortens each request's timeout to the deadline.
+
+    The connect and read timeouts are clamped to the time remaining, so a
+    blocking request returns once the deadline passes instead of running on
+    in the background. A request that times out that way raises
+    ``DeadlineExceeded``.
+    """
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> Any:
+        current = _current.get()
+        if current is None:
+            return super().send(request, **kwargs)
+        current.check()
+        remaining = current.remaining()
+        timeout = kwargs.get("timeout")
+        if isinstance(timeout, tuple):
+            timeout = tuple(
+                remaining if t is None else min(t, remaining) for t in timeout
+            )
+        elif timeout is None or timeout > remaining:
+            timeout = remaining
+        kwargs["timeout"] = timeout
+        try:
+            return super().send(request, **kwargs)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            if current.expired:
+                raise DeadlineExceeded(
+                    "deadline exceeded during request", during_request=True
+                ) from e
+            raise
+
+
+def enforce_deadlines(client: Any) -> None:
+    """Mount ``DeadlineAdapter`` on a sync client's session, once.
+
+    The adapter keeps the client's own retry configuration. Clients without
+    a ``requests`` session are left untouched.
+    """
+    session = getattr(client, "session", None)
+    if not isinstance(session, requests.Session):
+        return
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(prefix)
+        if isinstance(adapter, DeadlineAdapter):
+            continue
+        max_retries = getattr(adapter, "max_retries", 0)
+        session.mount(prefix, DeadlineAdapter(max_retries=max_retries))
@@ -0,0 +1,112 @@
+"""Pre-flight estimates of the credits and time a batch of tool calls needs."""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+from .concurrency import adaptive_concurrency
+from .ledger import credit_ledger
+from .metrics import metrics
+from .ratelimit import rate_limiter
+
+
+def _latency(service: str, default: float) -> Tuple[float, float, str]:
+    """p50 and p95 latency of one call to ``service``, and their source."""
+    for name in ("job_latency", "latency"):
+        p50 = metrics.percentile(f"{service}.{name}", 50)
+        if p50 is not None:
+            return p50, metrics.percentile(f"{service}.{name}", 95), name
+    return default, default, "default"
+
+
+def estimate_batch(
+    calls: Iterable[Tuple[Any, Mapping[str, Any]]],
+    max_concurrency: int = 8,
+    default_latency: float = 10.0,
+) -> Dict[str, Any]:
+    """Project the credits and wall time of a batch of planned tool calls.
+
+    Credits follow the documented per-call costs used by ``credit_ledger``.
+    Durations come from the latencies recorded locally for each service:
+    the time from submission to completion for background jobs (crawls,
+    agentic sessions) when known, else the latency of a single call, else
+    ``default_latency``. The wall time is the largest of these lower bounds:
+
+    - the total work spread over ``max_concurrency`` lanes, or fewer where
+      an adaptive concurrency limit is configured for a service;
+    - the slowest single call;
+    - the calls each configured rate limit lets through per second.
+
+    Estimates are rough by nature: undocumented costs (e.g. heavy JS
+    rendering) are not counted, and latencies reflect recent traffic only.
+
+    Args:
+        calls: ``(tool, input)`` pairs, where ``input`` is what would be
+            passed to ``tool.invoke``.
+        max_concurrency: Calls the batch runs at a time.
+        default_latency: Seconds assumed per call for services without
+            recorded latencies.
+
+    Returns:
+        dict: ``{"calls", "credits", "duration", "duration_p95", "services"}``
+        where ``duration`` uses median latencies and ``duration_p95`` the 95th
+        percentile; ``services`` breaks the batch down per service.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.estimate import estimate_batch
+
+            plan = [(search, {"user_prompt": q}) for q in questions]
+            plan += [(crawler, {"prompt": p, "url": u, "max_pages": 20}) for p, u in sites]
+            estimate = estimate_batch(plan, max_concurrency=16)
+            if estimate["credits"] > budget:
+                ...
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    services: Dict[str, Dict[str, Any]] = {}
+    bucket_calls: Dict[int, List[Any]] = defaultdict(lambda: [None, 0])
+    total = 0
+    for tool, params in calls:
+        service = tool.service
+        stats = services.get(service)
+        if stats is None:
+            p50, p95, source = _latency(service, default_latency)
+            limiter = adaptive_concurrency.get(tool.api_key, service)
+            stats = services[service] = {
+                "calls": 0,
+                "credits": 0,
+                "latency_p50": p50,
+                "latency_p95": p95,
+                "latency_source": source,
+                "concurrency": min(
+                    max_concurrency,
+                    max_concurrency if limiter is None else limiter.limit,
+                ),
+            }
+        stats["calls"] += 1
+        stats["credits"] += credit_ledger.estimate(service, params)
+        for bucket in rate_limiter.buckets(tool.api_key, service):
+            entry = bucket_calls[id(bucket)]
+            entry[0] = bucket
+            entry[1] += 1
+        total += 1
+
+    def duration(key: str) -> float:
+        work = sum(s["calls"] * s[key] for s in services.values())
+        bounds = [work / max_concurrency]
+        bounds += [s[key] for s in services.values()]
+        bounds += [s["calls"] * s[key] / s["concurrency"] for s in services.values()]
+        bounds += [
+            max(0.0, count - bucket.capacity) / bucket.rate
+            for bucket, count in bucket_calls.values()
+        ]
+        return max(bounds, default=0.0)
+
+    return {
+        "calls": total,
+        "credits": sum(s["credits"] for s in services.values()),
+        "duration": duration("latency_p50"),
+        "duration_p95": duration("latency_p95"),
+        "services": services,
+    }
@@ -0,0 +1,292 @@
+"""Incremental sync of scheduled-job execution history into async queues."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from contextlib import aclosing
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from .concurrency import amap_as_completed
+from .pagination import MAX_PAGE_SIZE, aiter_pages, last_page, page_items
+from .polling import FAILURE_STATUSES, SUCCESS_STATUSES
+from .tools.scheduled_jobs import GetJobExecutionsTool
+
+FINISHED_STATUSES = SUCCESS_STATUSES | FAILURE_STATUSES | {"skipped"}
+
+
+def _timestamp(value: Any) -> datetime:
+    """Parse an ISO 8601 timestamp as an aware datetime; naive ones are UTC."""
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _newest_first(stamps: List[datetime]) -> bool:
+    return all(a >= b for a, b in zip(stamps, stamps[1:]))
+
+
+def _finished(execution: dict) -> bool:
+    return str(execution.get("status", "")).lower() in FINISHED_STATUSES
+
+
+class CursorStore:
+    """High-water marks of the execution history synced per job, in SQLite.
+
+    A cursor holds the ``started_at`` of the newest execution seen, the ids
+    of the executions started at that time, and the executions seen while
+    still unfinished (``open``), which are checked again on later syncs.
+
+    Args:
+        path: Database file; ``":memory:"`` keeps the cursors in memory.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cursors ("
+            " job_id TEXT PRIMARY KEY, started_at TEXT, ids TEXT NOT NULL,"
+            " open TEXT NOT NULL)"
+        )
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        """The cursor of ``job_id``; ``started_at`` is ``None`` if never synced."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT started_at, ids, open FROM cursors WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return {"started_at": None, "ids": [], "open": {}}
+        return {
+            "started_at": row[0],
+            "ids": json.loads(row[1]),
+            "open": json.loads(row[2]),
+        }
+
+    def set(self, job_id: str, cursor: Dict[str, Any]) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cursors (job_id, started_at, ids, open)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    job_id,
+                    cursor["started_at"],
+                    json.dumps(cursor["ids"]),
+                    json.dumps(cursor["open"]),
+                ),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM cursors")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class ExecutionSync:
+    """Fetches only the executions of scheduled jobs not seen before.
+
+    Each sync pages through a job's history and, while the pages come
+    newest first, stops as soon as it reaches executions older than the
+    job's cursor in ``store``, so a job without new runs costs one request.
+    The API does not promise that order, so once a page is not newest first
+    every page is read. Jobs are synced concurrently,
+    at most ``max_concurrency`` at a time, through the tool's rate limit,
+    retries and circuit breaker.
+
+    Every new execution is published as ``{"job_id", "event": "new",
+    "execution"}`` to the queue of each subscriber, oldest first. Executions
+    first seen unfinished are checked again until they finish, and published
+    once more with ``"event": "updated"`` when their status changes. A
+    cursor only advances after its executions have been published, so
+    delivery is at least once.
+
+    Args:
+        tool: Tool whose client and resilience settings the calls use;
+            defaults to ``GetJobExecutionsTool(api_key=api_key)``.
+        api_key: API key for the default tool.
+        store: Where the cursors are kept; defaults to an in-memory store.
+        page_size: Executions fetched per request.
+        max_concurrency: Jobs synced at a time.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.execution_sync import (
+                CursorStore,
+                ExecutionSync,
+            )
+
+            sync = ExecutionSync(store=CursorStore("cursors.db"))
+            queue = sync.subscribe()
+            asyncio.create_task(sync.run(interval=60))
+            while True:
+                event = await queue.get()
+                dashboard.update(event["job_id"], event["execution"])
+    """
+
+    def __init__(
+        self,
+        tool: Optional[GetJobExecutionsTool] = None,
+        api_key: Optional[str] = None,
+        store: Optional[CursorStore] = None,
+        page_size: int = 20,
+        max_concurrency: int = 8,
+    ) -> None:
+        self.tool = tool or GetJobExecutionsTool(api_key=api_key)
+        self.store = store or CursorStore()
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self._subscribers: List[asyncio.Queue] = []
+
+    def subscribe(self, maxsize: int = 0) -> asyncio.Queue:
+        """Return a new queue receiving every event from now on.
+
+        A full queue holds the sync back until its consumer catches up.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    async def _job_ids(self) -> List[str]:
+        async def fetch(page: int) -> Any:
+            return await self.tool._acall(
+                "get_scheduled_jobs", page=page, page_size=MAX_PAGE_SIZE
+            )
+
+        return [
+            str(job["id"]) async for job in aiter_pages(fetch, "jobs", MAX_PAGE_SIZE)
+        ]
+
+    async def _history(
+        self, job_id: str
+    ) -> AsyncIterator[Tuple[Dict[str, Any], datetime, bool]]:
+        """Executions of ``job_id`` with their start time, page by page.
+
+        The flag is whether every page so far listed executions newest first.
+        """
+        page, ordered, last_stamp = 1, True, []
+        while True:
+            response = await self.tool._acall(
+                "get_job_executions",
+                job_id=job_id,
+                page=page,
+                page_size=self.page_size,
+            )
+            executions = page_items(response, "executions")
+            stamps = [_timestamp(execution["started_at"]) for execution in executions]
+            ordered = ordered and _newest_first(last_stamp + stamps)
+            last_stamp = stamps[-1:] or last_stamp
+            for execution, started in zip(executions, stamps):
+                yield execution, started, ordered
+            last = last_page(response, self.page_size)
+            if len(executions) < self.page_size or (last is not None and page >= last):
+                return
+            page += 1
+
+    async def _fetch(self, job_id: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """New events of ``job_id`` and its next cursor."""
+        cursor = self.store.get(job_id)
+        mark = (
+            None if cursor["started_at"] is None else _timestamp(cursor["started_at"])
+        )
+        mark_ids: Set[str] = set(cursor["ids"])
+        still_open: Dict[str, Dict[str, Any]] = cursor["open"]
+        floors = [_timestamp(o["started_at"]) for o in still_open.values()]
+        floor = min(floors + [mark]) if mark is not None else None
+        events: List[Dict[str, Any]] = []
+        seen: Dict[str, Dict[str, Any]] = {}
+        newest, newest_ids = mark, set(mark_ids)
+        ordered = True
+        history = self._history(job_id)
+        async with aclosing(history):
+            async for execution, started, ordered in history:
+                execution_id = str(execution["id"])
+                if floor is not None and started < floor:
+                    if ordered:
+                        break
+                    continue
+                known = mark is not None and (
+                    started < mark or (started == mark and execution_id in mark_ids)
+                )
+                previous = still_open.get(execution_id)
+                if not known:
+                    events.append(_event(job_id, "new", execution))
+                elif previous and previous["status"] != execution.get("status"):
+                    events.append(_event(job_id, "updated", execution))
+                seen[execution_id] = execution
+                if newest is None or started > newest:
+                    newest, newest_ids = started, {execution_id}
+                elif started == newest:
+                    newest_ids.add(execution_id)
+                if known and not still_open and ordered:
+                    break
+        next_open = {
+            execution_id: {
+                "status": execution.get("status"),
+                "started_at": execution["started_at"],
+            }
+            for execution_id, execution in seen.items()
+            if not _finished(execution)
+        }
+        next_cursor = {
+            "started_at": None if newest is None else newest.isoformat(),
+            "ids": sorted(newest_ids),
+            "open": next_open,
+        }
+        if ordered:
+            events.reverse()
+        else:
+            events.sort(key=lambda event: _timestamp(event["execution"]["started_at"]))
+        return events, next_cursor
+
+    async def sync(self, job_ids: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Sync the history of ``job_ids`` (default: every job) once.
+
+        Returns:
+            dict: ``{"jobs", "events", "errors"}``: jobs synced, events
+            published and the error message per job that failed.
+        """
+        if job_ids is None:
+            job_ids = await self._job_ids()
+        summary: Dict[str, Any] = {"jobs": 0, "events": 0, "errors": {}}
+        results = amap_as_completed(self._fetch, job_ids, self.max_concurrency)
+        async with aclosing(results):
+            async for job_id, result, error in results:
+                summary["jobs"] += 1
+                if error is not None:
+                    summary["errors"][job_id] = str(error) or type(error).__name__
+                    continue
+                events, cursor = result
+                for event in events:
+                    for queue in list(self._subscribers):
+                        await queue.put(event)
+                self.store.set(job_id, cursor)
+                summary["events"] += len(events)
+        return summary
+
+    async def run(
+        self, interval: float = 60.0, job_ids: Optional[Iterable[str]] = None
+    ) -> None:
+        """Sync every ``interval`` seconds until cancelled."""
+        if job_ids is not None:
+            job_ids = list(job_ids)
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await self.sync(job_ids)
+            await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
+
+
+def _event(job_id: str, event: str, execution: dict) -> Dict[str, Any]:
+    return {"job_id": job_id, "event": event, "execution": execution}
@@ -0,0 +1,201 @@
+"""Hedged requests: race a duplicate call against a slow one."""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+from typing import Any, Awaitable, Callable, Optional, Set, TypeVar
+
+from .deadline import DeadlineExceeded, current_deadline
+from .metrics import LatencyHistogram
+from .retry import RetryBudget
+
+R = TypeVar("R")
+
+_MAX_WORKERS = 32
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+# One slot per pool worker; a call only goes to the pool when it can take a
+# slot, so hedged calls never queue behind each other.
+_workers = threading.BoundedSemaphore(_MAX_WORKERS)
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_MAX_WORKERS, thread_name_prefix="scrapegraph-hedge"
+                )
+    return _executor
+
+
+def _submit(
+    context: contextvars.Context, fn: Callable[..., R], *args: Any, **kwargs: Any
+) -> "concurrent.futures.Future[R]":
+    """Run ``fn`` on the worker slot the caller took from ``_workers``."""
+    future = _get_executor().submit(context.run, fn, *args, **kwargs)
+    # Done callbacks also fire for futures cancelled before they ran.
+    future.add_done_callback(lambda _: _workers.release())
+    return future
+
+
+def _remaining() -> Optional[float]:
+    current = current_deadline()
+    return None if current is None else current.remaining()
+
+
+def _first_success(
+    done: Set["concurrent.futures.Future[R]"],
+    pending: Set["concurrent.futures.Future[R]"],
+) -> R:
+    """Return the first copy to succeed, or raise the first error if all fail."""
+    error: Optional[BaseException] = None
+    while True:
+        for future in done:
+            if future.exception() is None:
+                for loser in pending:
+                    loser.cancel()
+                return future.result()
+            error = error or future.exception()
+        if not pending:
+            raise error
+        done, pending = concurrent.futures.wait(
+            pending,
+            timeout=_remaining(),
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        if not done:
+            raise DeadlineExceeded("deadline exceeded", during_request=True)
+
+
+class HedgingPolicy:
+    """Send a second, identical request when the first one is slow.
+
+    If a call has not finished after the ``percentile`` of the latencies
+    recently observed for it, one duplicate is sent and the first successful
+    answer wins. If one copy fails, the other is still awaited. On the async
+    path the losing request is cancelled; on the sync path it cannot be
+    interrupted, so its result is discarded when it arrives.
+
+    Hedges are capped at ``max_ratio`` of calls (over a sliding window), and
+    no hedging happens until the histogram holds ``min_samples`` timings.
+
+    Args:
+        percentile: Latency percentile (0-100) after which to hedge.
+        max_ratio: Maximum fraction of calls that may be hedged.
+        min_samples: Timings required before hedging starts.
+        min_delay: Never hedge sooner than this many seconds.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.hedging import HedgingPolicy
+            from langchain_scrapegraph.tools import SmartScraperTool
+
+            tool = SmartScraperTool(hedging=HedgingPolicy(percentile=90))
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        max_ratio: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+    ) -> None:
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.hedged = 0
+        self._budget = RetryBudget(ratio=max_ratio, min_retries=0, window=60.0)
+
+    def hedge_delay(self, histogram: LatencyHistogram) -> Optional[float]:
+        """Seconds to wait before hedging, or ``None`` if there is no data yet."""
+        if histogram.count < self.min_samples:
+            return None
+        return max(self.min_delay, histogram.percentile(self.percentile))
+
+    def _may_hedge(self) -> bool:
+        if self._budget.try_spend():
+            self.hedged += 1
+            return True
+        return False
+
+    def call(
+        self,
+        histogram: LatencyHistogram,
+        fn: Callable[..., R],
+        *args: Any,
+        **kwargs: Any,
+    ) -> R:
+        """Call ``fn``, hedging it on a worker thread if it runs long.
+
+        Both copies run on a shared pool of worker threads; the hedge delay
+        is counted from when the first copy starts running, not from when it
+        was queued. When no worker is free, ``fn`` runs on the calling
+        thread without a hedge, and waits never outlast the current deadline.
+        """
+        self._budget.record_request()
+        delay = self.hedge_delay(histogram)
+        if delay is None:
+            return fn(*args, **kwargs)
+        context = contextvars.copy_context()
+        started = threading.Event()
+
+        def primary() -> R:
+            started.set()
+            return fn(*args, **kwargs)
+
+        if not _workers.acquire(blocking=False):
+            return fn(*args, **kwargs)
+        first = _submit(context.copy(), primary)
+        pending = {first}
+        # Time spent queued for a worker is not the API being slow, so the
+        # hedge delay only runs from the moment the primary starts.
+        if not started.wait(_remaining()):
+            first.cancel()
+            raise DeadlineExceeded("deadline exceeded waiting for a worker")
+        remaining = _remaining()
+        done, pending = concurrent.futures.wait(
+            pending, timeout=delay if remaining is None else min(delay, remaining)
+        )
+        if not done and _workers.acquire(blocking=False):
+            if self._may_hedge():
+                pending.add(_submit(context.copy(), fn, *args, **kwargs))
+            else:
+                _workers.release()
+        return _first_success(done, pending)
+
+    async def acall(
+        self,
+        histogram: LatencyHistogram,
+        fn: Callable[..., Awaitable[R]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> R:
+        """Await ``fn``, racing a duplicate against it if it runs long."""
+        self._budget.record_request()
+        delay = self.hedge_delay(histogram)
+        if delay is None:
+            return await fn(*args, **kwargs)
+        pending = {asyncio.ensure_future(fn(*args, **kwargs))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done and self._may_hedge():
+                pending.add(asyncio.ensure_future(fn(*args, **kwargs)))
+            error: Optional[BaseException] = None
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = error or task.exception()
+                if not pending:
+                    raise error
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in pending:
+                task.cancel()
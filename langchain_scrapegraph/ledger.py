@@ -0,0 +1,167 @@
+"""Local credit accounting that spares round trips to the credits endpoint."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from .metrics import metrics
+
+# Credits per call, or per page for the services listed in PER_PAGE. Calls
+# to other methods (status polls, scheduled jobs, credits) are free.
+CREDIT_COSTS: Dict[str, float] = {
+    "smartscraper": 10,
+    "searchscraper": 10,
+    "markdownify": 2,
+    "crawl": 10,
+}
+MARKDOWN_PAGE_COST = 2
+PER_PAGE = {"searchscraper": ("num_results", 3), "crawl": ("max_pages", 2)}
+
+
+class _Account:
+    def __init__(self) -> None:
+        self.response: Optional[dict] = None
+        self.synced_at = float("-inf")
+        self.spent: float = 0
+
+
+class CreditLedger:
+    """Caches the credit balance per API key and tracks spending locally.
+
+    Every successful API call made by a tool is charged locally at its
+    documented cost (see ``estimate``), so the balance can be read without a
+    request. The ledger reconciles with the server, i.e. replaces its
+    estimate with a fresh ``get_credits`` response, once the last one is
+    older than ``ttl`` seconds or once ``max_unreconciled`` credits have
+    been charged since, whichever comes first. The difference between the
+    estimate and the server's figure at each reconcile is published as the
+    ``"credits.drift"`` gauge in ``langchain_scrapegraph.metrics``.
+
+    Costs of services missing from ``costs``, and extras such as heavy JS
+    rendering, are not known locally; reconciling corrects for them.
+
+    Args:
+        ttl: Seconds a server balance is trusted.
+        max_unreconciled: Local charges after which the server is asked again.
+        costs: Credits per call (or per page), by client method; defaults to
+            ``CREDIT_COSTS``.
+        timer: Monotonic clock, mainly to ease testing.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.ledger import credit_ledger
+            from langchain_scrapegraph.tools import GetCreditsTool
+
+            GetCreditsTool().invoke({})  # fetched from the server
+            GetCreditsTool().invoke({})  # answered locally
+            credit_ledger.remaining(api_key)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_unreconciled: float = 500.0,
+        costs: Optional[Mapping[str, float]] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_unreconciled = max_unreconciled
+        self.costs = dict(CREDIT_COSTS if costs is None else costs)
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._accounts: Dict[str, _Account] = {}
+
+    def _account(self, api_key: str) -> _Account:
+        account = self._accounts.get(api_key)
+        if account is None:
+            account = self._accounts[api_key] = _Account()
+        return account
+
+    def estimate(self, method: str, params: Mapping[str, Any]) -> float:
+        """Documented cost in credits of calling ``method`` with ``params``."""
+        cost = self.costs.get(method)
+        if cost is None:
+            return 0
+        if method not in PER_PAGE:
+            return cost
+        if params.get("extraction_mode", True) is False:
+            cost = MARKDOWN_PAGE_COST
+        name, default = PER_PAGE[method]
+        pages = params.get(name)
+        return cost * (default if pages is None else pages)
+
+    def charge(self, api_key: str, credits: float) -> None:
+        """Deduct ``credits`` from the local balance of ``api_key``."""
+        if credits:
+            with self._lock:
+                self._account(api_key).spent += credits
+
+    def record_call(self, api_key: str, method: str, params: Mapping[str, Any]) -> None:
+        """Charge a successful call of ``method`` at its estimated cost."""
+        self.charge(api_key, self.estimate(method, params))
+
+    def needs_refresh(self, api_key: str) -> bool:
+        """Whether the server should be asked for the balance again."""
+        with self._lock:
+            account = self._accounts.get(api_key)
+            return (
+                account is None
+                or account.response is None
+                or self._timer() - account.synced_at >= self.ttl
+                or account.spent >= self.max_unreconciled
+            )
+
+    def update(self, api_key: str, response: dict) -> None:
+        """Reconcile with a ``get_credits`` response from the server."""
+        with self._lock:
+            account = self._account(api_key)
+            expected = self._adjusted(account)
+            account.response = dict(response)
+            account.synced_at = self._timer()
+            account.spent = 0
+        if expected is not None and "remaining_credits" in response:
+            metrics.set_gauge(
+                "credits.drift",
+                expected["remaining_credits"] - response["remaining_credits"],
+            )
+
+    def _adjusted(self, account: _Account) -> Optional[dict]:
+        if account.response is None:
+            return None
+        response = dict(account.response)
+        if "remaining_credits" in response:
+            response["remaining_credits"] = (
+                response["remaining_credits"] - account.spent
+            )
+        if "total_credits_used" in response:
+            response["total_credits_used"] = (
+                response["total_credits_used"] + account.spent
+            )
+        return response
+
+    def balance(self, api_key: str) -> Optional[dict]:
+        """The last server response adjusted by local charges, if any."""
+        with self._lock:
+            account = self._accounts.get(api_key)
+            return None if account is None else self._adjusted(account)
+
+    def remaining(self, api_key: str) -> Optional[float]:
+        """Estimated credits left for ``api_key``, or ``None`` if unknown."""
+        balance = self.balance(api_key)
+        return None if balance is None else balance.get("remaining_credits")
+
+    def can_afford(self, api_key: str, credits: float) -> bool:
+        """Whether ``credits`` fit in the estimated balance.
+
+        An unknown balance is not held against the caller.
+        """
+        remaining = self.remaining(api_key)
+        return remaining is None or remaining >= credits
+
+    def clear(self) -> None:
+        with self._lock:
+            self._accounts.clear()
+
+
+credit_ledger = CreditLedger()
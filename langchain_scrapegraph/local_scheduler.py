@@ -0,0 +1,581 @@
+"""An in-process stand-in for the hosted scheduled-jobs service."""
+
+import asyncio
+import concurrent.futures
+import heapq
+import itertools
+import json
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from scrapegraph_py import AsyncClient, Client
+from scrapegraph_py.exceptions import APIError
+
+from .cron import parse_cron
+from .ledger import credit_ledger
+from .tools.markdownify import MarkdownifyTool
+from .tools.scheduled_jobs import ServiceType
+from .tools.searchscraper import SearchScraperTool
+from .tools.smartcrawler import SmartCrawlerTool
+from .tools.smartscraper import SmartScraperTool
+
+# Tool that runs each service type, and the client method it bills as.
+SERVICE_TOOLS = {
+    ServiceType.SMARTSCRAPER: SmartScraperTool,
+    ServiceType.SEARCHSCRAPER: SearchScraperTool,
+    ServiceType.SMARTCRAWLER: SmartCrawlerTool,
+    ServiceType.MARKDOWNIFY: MarkdownifyTool,
+}
+SERVICE_METHODS = {
+    ServiceType.SMARTSCRAPER: "smartscraper",
+    ServiceType.SEARCHSCRAPER: "searchscraper",
+    ServiceType.SMARTCRAWLER: "crawl",
+    ServiceType.MARKDOWNIFY: "markdownify",
+}
+_JOB_COLUMNS = (
+    "id, job_name, service_type, cron_expression, job_config, is_active,"
+    " created_at, updated_at, next_run_at"
+)
+_EXECUTION_COLUMNS = (
+    "id, job_id, status, started_at, completed_at, credits_used, result, error"
+)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ToolRunner:
+    """Runs a job's ``job_config`` through the tool for its service type.
+
+    ``job_config`` holds the tool's input, e.g. ``{"website_url", "user_prompt"}``
+    for SmartScraper. One tool per service type is built on first use, so
+    executions share its client, retries and rate limit.
+
+    Args:
+        api_key: API key for the tools; defaults to ``SGAI_API_KEY``.
+    """
+
+    def __init__(self, api_key: Optional[str] = None) -> None:
+        self.api_key = api_key
+        self._lock = threading.Lock()
+        self._tools: Dict[str, Any] = {}
+
+    def __call__(self, service_type: str, job_config: Dict[str, Any]) -> Any:
+        with self._lock:
+            tool = self._tools.get(service_type)
+            if tool is None:
+                kwargs = {} if self.api_key is None else {"api_key": self.api_key}
+                tool = self._tools[service_type] = SERVICE_TOOLS[service_type](**kwargs)
+        return tool.invoke(job_config)
+
+
+class LocalScheduler:
+    """Serves the scheduled-jobs API from this process, for tests and offline work.
+
+    Jobs and their executions are stored in SQLite and fired on their cron
+    schedule, in UTC. One timer thread sleeps on a heap of next fire times
+    until the earliest is due, so thousands of idle jobs cost no CPU. Due
+    jobs are dispatched to a pool of ``max_workers`` threads that run them
+    through ``runner``. At most ``max_pending`` executions wait for a worker;
+    beyond that, executions are recorded as ``"skipped"``. Missed fire times,
+    e.g. while the scheduler was stopped, are not caught up.
+
+    The methods mirror the scheduled-job methods of ``Client`` and return the
+    same shapes. Unknown job ids raise ``APIError`` with status 404. Point
+    the scheduled-job tools at the scheduler with ``client()`` and
+    ``async_client()``.
+
+    Args:
+        path: SQLite database file; ``":memory:"`` keeps everything in memory.
+        runner: Called as ``runner(service_type, job_config)`` to execute a
+            job; defaults to a ``ToolRunner``.
+        max_workers: Executions run at a time.
+        max_pending: Executions that may wait for a free worker.
+        clock: Current time as an aware datetime, mainly to ease testing.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.local_scheduler import LocalScheduler
+            from langchain_scrapegraph.tools import CreateScheduledJobTool
+
+            with LocalScheduler("jobs.db") as scheduler:
+                tool = CreateScheduledJobTool(client=scheduler.client())
+                tool.invoke({...})
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        runner: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+        max_workers: int = 4,
+        max_pending: int = 1000,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        self.runner = runner or ToolRunner()
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._clock = clock
+        self._cond = threading.Condition(threading.RLock())
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, job_name TEXT NOT NULL,"
+            " service_type TEXT NOT NULL, cron_expression TEXT NOT NULL,"
+            " job_config TEXT NOT NULL, is_active INTEGER NOT NULL,"
+            " created_at TEXT NOT NULL, updated_at TEXT NOT NULL,"
+            " next_run_at TEXT)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS executions ("
+            " id TEXT PRIMARY KEY, job_id TEXT NOT NULL, status TEXT NOT NULL,"
+            " started_at TEXT NOT NULL, completed_at TEXT,"
+            " credits_used INTEGER NOT NULL, result TEXT, error TEXT)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS executions_job"
+            " ON executions (job_id, started_at)"
+        )
+        # Executions cut short by a previous shutdown.
+        self._db.execute(
+            "UPDATE executions SET status = 'failed', error = 'interrupted'"
+            " WHERE status IN ('pending', 'running')"
+        )
+        self._heap: List[Tuple[datetime, int, str, int]] = []
+        self._versions: Dict[str, int] = {}
+        self._counter = itertools.count()
+        self._inflight = 0
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers)
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        with self._cond:
+            for job_id, expression in self._db.execute(
+                "SELECT id, cron_expression FROM jobs WHERE is_active"
+            ).fetchall():
+                self._schedule(job_id, expression, True)
+
+    def __enter__(self) -> "LocalScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def client(self) -> "LocalSchedulerClient":
+        """A ``Client`` whose scheduled-job methods are served by this scheduler."""
+        return LocalSchedulerClient(self)
+
+    def async_client(self) -> "AsyncLocalSchedulerClient":
+        """Async counterpart of ``client``."""
+        return AsyncLocalSchedulerClient(self)
+
+    # Timer
+
+    def start(self) -> None:
+        """Start firing jobs on their schedule in a background thread."""
+        with self._cond:
+            if self._thread is None:
+                self._stopped = False
+                self._thread = threading.Thread(
+                    target=self._run, name="scrapegraph-local-scheduler", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        """Stop firing jobs; with ``wait``, let running executions finish."""
+        with self._cond:
+            self._stopped = True
+            thread, self._thread = self._thread, None
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join()
+        self._pool.shutdown(wait=wait)
+        self._pool = concurrent.futures.ThreadPoolExecutor(self.max_workers)
+
+    def close(self) -> None:
+        """Stop the scheduler and close its database."""
+        self.stop()
+        with self._cond:
+            self._db.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                delay = self._seconds_until_due()
+                if delay is None or delay > 0:
+                    self._cond.wait(delay)
+                    continue
+            self.run_due()
+
+    def _seconds_until_due(self) -> Optional[float]:
+        while self._heap:
+            due, _, job_id, version = self._heap[0]
+            if self._versions.get(job_id) == version:
+                return (due - self._clock()).total_seconds()
+            heapq.heappop(self._heap)
+        return None
+
+    def _schedule(self, job_id: str, expression: str, active: bool) -> Optional[str]:
+        """(Re)schedule a job's next fire and return it as stored."""
+        version = self._versions.get(job_id, 0) + 1
+        self._versions[job_id] = version
+        if not active:
+            return None
+        due = next(parse_cron(expression).times(self._clock()))
+        heapq.heappush(self._heap, (due, next(self._counter), job_id, version))
+        self._cond.notify_all()
+        return due.isoformat()
+
+    def run_due(self) -> int:
+        """Fire every job that is due now; return how many fired."""
+        fired = 0
+        with self._cond:
+            now = self._clock()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, job_id, version = heapq.heappop(self._heap)
+                if self._versions.get(job_id) != version:
+                    continue
+                row = self._db.execute(
+                    "SELECT cron_expression FROM jobs WHERE id = ?", (job_id,)
+                ).fetchone()
+                if row is None:
+                    continue
+                next_run_at = self._schedule(job_id, row[0], True)
+                self._db.execute(
+                    "UPDATE jobs SET next_run_at = ? WHERE id = ?",
+                    (next_run_at, job_id),
+                )
+                self._execute(job_id)
+                fired += 1
+        return fired
+
+    # Executions
+
+    def _execute(self, job_id: str) -> str:
+        """Record an execution of ``job_id`` and hand it to a worker."""
+        with self._cond:
+            service_type, config = self._db.execute(
+                "SELECT service_type, job_config FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            config = json.loads(config)
+            execution_id = str(uuid.uuid4())
+            now = self._clock().isoformat()
+            credits = credit_ledger.estimate(SERVICE_METHODS[service_type], config)
+            full = self._inflight >= self.max_workers + self.max_pending
+            self._db.execute(
+                f"INSERT INTO executions ({_EXECUTION_COLUMNS})"
+                " VALUES (?, ?, ?, ?, ?, ?, NULL, ?)",
+                (
+                    execution_id,
+                    job_id,
+                    "skipped" if full else "pending",
+                    now,
+                    now if full else None,
+                    0 if full else credits,
+                    "worker pool is full" if full else None,
+                ),
+            )
+            if not full:
+                self._inflight += 1
+                self._pool.submit(
+                    self._work, execution_id, service_type, config, credits
+                )
+        return execution_id
+
+    def _work(
+        self,
+        execution_id: str,
+        service_type: str,
+        config: Dict[str, Any],
+        credits: int,
+    ) -> None:
+        with self._cond:
+            self._db.execute(
+                "UPDATE executions SET status = 'running' WHERE id = ?",
+                (execution_id,),
+            )
+        result, error = None, None
+        try:
+            result = self.runner(service_type, config)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        with self._cond:
+            self._inflight -= 1
+            self._db.execute(
+                "UPDATE executions SET status = ?, completed_at = ?,"
+                " credits_used = ?, result = ?, error = ? WHERE id = ?",
+                (
+                    "failed" if error else "completed",
+                    self._clock().isoformat(),
+                    0 if error else credits,
+                    None if error else json.dumps(result, default=str),
+                    error,
+                    execution_id,
+                ),
+            )
+
+    # Client methods
+
+    def _job(self, job_id: str) -> dict:
+        row = self._db.execute(
+            f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        if row is None:
+            raise APIError(f"Scheduled job {job_id} not found", status_code=404)
+        return _job_dict(row)
+
+    def create_scheduled_job(
+        self,
+        job_name: str,
+        service_type: str,
+        cron_expression: str,
+        job_config: Dict[str, Any],
+        is_active: bool = True,
+    ) -> dict:
+        if service_type not in SERVICE_TOOLS:
+            raise APIError(f"Unsupported service type {service_type}", 400)
+        try:
+            parse_cron(cron_expression)
+        except ValueError as e:
+            raise APIError(str(e), status_code=400) from e
+        job_id = str(uuid.uuid4())
+        now = self._clock().isoformat()
+        with self._cond:
+            next_run_at = self._schedule(job_id, cron_expression, is_active)
+            self._db.execute(
+                f"INSERT INTO jobs ({_JOB_COLUMNS})"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    job_name,
+                    service_type,
+                    cron_expression,
+                    json.dumps(job_config),
+                    int(is_active),
+                    now,
+                    now,
+                    next_run_at,
+                ),
+            )
+            return self._job(job_id)
+
+    def get_scheduled_jobs(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        service_type: Optional[str] = None,
+        is_active: Optional[bool] = None,
+    ) -> dict:
+        where = "WHERE (? IS NULL OR service_type = ?) AND (? IS NULL OR is_active = ?)"
+        active = None if is_active is None else int(is_active)
+        params = (service_type, service_type, active, active)
+        with self._cond:
+            total = self._db.execute(
+                f"SELECT COUNT(*) FROM jobs {where}", params
+            ).fetchone()[0]
+            rows = self._db.execute(
+                f"SELECT {_JOB_COLUMNS} FROM jobs {where}"
+                " ORDER BY created_at, rowid LIMIT ? OFFSET ?",
+                params + (page_size, (page - 1) * page_size),
+            ).fetchall()
+        return {
+            "jobs": [_job_dict(row) for row in rows],
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+        }
+
+    def get_scheduled_job(self, job_id: str) -> dict:
+        with self._cond:
+            return self._job(job_id)
+
+    def update_scheduled_job(
+        self,
+        job_id: str,
+        job_name: Optional[str] = None,
+        cron_expression: Optional[str] = None,
+        job_config: Optional[Dict[str, Any]] = None,
+        is_active: Optional[bool] = None,
+    ) -> dict:
+        if cron_expression is not None:
+            try:
+                parse_cron(cron_expression)
+            except ValueError as e:
+                raise APIError(str(e), status_code=400) from e
+        with self._cond:
+            job = self._job(job_id)
+            changes = {
+                "job_name": job_name,
+                "cron_expression": cron_expression,
+                "job_config": job_config,
+                "is_active": is_active,
+            }
+            job.update({k: v for k, v in changes.items() if v is not None})
+            return self._save(job)
+
+    def _save(self, job: dict) -> dict:
+        next_run_at = self._schedule(
+            job["id"], job["cron_expression"], job["is_active"]
+        )
+        self._db.execute(
+            "UPDATE jobs SET job_name = ?, cron_expression = ?, job_config = ?,"
+            " is_active = ?, updated_at = ?, next_run_at = ? WHERE id = ?",
+            (
+                job["job_name"],
+                job["cron_expression"],
+                json.dumps(job["job_config"]),
+                int(job["is_active"]),
+                self._clock().isoformat(),
+                next_run_at,
+                job["id"],
+            ),
+        )
+        return self._job(job["id"])
+
+    def pause_scheduled_job(self, job_id: str) -> dict:
+        with self._cond:
+            job = self._job(job_id)
+            job["is_active"] = False
+            self._save(job)
+        return {
+            "message": "Job paused successfully",
+            "job_id": job_id,
+            "is_active": False,
+        }
+
+    def resume_scheduled_job(self, job_id: str) -> dict:
+        with self._cond:
+            job = self._job(job_id)
+            job["is_active"] = True
+            job = self._save(job)
+        return {
+            "message": "Job resumed successfully",
+            "job_id": job_id,
+            "is_active": True,
+            "next_run_at": job["next_run_at"],
+        }
+
+    def trigger_scheduled_job(self, job_id: str) -> dict:
+        with self._cond:
+            self._job(job_id)
+            execution_id = self._execute(job_id)
+        return {
+            "message": "Job triggered successfully",
+            "job_id": job_id,
+            "execution_id": execution_id,
+            "triggered_at": self._clock().isoformat(),
+        }
+
+    def get_job_executions(
+        self,
+        job_id: str,
+        page: int = 1,
+        page_size: int = 20,
+        status: Optional[str] = None,
+    ) -> dict:
+        where = "WHERE job_id = ? AND (? IS NULL OR status = ?)"
+        params = (job_id, status, status)
+        with self._cond:
+            self._job(job_id)
+            total = self._db.execute(
+                f"SELECT COUNT(*) FROM executions {where}", params
+            ).fetchone()[0]
+            rows = self._db.execute(
+                f"SELECT {_EXECUTION_COLUMNS} FROM executions {where}"
+                " ORDER BY started_at DESC, rowid DESC LIMIT ? OFFSET ?",
+                params + (page_size, (page - 1) * page_size),
+            ).fetchall()
+        return {
+            "executions": [_execution_dict(row) for row in rows],
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+        }
+
+    def delete_scheduled_job(self, job_id: str) -> dict:
+        with self._cond:
+            self._job(job_id)
+            # Its heap entry is dropped when it comes up.
+            self._versions.pop(job_id, None)
+            self._db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            self._db.execute("DELETE FROM executions WHERE job_id = ?", (job_id,))
+        return {"message": "Job deleted successfully", "job_id": job_id}
+
+
+def _job_dict(row: tuple) -> dict:
+    job = dict(zip([c.strip() for c in _JOB_COLUMNS.split(",")], row))
+    job["job_config"] = json.loads(job["job_config"])
+    job["is_active"] = bool(job["is_active"])
+    return job
+
+
+def _execution_dict(row: tuple) -> dict:
+    execution = dict(zip([c.strip() for c in _EXECUTION_COLUMNS.split(",")], row))
+    if execution["result"] is not None:
+        execution["result"] = json.loads(execution["result"])
+    return execution
+
+
+def _forward(name: str) -> Callable[..., Any]:
+    def method(self: Any, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self.scheduler, name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+def _aforward(name: str) -> Callable[..., Any]:
+    async def method(self: Any, *args: Any, **kwargs: Any) -> Any:
+        return await asyncio.to_thread(getattr(self.scheduler, name), *args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+class LocalSchedulerClient(Client):
+    """``Client`` serving the scheduled-job methods from a ``LocalScheduler``.
+
+    Only those methods are available; the scheduler outlives its clients.
+    """
+
+    def __init__(self, scheduler: LocalScheduler) -> None:
+        self.scheduler = scheduler
+
+    def close(self) -> None:
+        pass
+
+    create_scheduled_job = _forward("create_scheduled_job")
+    get_scheduled_jobs = _forward("get_scheduled_jobs")
+    get_scheduled_job = _forward("get_scheduled_job")
+    update_scheduled_job = _forward("update_scheduled_job")
+    pause_scheduled_job = _forward("pause_scheduled_job")
+    resume_scheduled_job = _forward("resume_scheduled_job")
+    trigger_scheduled_job = _forward("trigger_scheduled_job")
+    get_job_executions = _forward("get_job_executions")
+    delete_scheduled_job = _forward("delete_scheduled_job")
+
+
+class AsyncLocalSchedulerClient(AsyncClient):
+    """Async counterpart of ``LocalSchedulerClient``."""
+
+    def __init__(self, scheduler: LocalScheduler) -> None:
+        self.scheduler = scheduler
+
+    async def close(self) -> None:
+        pass
+
+    create_scheduled_job = _aforward("create_scheduled_job")
+    get_scheduled_jobs = _aforward("get_scheduled_jobs")
+    get_scheduled_job = _aforward("get_scheduled_job")
+    update_scheduled_job = _aforward("update_scheduled_job")
+    pause_scheduled_job = _aforward("pause_scheduled_job")
+    resume_scheduled_job = _aforward("resume_scheduled_job")
+    trigger_scheduled_job = _aforward("trigger_scheduled_job")
+    get_job_executions = _aforward("get_job_executions")
+    delete_scheduled_job = _aforward("delete_scheduled_job")
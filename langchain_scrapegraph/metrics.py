@@ -0,0 +1,157 @@
+"""In-process metrics recorded by the ScrapeGraph tools."""
+
+import bisect
+import math
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class LatencyHistogram:
+    """Thread-safe latency histogram with logarithmic buckets.
+
+    Samples land in buckets that grow by ``growth`` per step from
+    ``min_value`` seconds, so percentiles are accurate to within one bucket
+    (about 10% with the defaults) at constant memory. To follow changes in
+    latency, counts are kept in two generations that rotate every
+    ``window`` seconds; percentiles cover the current and the previous
+    generation.
+
+    Args:
+        window: Seconds after which the oldest generation is dropped. ``None``
+            keeps every sample.
+        min_value: Upper bound of the first bucket, in seconds.
+        max_value: Values above this land in the last bucket.
+        growth: Ratio between consecutive bucket bounds.
+        timer: Monotonic clock, mainly to ease testing.
+    """
+
+    def __init__(
+        self,
+        window: Optional[float] = 60.0,
+        min_value: float = 0.001,
+        max_value: float = 3600.0,
+        growth: float = 1.1,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        steps = math.ceil(math.log(max_value / min_value, growth))
+        self.window = window
+        self._bounds = [min_value * growth**i for i in range(steps + 1)]
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._current = [0] * len(self._bounds)
+        self._previous = [0] * len(self._bounds)
+        self._rotated_at = timer()
+
+    def _rotate(self) -> None:
+        if self.window is None:
+            return
+        elapsed = self._timer() - self._rotated_at
+        if elapsed >= self.window:
+            if elapsed >= 2 * self.window:
+                self._previous = [0] * len(self._bounds)
+            else:
+                self._previous = self._current
+            self._current = [0] * len(self._bounds)
+            self._rotated_at = self._timer()
+
+    def observe(self, value: float) -> None:
+        """Record one latency sample in seconds."""
+        index = min(bisect.bisect_left(self._bounds, value), len(self._bounds) - 1)
+        with self._lock:
+            self._rotate()
+            self._current[index] += 1
+
+    def _counts(self) -> List[int]:
+        with self._lock:
+            self._rotate()
+            return [a + b for a, b in zip(self._current, self._previous)]
+
+    @property
+    def count(self) -> int:
+        """Number of samples in the current and previous generation."""
+        return sum(self._counts())
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the ``q``-th percentile (0-100), or ``None`` without samples."""
+        counts = self._counts()
+        total = sum(counts)
+        if not total:
+            return None
+        rank = max(1, math.ceil(total * q / 100))
+        seen = 0
+        for bound, count in zip(self._bounds, counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self._bounds[-1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._current = [0] * len(self._bounds)
+            self._previous = [0] * len(self._bounds)
+
+
+class MetricsRegistry:
+    """Named latency histograms and gauges.
+
+    Histograms are created on first use. Tools record the latency of every
+    API call under ``"<service>.latency"``; other components publish gauges
+    such as ``"<service>.concurrency_limit"``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._gauges: Dict[str, float] = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """Return the histogram called ``name``, creating it if needed."""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            return histogram
+
+    def observe(self, name: str, value: float) -> None:
+        self.histogram(name).observe(value)
+
+    def percentile(self, name: str, q: float) -> Optional[float]:
+        """``q``-th percentile of histogram ``name``, or ``None`` without samples."""
+        with self._lock:
+            histogram = self._histograms.get(name)
+        return None if histogram is None else histogram.percentile(q)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def gauge(self, name: str) -> Optional[float]:
+        with self._lock:
+            return self._gauges.get(name)
+
+    def snapshot(self) -> dict:
+        """Return the gauges and latency percentiles as a plain dict."""
+        with self._lock:
+            gauges = dict(self._gauges)
+            histograms = dict(self._histograms)
+        return {
+            "gauges": gauges,
+            "latency": {
+                name: {
+                    "count": histogram.count,
+                    "p50": histogram.percentile(50),
+                    "p95": histogram.percentile(95),
+                    "p99": histogram.percentile(99),
+                }
+                for name, histogram in histograms.items()
+            },
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._gauges.clear()
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,102 @@
+"""Listings that are walked page by page with the next pages fetched ahead."""
+
+import asyncio
+import math
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterator,
+    List,
+    Optional,
+)
+
+# Largest page the scheduled jobs endpoints accept.
+MAX_PAGE_SIZE = 100
+
+
+def page_items(response: Any, key: str) -> List[Any]:
+    """The items of one page, held under ``key``; empty if there are none."""
+    items = response.get(key) if isinstance(response, dict) else None
+    return list(items) if isinstance(items, list) else []
+
+
+def last_page(response: Any, page_size: int) -> Optional[int]:
+    """The number of the last page, or ``None`` if the total is not reported."""
+    total = response.get("total") if isinstance(response, dict) else None
+    if not isinstance(total, int) or isinstance(total, bool):
+        return None
+    return max(1, math.ceil(total / page_size))
+
+
+def _validate(page_size: int, prefetch: int) -> None:
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if prefetch < 1:
+        raise ValueError("prefetch must be at least 1")
+
+
+def iter_pages(fetch: Callable[[int], Any], key: str, page_size: int) -> Iterator[Any]:
+    """Yield every item of a paginated listing, one page after another.
+
+    The blocking counterpart of ``aiter_pages``, without prefetching.
+    """
+    _validate(page_size, 1)
+    page = 1
+    while True:
+        response = fetch(page)
+        items = page_items(response, key)
+        yield from items
+        last = last_page(response, page_size)
+        if len(items) < page_size or (last is not None and page >= last):
+            return
+        page += 1
+
+
+async def aiter_pages(
+    fetch: Callable[[int], Awaitable[Any]],
+    key: str,
+    page_size: int,
+    prefetch: int = 4,
+) -> AsyncIterator[Any]:
+    """Yield every item of a paginated listing, in order.
+
+    ``fetch(page)`` returns the response for a 1-based page number, holding
+    that page's items under ``key`` and the size of the whole listing under
+    ``"total"``. The first page is fetched alone to learn the total; from
+    then on up to ``prefetch`` of the following pages are requested at once,
+    so a long listing costs about one round trip of latency plus transfer
+    time rather than one round trip per page. Without a total, pages are
+    requested ahead until one comes back short.
+
+    The walk stops at the last page or the first short page. Closing the
+    iterator early cancels the requests still in flight.
+    """
+    _validate(page_size, prefetch)
+    first = await fetch(1)
+    items = page_items(first, key)
+    for item in items:
+        yield item
+    last = last_page(first, page_size)
+    if len(items) < page_size or last == 1:
+        return
+    pending: Deque[asyncio.Future] = deque()
+    page = 2
+    try:
+        while True:
+            while len(pending) < prefetch and (last is None or page <= last):
+                pending.append(asyncio.ensure_future(fetch(page)))
+                page += 1
+            if not pending:
+                return
+            items = page_items(await pending.popleft(), key)
+            for item in items:
+                yield item
+            if len(items) < page_size:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,374 @@
+"""Handles on background ScrapeGraph jobs and the poller that watches them."""
+
+import asyncio
+import contextvars
+import functools
+import heapq
+import itertools
+import random
+import threading
+import time
+import weakref
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional, Tuple
+
+from langchain_core.tools import ToolException
+
+from .deadline import Deadline, DeadlineExceeded, current_deadline, deadline
+from .metrics import metrics
+
+SUCCESS_STATUSES = frozenset({"success", "completed", "done"})
+FAILURE_STATUSES = frozenset({"failed", "error", "cancelled", "canceled"})
+
+
+class PollBackoff:
+    """Intervals between status polls of a background job.
+
+    The first ``fast_polls`` polls are ``initial`` seconds apart so that short
+    jobs are picked up quickly; after that the interval grows by
+    ``multiplier`` per poll up to ``max_interval``. Each interval is spread by
+    ``jitter`` (a fraction) so that jobs submitted together are not polled in
+    lockstep.
+
+    Args:
+        initial: Seconds between the first polls.
+        fast_polls: Number of polls made at the initial interval.
+        multiplier: Growth factor of the interval afterwards.
+        max_interval: Upper bound on any interval, in seconds.
+        jitter: Relative random spread applied to each interval.
+    """
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        fast_polls: int = 3,
+        multiplier: float = 2.0,
+        max_interval: float = 30.0,
+        jitter: float = 0.1,
+    ) -> None:
+        self.initial = initial
+        self.fast_polls = fast_polls
+        self.multiplier = multiplier
+        self.max_interval = max_interval
+        self.jitter = jitter
+
+    def interval(self, poll: int) -> float:
+        """Seconds to wait before poll number ``poll`` (0-based)."""
+        growth = max(0, poll - self.fast_polls + 1)
+        interval = min(self.max_interval, self.initial * self.multiplier**growth)
+        if self.jitter:
+            interval *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return min(self.max_interval, interval)
+
+
+class JobFailedError(ToolException):
+    """Raised when a background job finishes with a failure status."""
+
+    def __init__(self, job_id: Optional[str], response: dict) -> None:
+        self.job_id = job_id
+        self.response = response
+        reason = response.get("error") or response.get("status")
+        super().__init__(f"Job {job_id} failed: {reason}")
+
+
+def job_id_from(response: Any, keys: Iterable[str]) -> Optional[str]:
+    """Return the first of ``keys`` set in ``response``, if any."""
+    if not isinstance(response, dict):
+        return None
+    for key in keys:
+        if response.get(key):
+            return str(response[key])
+    return None
+
+
+class PendingJob:
+    """Handle on a job that the API runs in the background.
+
+    Obtained from a tool's ``submit``/``asubmit``. The handle can be polled
+    once (``poll``/``apoll``), followed poll by poll (``updates``/
+    ``aupdates``) or waited on (``result``/``aresult``); status
+    requests go through the tool, so they share its retries, rate limit and
+    circuit breaker. Async waits are multiplexed by ``job_poller``: however
+    many jobs are awaited, one task per event loop schedules their polls.
+
+    A job whose submit response carries no id is treated as already finished.
+    When a submitted job is first seen finished, the time since its
+    submission is recorded under ``"<service>.job_latency"`` in
+    ``langchain_scrapegraph.metrics``.
+
+    Args:
+        tool: Tool that submitted the job and is used to poll it.
+        poll_method: Client method returning the job's status by id.
+        job_id: Id of the job, or ``None`` for a synchronous response.
+        response: Latest response seen for the job.
+        backoff: Poll intervals; defaults to ``PollBackoff()``.
+    """
+
+    def __init__(
+        self,
+        tool: Any,
+        poll_method: str,
+        job_id: Optional[str],
+        response: Any,
+        backoff: Optional[PollBackoff] = None,
+    ) -> None:
+        self.job_id = job_id
+        self.backoff = backoff or PollBackoff()
+        self.polls = 0
+        # None when unknown, as for a job resumed by id.
+        self.submitted_at: Optional[float] = time.monotonic()
+        self._tool = tool
+        self._poll_method = poll_method
+        self._update(response)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(job_id={self.job_id!r}, status={self.status!r})"
+
+    def _update(self, response: Any) -> None:
+        self.response = response
+        status = response.get("status") if isinstance(response, dict) else None
+        self.status = str(status).lower() if status is not None else None
+
+    def _polled(self, response: Any) -> None:
+        was_done = self.done
+        self._update(response)
+        self.polls += 1
+        if self.done and not was_done and self.submitted_at is not None:
+            metrics.observe(
+                f"{self._tool.service}.job_latency",
+                time.monotonic() - self.submitted_at,
+            )
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished, successfully or not."""
+        return (
+            self.job_id is None
+            or self.status in SUCCESS_STATUSES
+            or self.status in FAILURE_STATUSES
+        )
+
+    @property
+    def failed(self) -> bool:
+        return self.status in FAILURE_STATUSES
+
+    def poll(self) -> Optional[str]:
+        """Fetch the job's status once and return it."""
+        if self.job_id is not None:
+            self._polled(self._tool._call(self._poll_method, self.job_id))
+        return self.status
+
+    async def apoll(self) -> Optional[str]:
+        """Async counterpart of ``poll``."""
+        if self.job_id is not None:
+            self._polled(await self._tool._acall(self._poll_method, self.job_id))
+        return self.status
+
+    def _outcome(self) -> Any:
+        if self.failed:
+            raise JobFailedError(self.job_id, self.response)
+        return self.response
+
+    def _wait_for_poll(self) -> None:
+        current = current_deadline()
+        delay = self.backoff.interval(self.polls)
+        if current is not None and delay >= current.remaining():
+            time.sleep(current.remaining())
+            raise DeadlineExceeded(f"deadline exceeded waiting for job {self.job_id}")
+        time.sleep(delay)
+        self.poll()
+
+    async def _await_poller(self, once: bool) -> None:
+        current = current_deadline()
+        if current is None:
+            await job_poller.wait(self, once=once)
+            return
+        try:
+            await asyncio.wait_for(
+                job_poller.wait(self, once=once), current.remaining()
+            )
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(
+                f"deadline exceeded waiting for job {self.job_id}"
+            ) from None
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Block until the job finishes and return its final response.
+
+        Raises ``JobFailedError`` if the job failed, and ``DeadlineExceeded``
+        if ``timeout`` or an enclosing ``deadline`` expires first; the job
+        keeps running and can be waited on again.
+        """
+        with deadline(timeout):
+            while not self.done:
+                self._wait_for_poll()
+        return self._outcome()
+
+    async def aresult(self, timeout: Optional[float] = None) -> Any:
+        """Wait for the job without holding a thread; see ``result``."""
+        with deadline(timeout):
+            if not self.done:
+                await self._await_poller(once=False)
+        return self._outcome()
+
+    def updates(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Yield the latest response now and after every poll until done.
+
+        Only the latest response is held, so a consumer that processes each
+        update as it arrives never accumulates the job's history. The final
+        response is yielded before ``JobFailedError`` is raised for a failed
+        job. ``timeout`` bounds the whole iteration, waits only.
+        """
+        limit = None if timeout is None else Deadline(timeout)
+        yield self.response
+        while not self.done:
+            with deadline(None if limit is None else limit.remaining()):
+                self._wait_for_poll()
+            yield self.response
+        self._outcome()
+
+    async def aupdates(self, timeout: Optional[float] = None) -> AsyncIterator[Any]:
+        """Async counterpart of ``updates``, polled by ``job_poller``."""
+        limit = None if timeout is None else Deadline(timeout)
+        yield self.response
+        while not self.done:
+            with deadline(None if limit is None else limit.remaining()):
+                await self._await_poller(once=True)
+            yield self.response
+        self._outcome()
+
+
+class _Watch:
+    def __init__(
+        self,
+        job: PendingJob,
+        future: asyncio.Future,
+        context: contextvars.Context,
+        once: bool,
+    ) -> None:
+        self.job = job
+        self.future = future
+        self.context = context
+        self.once = once
+
+
+class _LoopPoller:
+    """Timer heap of the jobs awaited on one event loop."""
+
+    def __init__(self) -> None:
+        self.heap: List[Tuple[float, int, _Watch]] = []
+        self.counter = itertools.count()
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.polling = 0
+
+    def add(self, watch: _Watch) -> None:
+        self._schedule(watch)
+        if self.task is None:
+            # The supervisor must not inherit the first caller's deadline;
+            # each poll runs in the context of the job's own waiter instead.
+            loop = asyncio.get_running_loop()
+            self.task = contextvars.Context().run(loop.create_task, self._supervise())
+        self.wakeup.set()
+
+    def _schedule(self, watch: _Watch) -> None:
+        due = asyncio.get_running_loop().time() + watch.job.backoff.interval(
+            watch.job.polls
+        )
+        heapq.heappush(self.heap, (due, next(self.counter), watch))
+
+    async def _supervise(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self.heap or self.polling:
+                now = loop.time()
+                while self.heap and self.heap[0][0] <= now:
+                    _, _, watch = heapq.heappop(self.heap)
+                    if watch.future.done():
+                        continue
+                    self.polling += 1
+                    task = watch.context.run(loop.create_task, watch.job.apoll())
+                    task.add_done_callback(functools.partial(self._polled, watch))
+                self.wakeup.clear()
+                timer = (
+                    loop.call_at(self.heap[0][0], self.wakeup.set)
+                    if self.heap
+                    else None
+                )
+                try:
+                    await self.wakeup.wait()
+                finally:
+                    if timer is not None:
+                        timer.cancel()
+        finally:
+            self.task = None
+            for _, _, watch in self.heap:
+                watch.future.cancel()
+            self.heap.clear()
+
+    def _polled(self, watch: _Watch, task: asyncio.Task) -> None:
+        self.polling -= 1
+        self.wakeup.set()
+        if watch.future.done():
+            return
+        if task.cancelled():
+            watch.future.cancel()
+        elif task.exception() is not None:
+            watch.future.set_exception(task.exception())
+        elif watch.once or watch.job.done:
+            watch.future.set_result(None)
+        else:
+            self._schedule(watch)
+
+
+class JobPoller:
+    """Polls every awaited background job from a single task per event loop.
+
+    Awaiting a job registers it in a timer heap ordered by its next poll
+    time; one supervisor task sleeps until the earliest one is due, fires the
+    due status requests and reschedules unfinished jobs per their
+    ``PollBackoff``. Hundreds of jobs therefore cost one timer task plus the
+    status requests themselves, rather than a thread or a sleeping loop each.
+    A waiter that is cancelled is dropped at its next due time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pollers: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPoller]"
+        ) = weakref.WeakKeyDictionary()
+
+    def _poller(self) -> _LoopPoller:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            poller = self._pollers.get(loop)
+            if poller is None:
+                poller = self._pollers[loop] = _LoopPoller()
+            return poller
+
+    @property
+    def pending(self) -> int:
+        """Jobs currently awaited on the running event loop."""
+        poller = self._poller()
+        waiting = sum(1 for _, _, watch in poller.heap if not watch.future.done())
+        return waiting + poller.polling
+
+    async def wait(self, job: PendingJob, once: bool = False) -> None:
+        """Return once ``job`` has finished, polling it in the background.
+
+        With ``once``, return after its next poll instead. Errors raised by a
+        status request are raised here.
+        """
+        if job.done:
+            return
+        poller = self._poller()
+        watch = _Watch(
+            job,
+            asyncio.get_running_loop().create_future(),
+            contextvars.copy_context(),
+            once,
+        )
+        poller.add(watch)
+        await watch.future
+
+
+job_poller = JobPoller()
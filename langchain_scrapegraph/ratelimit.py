@@ -0,0 +1,244 @@
+"""Client-side rate limiting shared by every tool using the same API key."""
+
+import asyncio
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class RateLimitCancelled(Exception):
+    """Raised when a tool call's wait for the rate limit is cancelled."""
+
+
+_cancel: contextvars.ContextVar[Optional[threading.Event]] = contextvars.ContextVar(
+    "scrapegraph_cancel", default=None
+)
+
+
+def current_cancel_event() -> Optional[threading.Event]:
+    """The event that cancels rate-limit waits in the current context, if any."""
+    return _cancel.get()
+
+
+@contextmanager
+def cancel_on(event: threading.Event) -> Iterator[threading.Event]:
+    """Let ``event`` interrupt the rate-limit waits of tool calls in the block.
+
+    Setting the event from another thread wakes every sync tool call blocked
+    on the rate limiter inside the block, which then raises
+    ``RateLimitCancelled``. The event follows the context into the workers
+    of batch helpers such as ``extract_many``. Async calls are cancelled by
+    cancelling their task instead.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.ratelimit import cancel_on
+
+            stop = threading.Event()
+            with cancel_on(stop):
+                tool.invoke({"website_url": "https://example.com"})
+            # elsewhere, e.g. on shutdown: stop.set()
+    """
+    token = _cancel.set(event)
+    try:
+        yield event
+    finally:
+        _cancel.reset(token)
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers take tokens by reservation: ``reserve`` always succeeds and returns
+    how long the caller must wait before its tokens are available, so waiters
+    are served in arrival order. A reservation that is abandoned (timed out
+    or cancelled) is handed back with ``refund``.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum burst size. Defaults to one second's worth of
+            tokens, and at least one.
+        timer: Monotonic clock, mainly to ease testing.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        if self.capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = timer()
+
+    def _refill(self) -> None:
+        now = self._timer()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available; negative while reservations are queued."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take ``tokens`` and return the seconds to wait before using them."""
+        if tokens > self.capacity:
+            raise ValueError("cannot take more tokens than the bucket capacity")
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def refund(self, tokens: float = 1) -> None:
+        """Return tokens from a reservation that will not be used."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+
+class RateLimiter:
+    """Registry of token buckets keyed by API key and, optionally, service.
+
+    A call is admitted once both the key-wide bucket and the bucket for its
+    service (``"smartscraper"``, ``"markdownify"``, ``"scrape"``,
+    ``"searchscraper"``, ``"crawl"``, ...) have a token for it. Keys and
+    services without a configured bucket are not limited.
+
+    Sync callers block in ``acquire``; pass a ``threading.Event`` as
+    ``cancel`` to be able to interrupt the wait from another thread (tools
+    take it from ``cancel_on``). Async
+    callers await ``aacquire``, which gives its reservation back if the task
+    is cancelled.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.ratelimit import rate_limiter
+
+            # 10 requests/second for the account, bursts of up to 20
+            rate_limiter.configure("your-api-key", rate=10, capacity=20)
+            # ...of which at most 2/second may be SmartScraper calls
+            rate_limiter.configure("your-api-key", rate=2, service="smartscraper")
+    """
+
+    def __init__(self, timer: Callable[[], float] = time.monotonic) -> None:
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+
+    def configure(
+        self,
+        api_key: str,
+        rate: float,
+        capacity: Optional[float] = None,
+        service: Optional[str] = None,
+    ) -> TokenBucket:
+        """Limit ``api_key`` (or one of its services) to ``rate`` calls/second."""
+        bucket = TokenBucket(rate, capacity, timer=self._timer)
+        with self._lock:
+            self._buckets[(api_key, service)] = bucket
+        return bucket
+
+    def remove(self, api_key: str, service: Optional[str] = None) -> None:
+        """Drop the limit configured for ``api_key`` and ``service``."""
+        with self._lock:
+            self._buckets.pop((api_key, service), None)
+
+    def clear(self) -> None:
+        """Drop every configured limit."""
+        with self._lock:
+            self._buckets.clear()
+
+    def buckets(self, api_key: str, service: Optional[str] = None) -> List[TokenBucket]:
+        """Return the buckets a call for ``api_key`` and ``service`` must pass."""
+        with self._lock:
+            found = [self._buckets.get((api_key, None))]
+            if service is not None:
+                found.append(self._buckets.get((api_key, service)))
+        return [bucket for bucket in found if bucket is not None]
+
+    def _reserve(
+        self, buckets: List[TokenBucket], tokens: float, timeout: Optional[float]
+    ) -> Optional[float]:
+        delay = max(bucket.reserve(tokens) for bucket in buckets)
+        if timeout is not None and delay > timeout:
+            self._refund(buckets, tokens)
+            return None
+        return delay
+
+    @staticmethod
+    def _refund(buckets: List[TokenBucket], tokens: float) -> None:
+        for bucket in buckets:
+            bucket.refund(tokens)
+
+    def acquire(
+        self,
+        api_key: str,
+        service: Optional[str] = None,
+        tokens: float = 1,
+        timeout: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> bool:
+        """Block until the call may proceed.
+
+        Returns False, without consuming tokens, if the wait would exceed
+        ``timeout`` seconds or ``cancel`` is set while waiting.
+        """
+        buckets = self.buckets(api_key, service)
+        if not buckets:
+            return True
+        delay = self._reserve(buckets, tokens, timeout)
+        if delay is None:
+            return False
+        if cancel is not None:
+            if cancel.wait(delay):
+                self._refund(buckets, tokens)
+                return False
+        elif delay:
+            time.sleep(delay)
+        return True
+
+    async def aacquire(
+        self,
+        api_key: str,
+        service: Optional[str] = None,
+        tokens: float = 1,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Wait without blocking the event loop until the call may proceed.
+
+        Returns False, without consuming tokens, if the wait would exceed
+        ``timeout`` seconds.
+        """
+        buckets = self.buckets(api_key, service)
+        if not buckets:
+            return True
+        delay = self._reserve(buckets, tokens, timeout)
+        if delay is None:
+            return False
+        if delay:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._refund(buckets, tokens)
+                raise
+        return True
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,364 @@
+"""Declarative management of scheduled jobs: diff a desired state and apply it."""
+
+import threading
+import time
+from contextlib import aclosing, closing
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from .concurrency import amap_as_completed, map_as_completed
+from .pagination import MAX_PAGE_SIZE, aiter_pages, iter_pages
+from .tools.scheduled_jobs import CreateScheduledJobInput, GetScheduledJobsTool
+
+JobSpec = Union[CreateScheduledJobInput, Mapping[str, Any]]
+
+# Fields UpdateScheduledJob can change in place; a new service type needs a
+# new job.
+UPDATABLE_FIELDS = ("cron_expression", "job_config", "is_active")
+
+
+class ReconcilePlan:
+    """The calls needed to bring the scheduled jobs to a desired state.
+
+    Each action is a dict with ``"action"`` (``"create"``, ``"update"``,
+    ``"replace"`` or ``"delete"``), ``"job_name"``, ``"job_id"`` (``None``
+    for creates), ``"changes"`` (the fields an update sends) and ``"spec"``
+    (the desired job, ``None`` for deletes). A replace, for changes of
+    service type, creates the new job and only then deletes the old one.
+    """
+
+    def __init__(self, actions: List[Dict[str, Any]]) -> None:
+        self.actions = actions
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def __bool__(self) -> bool:
+        return bool(self.actions)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.counts()})"
+
+    def counts(self) -> Dict[str, int]:
+        """Number of actions of each kind."""
+        counts = dict.fromkeys(("create", "update", "replace", "delete"), 0)
+        for action in self.actions:
+            counts[action["action"]] += 1
+        return counts
+
+    def describe(self) -> str:
+        """One line per action, e.g. for a CI job to print as a dry run."""
+        lines = []
+        for action in self.actions:
+            name, spec = action["job_name"], action["spec"]
+            if action["action"] == "create":
+                lines.append(
+                    f"+ {name} ({spec['service_type']}, {spec['cron_expression']!r})"
+                )
+            elif action["action"] == "update":
+                lines.append(f"~ {name}: {', '.join(sorted(action['changes']))}")
+            elif action["action"] == "replace":
+                lines.append(f"-/+ {name} (service type {spec['service_type']})")
+            else:
+                lines.append(f"- {name}")
+        return "\n".join(lines) if lines else "No changes"
+
+
+def _spec(job: JobSpec) -> Dict[str, Any]:
+    if not isinstance(job, CreateScheduledJobInput):
+        job = CreateScheduledJobInput.model_validate(job)
+    return job.model_dump()
+
+
+def _diff(desired: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        field: desired[field]
+        for field in UPDATABLE_FIELDS
+        if current.get(field) != desired[field]
+    }
+
+
+class _ReplaceIncomplete(Exception):
+    """A replace created the new job but could not delete the old one."""
+
+    def __init__(self, created: Any, error: BaseException) -> None:
+        super().__init__(
+            "created the new job but failed to delete the old one, so both "
+            f"exist: {str(error) or type(error).__name__}"
+        )
+        self.created = created
+
+
+class JobReconciler:
+    """Keeps the scheduled jobs of an account in line with a desired state.
+
+    Jobs are matched by ``job_name``. ``plan`` diffs the desired jobs against
+    a snapshot of the account's jobs cached locally; the snapshot is listed
+    from the API (all pages, prefetched concurrently when async) only when
+    missing or older than ``ttl`` seconds, and is kept current with the
+    responses of the calls ``apply`` makes, so reconciling repeatedly costs
+    no listing calls. A failed call discards the snapshot, so the next plan
+    starts from the server's state.
+
+    Only the calls needed are made: creates for new names, updates that send
+    just the changed fields, a create then delete for a change of service
+    type and, with ``prune=True``, deletes of jobs no longer desired. ``apply``
+    runs them concurrently through the tool's rate limit, retries and
+    circuit breaker. Listings that omit ``job_config`` make the first plan
+    update every job's config once; the snapshot has it afterwards.
+
+    Args:
+        tool: Tool whose client and resilience settings the calls use;
+            defaults to ``GetScheduledJobsTool(api_key=api_key)``.
+        api_key: API key for the default tool.
+        ttl: Seconds a listed snapshot is trusted.
+        timer: Monotonic clock, mainly to ease testing.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.reconcile import JobReconciler
+
+            desired = [
+                {
+                    "job_name": "daily-prices",
+                    "service_type": "smartscraper",
+                    "cron_expression": "0 9 * * *",
+                    "job_config": {"website_url": url, "user_prompt": prompt},
+                },
+            ]
+            reconciler = JobReconciler()
+            plan = reconciler.plan(desired, prune=True)
+            print(plan.describe())  # dry run
+            for outcome in reconciler.apply(plan):
+                print(outcome)
+    """
+
+    def __init__(
+        self,
+        tool: Optional[GetScheduledJobsTool] = None,
+        api_key: Optional[str] = None,
+        ttl: float = 300.0,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.tool = tool or GetScheduledJobsTool(api_key=api_key)
+        self.ttl = ttl
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._jobs: Optional[Dict[str, dict]] = None
+        self._fetched_at = float("-inf")
+
+    @property
+    def stale(self) -> bool:
+        """Whether the next plan lists the jobs from the API again."""
+        with self._lock:
+            return self._jobs is None or self._timer() - self._fetched_at >= self.ttl
+
+    def invalidate(self) -> None:
+        """Discard the cached snapshot."""
+        with self._lock:
+            self._jobs = None
+
+    def _store(self, jobs: Iterable[dict]) -> None:
+        with self._lock:
+            self._jobs = {str(job["id"]): dict(job) for job in jobs}
+            self._fetched_at = self._timer()
+
+    def refresh(self) -> None:
+        """List every scheduled job into the snapshot."""
+        self._store(
+            iter_pages(
+                lambda page: self.tool._call(
+                    "get_scheduled_jobs", page=page, page_size=MAX_PAGE_SIZE
+                ),
+                "jobs",
+                MAX_PAGE_SIZE,
+            )
+        )
+
+    async def arefresh(self, prefetch: int = 4) -> None:
+        """Async counterpart of ``refresh``, prefetching pages."""
+
+        async def fetch(page: int) -> Any:
+            return await self.tool._acall(
+                "get_scheduled_jobs", page=page, page_size=MAX_PAGE_SIZE
+            )
+
+        self._store(
+            [job async for job in aiter_pages(fetch, "jobs", MAX_PAGE_SIZE, prefetch)]
+        )
+
+    def _plan(self, desired: Iterable[JobSpec], prune: bool) -> ReconcilePlan:
+        specs: Dict[str, Dict[str, Any]] = {}
+        for job in desired:
+            spec = _spec(job)
+            if spec["job_name"] in specs:
+                raise ValueError(f"Duplicate job_name {spec['job_name']!r}")
+            specs[spec["job_name"]] = spec
+        with self._lock:
+            current = list((self._jobs or {}).values())
+        # When a half-finished replace left two jobs with one name, match the
+        # one that already has the desired service type.
+        current.sort(
+            key=lambda job: job.get("service_type")
+            != specs.get(job.get("job_name"), {}).get("service_type")
+        )
+        actions: List[Dict[str, Any]] = []
+        matched = set()
+        for job in current:
+            name = job.get("job_name")
+            spec = specs.get(name)
+            if spec is None or name in matched:
+                if prune:
+                    actions.append(_action("delete", name, job["id"]))
+                continue
+            matched.add(name)
+            if job.get("service_type") != spec["service_type"]:
+                actions.append(_action("replace", name, job["id"], spec=spec))
+                continue
+            changes = _diff(spec, job)
+            if changes:
+                actions.append(_action("update", name, job["id"], changes, spec))
+        for name, spec in specs.items():
+            if name not in matched:
+                actions.append(_action("create", name, spec=spec))
+        return ReconcilePlan(actions)
+
+    def plan(self, desired: Iterable[JobSpec], *, prune: bool = False) -> ReconcilePlan:
+        """Compute the calls that bring the jobs to ``desired``; sends nothing.
+
+        Args:
+            desired: The jobs that should exist, as ``CreateScheduledJobInput``
+                or dicts with the same fields.
+            prune: Whether jobs whose names are not desired are deleted. Off
+                by default, so a partial list never deletes other jobs.
+        """
+        if self.stale:
+            self.refresh()
+        return self._plan(desired, prune)
+
+    async def aplan(
+        self, desired: Iterable[JobSpec], *, prune: bool = False
+    ) -> ReconcilePlan:
+        """Async counterpart of ``plan``."""
+        if self.stale:
+            await self.arefresh()
+        return self._plan(desired, prune)
+
+    def _applied(self, action: Dict[str, Any], created: Any = None) -> None:
+        """Fold a successful action into the snapshot."""
+        with self._lock:
+            if self._jobs is None:
+                return
+            if action["action"] in ("delete", "replace"):
+                self._jobs.pop(str(action["job_id"]), None)
+            job = self._jobs.get(str(action["job_id"]))
+            if action["action"] == "update" and job is not None:
+                job.update(action["changes"])
+            if action["action"] in ("create", "replace"):
+                if isinstance(created, dict) and created.get("id"):
+                    self._jobs[str(created["id"])] = {**action["spec"], **created}
+                else:
+                    self._jobs = None
+
+    def _run_action(self, action: Dict[str, Any]) -> Any:
+        kind = action["action"]
+        if kind == "delete":
+            result = self.tool._call("delete_scheduled_job", action["job_id"])
+        elif kind == "update":
+            result = self.tool._call(
+                "update_scheduled_job", job_id=action["job_id"], **action["changes"]
+            )
+        else:
+            result = self.tool._call("create_scheduled_job", **action["spec"])
+            if kind == "replace":
+                try:
+                    self.tool._call("delete_scheduled_job", action["job_id"])
+                except Exception as error:
+                    raise _ReplaceIncomplete(result, error) from error
+        self._applied(action, result)
+        return result
+
+    async def _arun_action(self, action: Dict[str, Any]) -> Any:
+        kind = action["action"]
+        if kind == "delete":
+            result = await self.tool._acall("delete_scheduled_job", action["job_id"])
+        elif kind == "update":
+            result = await self.tool._acall(
+                "update_scheduled_job", job_id=action["job_id"], **action["changes"]
+            )
+        else:
+            result = await self.tool._acall("create_scheduled_job", **action["spec"])
+            if kind == "replace":
+                try:
+                    await self.tool._acall("delete_scheduled_job", action["job_id"])
+                except Exception as error:
+                    raise _ReplaceIncomplete(result, error) from error
+        self._applied(action, result)
+        return result
+
+    def _outcome(
+        self, action: Dict[str, Any], result: Any, error: Optional[BaseException]
+    ) -> Dict[str, Any]:
+        if error is not None:
+            self.invalidate()
+        if isinstance(error, _ReplaceIncomplete):
+            result = error.created
+        return {
+            "action": action["action"],
+            "job_name": action["job_name"],
+            "job_id": action["job_id"],
+            "result": result,
+            "error": None if error is None else str(error) or type(error).__name__,
+        }
+
+    def apply(
+        self, plan: ReconcilePlan, max_concurrency: int = 8
+    ) -> Iterator[Dict[str, Any]]:
+        """Make the calls of ``plan`` concurrently.
+
+        Yields:
+            dict: ``{"action", "job_name", "job_id", "result", "error"}`` per
+            action, as calls complete. A failure never stops the others. A
+            replace whose old job could not be deleted has the new job as
+            ``result`` and an ``error`` saying both jobs now exist.
+        """
+        results = map_as_completed(self._run_action, plan.actions, max_concurrency)
+        with closing(results):
+            for action, result, error in results:
+                yield self._outcome(action, result, error)
+
+    async def aapply(
+        self, plan: ReconcilePlan, max_concurrency: int = 8
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async counterpart of ``apply``."""
+        results = amap_as_completed(self._arun_action, plan.actions, max_concurrency)
+        async with aclosing(results):
+            async for action, result, error in results:
+                yield self._outcome(action, result, error)
+
+
+def _action(
+    kind: str,
+    job_name: Optional[str],
+    job_id: Any = None,
+    changes: Optional[Dict[str, Any]] = None,
+    spec: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    return {
+        "action": kind,
+        "job_name": job_name,
+        "job_id": job_id,
+        "changes": changes or {},
+        "spec": spec,
+    }
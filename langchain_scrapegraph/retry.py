@@ -0,0 +1,202 @@
+"""Retry policy for transient ScrapeGraph API failures."""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, FrozenSet, Optional, Tuple, Type, TypeVar
+
+from .deadline import DeadlineExceeded, current_deadline
+
+R = TypeVar("R")
+
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+RETRYABLE_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+)
+
+
+class RetryBudget:
+    """Caps retries to a fraction of recent requests.
+
+    During an outage every request fails, and unbounded retries would
+    multiply the load on an API that is already struggling. The budget allows
+    ``ratio`` retries per request seen over the last ``window`` seconds, plus
+    ``min_retries`` so that a quiet process can still retry at all.
+
+    Args:
+        ratio: Retries allowed per request, e.g. 0.2 for 20%.
+        min_retries: Retries always allowed per window.
+        window: Seconds of history taken into account.
+        timer: Monotonic clock, mainly to ease testing.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries: int = 10,
+        window: float = 10.0,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._timer = timer
+        self._lock = threading.Lock()
+        # [requests, retries] for the current and previous window.
+        self._current = [0, 0]
+        self._previous = [0, 0]
+        self._rotated_at = timer()
+
+    def _rotate(self) -> None:
+        elapsed = self._timer() - self._rotated_at
+        if elapsed >= self.window:
+            self._previous = self._current if elapsed < 2 * self.window else [0, 0]
+            self._current = [0, 0]
+            self._rotated_at = self._timer()
+
+    def record_request(self) -> None:
+        """Count one original (non-retry) request."""
+        with self._lock:
+            self._rotate()
+            self._current[0] += 1
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False if it is exhausted."""
+        with self._lock:
+            self._rotate()
+            requests = self._current[0] + self._previous[0]
+            retries = self._current[1] + self._previous[1]
+            if retries >= self.min_retries + self.ratio * requests:
+                return False
+            self._current[1] += 1
+            return True
+
+
+retry_budget = RetryBudget()
+
+
+class RetryPolicy:
+    """Retries transient failures with exponential backoff and full jitter.
+
+    A failure is retried if it is an ``APIError`` with a status code in
+    ``retry_status_codes`` or an instance of ``retry_exceptions``, while
+    attempts remain, the next attempt would start within ``max_elapsed``
+    seconds of the first and before the current deadline, and the retry
+    budget allows it. The wait before
+    retry ``n`` is drawn uniformly from ``[0, min(max_delay, base_delay * 2**n))``.
+
+    Args:
+        max_attempts: Total attempts including the first one.
+        base_delay: Backoff ceiling for the first retry, in seconds.
+        max_delay: Upper bound on any single backoff.
+        max_elapsed: Give up once this many seconds have passed. ``None``
+            disables the limit.
+        retry_status_codes: HTTP status codes worth retrying.
+        retry_exceptions: Exception types worth retrying.
+        budget: Retry budget to draw from; defaults to the process-wide
+            ``retry_budget``.
+        use_budget: Set to False to retry without consulting any budget.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_scrapegraph.retry import RetryPolicy
+            from langchain_scrapegraph.tools import SmartScraperTool
+
+            tool = SmartScraperTool(
+                retry_policy=RetryPolicy(max_attempts=5, max_elapsed=30)
+            )
+            # Or disable retries
+            tool = SmartScraperTool(retry_policy=None)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        max_elapsed: Optional[float] = 30.0,
+        retry_status_codes: FrozenSet[int] = RETRYABLE_STATUS_CODES,
+        retry_exceptions: Tuple[Type[BaseException], ...] = RETRYABLE_EXCEPTIONS,
+        budget: Optional[RetryBudget] = None,
+        use_budget: bool = True,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_exceptions = retry_exceptions
+        self.budget = (budget or retry_budget) if use_budget else None
+
+    def is_retryable(self, error: BaseException) -> bool:
+        if isinstance(error, DeadlineExceeded):
+            return False
+        status_code = getattr(error, "status_code", None)
+        if status_code is not None:
+            return status_code in self.retry_status_codes
+        return isinstance(error, self.retry_exceptions)
+
+    def backoff(self, retry: int) -> float:
+        """Return a jittered delay before retry number ``retry`` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+    def _next_delay(
+        self, error: BaseException, attempt: int, started: float
+    ) -> Optional[float]:
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        delay = self.backoff(attempt - 1)
+        if (
+            self.max_elapsed is not None
+            and time.monotonic() - started + delay > self.max_elapsed
+        ):
+            return None
+        current = current_deadline()
+        if current is not None and delay >= current.remaining():
+            return None
+        if self.budget is not None and not self.budget.try_spend():
+            return None
+        return delay
+
+    def call(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Call ``fn`` and retry it according to the policy."""
+        if self.budget is not None:
+            self.budget.record_request()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+
+    async def acall(
+        self, fn: Callable[..., Awaitable[R]], *args: Any, **kwargs: Any
+    ) -> R:
+        """Await ``fn`` and retry it according to the policy.
+
+        Cancelling the caller interrupts both a running attempt and a backoff.
+        """
+        if self.budget is not None:
+            self.budget.record_request()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
@@ -1,21 +1,60 @@
-from .agentic_scraper import AgenticScraperTool
-from .credits import GetCreditsTool
-from .markdownify import MarkdownifyTool
-from .scheduled_jobs import (
-    CreateScheduledJobTool,
-    DeleteScheduledJobTool,
-    GetJobExecutionsTool,
-    GetScheduledJobsTool,
-    GetScheduledJobTool,
-    PauseScheduledJobTool,
-    ResumeScheduledJobTool,
-    TriggerScheduledJobTool,
-    UpdateScheduledJobTool,
-)
-from .scrape import ScrapeTool
-from .searchscraper import SearchScraperTool
-from .smartcrawler import SmartCrawlerTool
-from .smartscraper import SmartScraperTool
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .agentic_scraper import AgenticScraperTool
+    from .credits import GetCreditsTool
+    from .markdownify import MarkdownifyTool
+    from .scheduled_jobs import (
+        CreateScheduledJobTool,
+        DeleteScheduledJobTool,
+        GetJobExecutionsTool,
+        GetScheduledJobsTool,
+        GetScheduledJobTool,
+        PauseScheduledJobTool,
+        ResumeScheduledJobTool,
+        TriggerScheduledJobTool,
+        UpdateScheduledJobTool,
+    )
+    from .scrape import ScrapeTool
+    from .searchscraper import SearchScraperTool
+    from .smartcrawler import SmartCrawlerTool
+    from .smartscraper import SmartScraperTool
+
+# Tool modules are imported on first attribute access so that importing this
+# package only pays for the tools that are actually used.
+_MODULE_BY_NAME = {
+    "AgenticScraperTool": "agentic_scraper",
+    "CreateScheduledJobTool": "scheduled_jobs",
+    "DeleteScheduledJobTool": "scheduled_jobs",
+    "GetCreditsTool": "credits",
+    "GetJobExecutionsTool": "scheduled_jobs",
+    "GetScheduledJobsTool": "scheduled_jobs",
+    "GetScheduledJobTool": "scheduled_jobs",
+    "MarkdownifyTool": "markdownify",
+    "PauseScheduledJobTool": "scheduled_jobs",
+    "ResumeScheduledJobTool": "scheduled_jobs",
+    "ScrapeTool": "scrape",
+    "SearchScraperTool": "searchscraper",
+    "SmartCrawlerTool": "smartcrawler",
+    "SmartScraperTool": "smartscraper",
+    "TriggerScheduledJobTool": "scheduled_jobs",
+    "UpdateScheduledJobTool": "scheduled_jobs",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "AgenticScraperTool",
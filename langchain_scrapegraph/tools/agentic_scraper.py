@@ -1,16 +1,30 @@
 # Models for agentic scraper endpoint
 
-from typing import Any, Dict, List, Optional, Type
+from contextlib import aclosing, closing
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+)
 from uuid import UUID
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
-from langchain_core.tools import BaseTool
-from langchain_core.utils import get_from_dict_or_env
 from pydantic import BaseModel, Field, model_validator
-from scrapegraph_py import Client
+
+from ..concurrency import amap_as_completed, map_as_completed
+from ..polling import PendingJob, PollBackoff, job_id_from
+from .base import ScrapeGraphBaseTool
+
+AGENTIC_REQUEST_ID_KEYS = ("request_id", "id")
 
 
 class AgenticScraperRequest(BaseModel):
@@ -102,7 +116,7 @@ class GetAgenticScraperRequest(BaseModel):
         return self
 
 
-class AgenticScraperTool(BaseTool):
+class AgenticScraperTool(ScrapeGraphBaseTool):
     """Tool for performing agentic web scraping using ScrapeGraph AI.
 
     This tool allows you to define a series of steps to perform on a webpage,
@@ -127,6 +141,7 @@ class AgenticScraperTool(BaseTool):
         client: Optional pre-configured ScrapeGraph client instance.
         llm_output_schema: Optional Pydantic model or dictionary schema to structure the output.
                       If provided, the tool will ensure the output conforms to this schema.
+        poll_backoff: Optional ``PollBackoff`` setting how often running sessions are polled.
 
     Instantiate:
         .. code-block:: python
@@ -173,9 +188,38 @@ class AgenticScraperTool(BaseTool):
                 }
             })
 
+    Submit and poll:
+        Sessions run in the background: ``invoke`` submits the steps and polls
+        the returned request id with growing intervals until the session
+        finishes. ``submit`` returns the handle instead, and ``resume`` picks
+        up a session by request id later on, e.g. after a timeout, without
+        running (and paying for) it again:
+
+        .. code-block:: python
+
+            job = tool.submit(url="https://example.com/login", steps=steps)
+            request_id = job.job_id
+            ...
+            result = tool.resume(request_id).result(timeout=300)
+
+    Batches:
+        ``scrape_many`` runs the same steps, after a shared ``prefix_steps``
+        such as a login, on many pages with a bounded number of sessions in
+        flight:
+
+        .. code-block:: python
+
+            for item in tool.scrape_many(
+                dashboard_urls,
+                steps=["Open the billing tab"],
+                prefix_steps=login_steps,
+                max_concurrency=4,
+            ):
+                print(item["url"], item["error"] or item["result"])
     """
 
     name: str = "agentic_scraper"
+    service: ClassVar[str] = "agenticscraper"
     description: str = (
         "Perform agentic web scraping by executing a series of steps on a webpage. "
         "Supports form filling, button clicking, navigation, and AI-powered data extraction."
@@ -183,19 +227,160 @@ class AgenticScraperTool(BaseTool):
     args_schema: Type[BaseModel] = AgenticScraperRequest
     return_direct: bool = False
 
-    api_key: Optional[str] = Field(default=None, description="ScrapeGraph AI API key")
-    client: Optional[Client] = Field(
-        default=None, description="ScrapeGraph client instance"
-    )
     llm_output_schema: Optional[Type[BaseModel]] = Field(
         default=None, description="Optional Pydantic model to structure the output"
     )
+    poll_backoff: PollBackoff = Field(default_factory=PollBackoff)
+
+    def _payload(
+        self,
+        url: str,
+        steps: List[str],
+        use_session: bool,
+        user_prompt: Optional[str],
+        output_schema: Optional[Dict[str, Any]],
+        ai_extraction: bool,
+    ) -> Dict[str, Any]:
+        payload = {
+            "url": url,
+            "use_session": use_session,
+            "steps": steps,
+            "ai_extraction": ai_extraction,
+        }
+        if ai_extraction and user_prompt:
+            payload["user_prompt"] = user_prompt
+            if output_schema:
+                payload["output_schema"] = output_schema
+        return payload
+
+    def _job(self, response: Any) -> PendingJob:
+        return PendingJob(
+            self,
+            "get_agenticscraper",
+            job_id_from(response, AGENTIC_REQUEST_ID_KEYS),
+            response,
+            self.poll_backoff,
+        )
+
+    def submit(
+        self,
+        url: str,
+        steps: List[str],
+        use_session: bool = True,
+        user_prompt: Optional[str] = None,
+        output_schema: Optional[Dict[str, Any]] = None,
+        ai_extraction: bool = False,
+    ) -> PendingJob:
+        """Start a scraping session and return a handle on it without waiting."""
+        response = self._call(
+            "agenticscraper",
+            **self._payload(
+                url, steps, use_session, user_prompt, output_schema, ai_extraction
+            ),
+        )
+        return self._job(response)
+
+    async def asubmit(
+        self,
+        url: str,
+        steps: List[str],
+        use_session: bool = True,
+        user_prompt: Optional[str] = None,
+        output_schema: Optional[Dict[str, Any]] = None,
+        ai_extraction: bool = False,
+    ) -> PendingJob:
+        """Async counterpart of ``submit``."""
+        response = await self._acall(
+            "agenticscraper",
+            **self._payload(
+                url, steps, use_session, user_prompt, output_schema, ai_extraction
+            ),
+        )
+        return self._job(response)
+
+    def resume(self, request_id: str) -> PendingJob:
+        """Return a handle on a session submitted earlier, by its request id.
+
+        Nothing is sent until the handle is polled or waited on, and the
+        session is never run again.
+        """
+        GetAgenticScraperRequest(request_id=request_id)
+        job = PendingJob(
+            self,
+            "get_agenticscraper",
+            request_id,
+            {"request_id": request_id},
+            self.poll_backoff,
+        )
+        job.submitted_at = None
+        return job
+
+    def scrape_many(
+        self,
+        urls: Iterable[str],
+        steps: List[str],
+        prefix_steps: Optional[List[str]] = None,
+        max_concurrency: int = 4,
+        user_prompt: Optional[str] = None,
+        output_schema: Optional[Dict[str, Any]] = None,
+        ai_extraction: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Run the same steps on many pages, yielding results as they complete.
+
+        Every page is its own session: the API keeps no browser state between
+        calls, so ``prefix_steps`` (typically a login) are sent with the
+        ``steps`` of each page. Up to ``max_concurrency`` sessions run at a
+        time.
+
+        Args:
+            urls: Pages to scrape; consumed lazily
+            steps: Steps to perform on every page
+            prefix_steps: Steps to perform first on every page
+            max_concurrency: Maximum number of sessions in flight
+            user_prompt: Prompt for AI extraction
+            output_schema: Schema for AI extraction
+            ai_extraction: Whether to use AI extraction
+
+        Yields:
+            dict: ``{"url", "result", "error"}`` per URL. A failed page has
+            ``result`` set to None and ``error`` to its message instead of
+            aborting the batch.
+        """
+        all_steps = [*(prefix_steps or []), *steps]
+
+        def scrape(url: str) -> Any:
+            return self.submit(
+                url, all_steps, True, user_prompt, output_schema, ai_extraction
+            ).result()
+
+        results = map_as_completed(scrape, urls, max_concurrency)
+        with closing(results):
+            for url, result, error in results:
+                yield _batch_item(url, result, error)
+
+    async def ascrape_many(
+        self,
+        urls: Iterable[str],
+        steps: List[str],
+        prefix_steps: Optional[List[str]] = None,
+        max_concurrency: int = 4,
+        user_prompt: Optional[str] = None,
+        output_schema: Optional[Dict[str, Any]] = None,
+        ai_extraction: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async counterpart of :meth:`scrape_many`."""
+        all_steps = [*(prefix_steps or []), *steps]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.api_key = get_from_dict_or_env(kwargs, "api_key", "SGAI_API_KEY")
-        if not self.client:
-            self.client = Client(api_key=self.api_key)
+        async def scrape(url: str) -> Any:
+            job = await self.asubmit(
+                url, all_steps, True, user_prompt, output_schema, ai_extraction
+            )
+            return await job.aresult()
+
+        results = amap_as_completed(scrape, urls, max_concurrency)
+        async with aclosing(results):
+            async for url, result, error in results:
+                yield _batch_item(url, result, error)
 
     def _run(
         self,
@@ -207,25 +392,12 @@ class AgenticScraperTool(BaseTool):
         ai_extraction: bool = False,
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> Dict[str, Any]:
-        """Run the agentic scraper tool."""
+        """Run the agentic scraper tool and wait for the session's result."""
         try:
-            # Prepare the request payload
-            payload = {
-                "url": url,
-                "use_session": use_session,
-                "steps": steps,
-                "ai_extraction": ai_extraction,
-            }
-
-            if ai_extraction and user_prompt:
-                payload["user_prompt"] = user_prompt
-                if output_schema:
-                    payload["output_schema"] = output_schema
-
-            # Call the ScrapeGraph API
-            response = self.client.agentic_scraper(**payload)
-
-            return response
+            job = self.submit(
+                url, steps, use_session, user_prompt, output_schema, ai_extraction
+            )
+            return job.result()
 
         except Exception as e:
             if run_manager:
@@ -243,14 +415,23 @@ class AgenticScraperTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> Dict[str, Any]:
         """Run the agentic scraper tool asynchronously."""
-        # For now, just call the sync version
-        # In a real implementation, you might want to use async HTTP client
-        return self._run(
-            url=url,
-            steps=steps,
-            use_session=use_session,
-            user_prompt=user_prompt,
-            output_schema=output_schema,
-            ai_extraction=ai_extraction,
-            run_manager=run_manager,
-        )
+        try:
+            job = await self.asubmit(
+                url, steps, use_session, user_prompt, output_schema, ai_extraction
+            )
+            return await job.aresult()
+
+        except Exception as e:
+            if run_manager:
+                await run_manager.on_tool_error(e, tool_name=self.name)
+            raise e
+
+
+def _batch_item(
+    url: str, result: Any, error: Optional[BaseException]
+) -> Dict[str, Any]:
+    return {
+        "url": url,
+        "result": result,
+        "error": None if error is None else str(error) or type(error).__name__,
+    }
@@ -0,0 +1,257 @@
+import asyncio
+import threading
+import time
+from typing import Any, ClassVar, Dict, Optional
+
+from langchain_core.tools import BaseTool
+from langchain_core.utils import get_from_dict_or_env
+from pydantic import Field, PrivateAttr, model_validator
+from scrapegraph_py import AsyncClient, Client
+
+from ..circuit_breaker import circuit_breakers
+from ..clients import client_registry
+from ..concurrency import adaptive_concurrency
+from ..deadline import DeadlineExceeded, current_deadline, deadline, enforce_deadlines
+from ..ledger import credit_ledger
+from ..metrics import metrics
+from ..ratelimit import RateLimitCancelled, current_cancel_event, rate_limiter
+from ..retry import RetryPolicy
+
+
+class ScrapeGraphBaseTool(BaseTool):
+    """Common base for the ScrapeGraph AI tools.
+
+    Resolves the API key and holds both the sync ``Client`` used by ``_run``
+    and the ``AsyncClient`` used by ``_arun``. Unless a client is passed in,
+    tools borrow a pooled client from the process-wide registry on their first
+    run, so every tool sharing an API key also shares one HTTP connection pool.
+
+    Key init args:
+        api_key: Your ScrapeGraph AI API key. If not provided, will look for SGAI_API_KEY env var.
+        client: Optional pre-configured ScrapeGraph client instance.
+        async_client: Optional pre-configured async ScrapeGraph client instance.
+        retry_policy: Optional ``RetryPolicy`` for transient API failures. Tools
+            whose calls are safe to repeat retry by default; scheduled-job
+            tools do not. When set, the pooled clients' built-in SDK retries
+            are turned off.
+        timeout: Optional deadline in seconds for each API call, retries
+            included. Use ``langchain_scrapegraph.deadline.deadline`` to bound
+            a single invocation instead.
+        client_settings: Optional transport settings of the pooled clients,
+            e.g. ``{"timeout": 60, "pool_maxsize": 32}``; see
+            ``langchain_scrapegraph.clients.ClientRegistry``. Tools with the
+            same API key and settings share a client. Ignored when a client
+            is passed in.
+
+    Resilience:
+        Each API call is retried per ``retry_policy``. Every attempt first
+        passes the circuit breaker of the tool's ``service`` (see
+        ``langchain_scrapegraph.circuit_breaker``), then waits on the shared
+        ``rate_limiter`` for the tool's API key and ``service`` (see
+        ``langchain_scrapegraph.ratelimit``; ``cancel_on`` makes that wait
+        interruptible), then for a slot in the adaptive
+        concurrency limiter if one is configured (see
+        ``langchain_scrapegraph.concurrency``). Call latencies are recorded
+        under ``"<service>.latency"`` in ``langchain_scrapegraph.metrics``,
+        and successful calls are charged to the local ``credit_ledger`` (see
+        ``langchain_scrapegraph.ledger``).
+
+    Lifecycle:
+        Call ``close()`` (or ``await aclose()``) when the tool is no longer
+        needed to hand its pooled clients back. Clients passed in by the caller
+        are never closed by the tool.
+    """
+
+    service: ClassVar[Optional[str]] = None
+
+    client: Optional[Client] = None
+    async_client: Optional[AsyncClient] = None
+    retry_policy: Optional[RetryPolicy] = None
+    timeout: Optional[float] = None
+    client_settings: Dict[str, Any] = Field(default_factory=dict)
+    api_key: str
+
+    _client_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _owns_client: bool = PrivateAttr(default=False)
+    _owns_async_client: bool = PrivateAttr(default=False)
+    _async_client_loop: Optional[asyncio.AbstractEventLoop] = PrivateAttr(default=None)
+    _transport_ready: bool = PrivateAttr(default=False)
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_environment(cls, values: Dict) -> Dict:
+        """Validate that api key exists in environment."""
+        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
+        return values
+
+    def _transport_settings(self, sync: bool) -> Dict[str, Any]:
+        """Settings of the pooled clients this tool borrows.
+
+        ``client_settings``, on top of which, with tool-level retries on,
+        the SDK's own retries are turned off unless set explicitly, so that
+        each ``RetryPolicy`` attempt is a single HTTP request. The sync SDK
+        counts retries, the async SDK counts attempts.
+        """
+        settings: Dict[str, Any] = {}
+        if self.retry_policy is not None:
+            settings["max_retries"] = 0 if sync else 1
+        settings.update(self.client_settings)
+        return settings
+
+    def _retry_policy_for(self, method: str) -> Optional[RetryPolicy]:
+        """The retry policy applied to calls of ``method``."""
+        return self.retry_policy
+
+    def _get_client(self) -> Client:
+        """Return the sync client, borrowing the pooled one on first use.
+
+        Nothing is built at construction time, so creating a tool stays cheap
+        until it is actually run.
+        """
+        if self.client is None:
+            with self._client_lock:
+                if self.client is None:
+                    self.client = client_registry.acquire(
+                        self.api_key, **self._transport_settings(sync=True)
+                    )
+                    self._owns_client = True
+                    self._transport_ready = False
+        if not self._transport_ready:
+            enforce_deadlines(self.client)
+            self._transport_ready = True
+        return self.client
+
+    def _get_async_client(self) -> AsyncClient:
+        """Return an async client usable from the running event loop.
+
+        The underlying aiohttp session is bound to the loop it was created on,
+        so the pooled client is acquired on first use and swapped for the
+        current loop's client if the tool is later driven from another loop.
+        Caller-provided clients are used as-is.
+        """
+        loop = asyncio.get_running_loop()
+        if self.async_client is not None and (
+            not self._owns_async_client or self._async_client_loop is loop
+        ):
+            return self.async_client
+        if self._owns_async_client:
+            client_registry.release_async(self.async_client)
+        self.async_client = client_registry.acquire_async(
+            self.api_key, **self._transport_settings(sync=False)
+        )
+        self._owns_async_client = True
+        self._async_client_loop = loop
+        return self.async_client
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call ``method`` on the sync client, retrying per ``retry_policy``.
+
+        The call, retries included, must finish within ``timeout`` and any
+        enclosing ``deadline``; the remaining time bounds each HTTP request.
+        """
+        policy = self._retry_policy_for(method)
+        with deadline(self.timeout):
+            if policy is None:
+                return self._attempt(method, *args, **kwargs)
+            return policy.call(self._attempt, method, *args, **kwargs)
+
+    def _attempt(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        breaker = circuit_breakers.get(self.service)
+        return breaker.call(self._limited, method, *args, **kwargs)
+
+    def _limited(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        current = current_deadline()
+        cancel = current_cancel_event()
+        if not rate_limiter.acquire(
+            self.api_key,
+            self.service,
+            timeout=None if current is None else current.remaining(),
+            cancel=cancel,
+        ):
+            if cancel is not None and cancel.is_set():
+                raise RateLimitCancelled("cancelled waiting for the rate limit")
+            raise DeadlineExceeded("deadline exceeded waiting for the rate limit")
+        limiter = adaptive_concurrency.get(self.api_key, self.service)
+        if limiter is not None:
+            return limiter.call(self._send, method, *args, **kwargs)
+        return self._send(method, *args, **kwargs)
+
+    def _send(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        started = time.monotonic()
+        response = getattr(self._get_client(), method)(*args, **kwargs)
+        metrics.observe(f"{self.service}.latency", time.monotonic() - started)
+        credit_ledger.record_call(self.api_key, method, kwargs)
+        return response
+
+    async def _acall(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Await ``method`` on the async client, retrying per ``retry_policy``.
+
+        Once ``timeout`` or an enclosing ``deadline`` expires, the in-flight
+        request is cancelled, which aborts it and frees its connection.
+        """
+        with deadline(self.timeout) as current:
+            if current is None:
+                return await self._aretrying(method, *args, **kwargs)
+            try:
+                return await asyncio.wait_for(
+                    self._aretrying(method, *args, **kwargs), current.remaining()
+                )
+            except asyncio.TimeoutError:
+                if current.expired:
+                    raise DeadlineExceeded("deadline exceeded") from None
+                raise
+
+    async def _aretrying(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        policy = self._retry_policy_for(method)
+        if policy is None:
+            return await self._aattempt(method, *args, **kwargs)
+        return await policy.acall(self._aattempt, method, *args, **kwargs)
+
+    async def _aattempt(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        breaker = circuit_breakers.get(self.service)
+        return await breaker.acall(self._alimited, method, *args, **kwargs)
+
+    async def _alimited(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        await rate_limiter.aacquire(self.api_key, self.service)
+        limiter = adaptive_concurrency.get(self.api_key, self.service)
+        if limiter is not None:
+            return await limiter.acall(self._asend, method, *args, **kwargs)
+        return await self._asend(method, *args, **kwargs)
+
+    async def _asend(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        started = time.monotonic()
+        try:
+            response = await getattr(self._get_async_client(), method)(*args, **kwargs)
+        except asyncio.CancelledError:
+            # Cancelled by the deadline while waiting on the API: report it
+            # like the sync transport does, so the breaker and AIMD see it.
+            current = current_deadline()
+            if current is not None and current.expired:
+                raise DeadlineExceeded(
+                    "deadline exceeded during request", during_request=True
+                ) from None
+            raise
+        metrics.observe(f"{self.service}.latency", time.monotonic() - started)
+        credit_ledger.record_call(self.api_key, method, kwargs)
+        return response
+
+    def close(self) -> None:
+        """Release the pooled sync client held by this tool.
+
+        Async clients need an event loop to close; use ``aclose`` for those.
+        The tool stays usable and borrows a client again on its next run.
+        """
+        with self._client_lock:
+            if self._owns_client and self.client is not None:
+                client_registry.release(self.client)
+                self.client = None
+                self._owns_client = False
+
+    async def aclose(self) -> None:
+        """Release both pooled clients held by this tool."""
+        self.close()
+        if self._owns_async_client and self.async_client is not None:
+            await client_registry.arelease(self.async_client)
+            self.async_client = None
+            self._owns_async_client = False
+            self._async_client_loop = None
@@ -1,16 +1,17 @@
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Optional
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
-from langchain_core.tools import BaseTool
-from langchain_core.utils import get_from_dict_or_env
-from pydantic import model_validator
-from scrapegraph_py import Client
+from pydantic import Field
 
+from ..ledger import credit_ledger
+from ..retry import RetryPolicy
+from .base import ScrapeGraphBaseTool
 
-class GetCreditsTool(BaseTool):
+
+class GetCreditsTool(ScrapeGraphBaseTool):
     """Tool for checking remaining credits on your ScrapeGraph AI account.
 
     Setup:
@@ -30,6 +31,8 @@ class GetCreditsTool(BaseTool):
     Key init args:
         api_key: Your ScrapeGraph AI API key. If not provided, will look for SGAI_API_KEY env var.
         client: Optional pre-configured ScrapeGraph client instance.
+        use_ledger: Answer from the local ``credit_ledger`` while its balance
+            is fresh (default True). Set to False to always ask the server.
 
     Instantiate:
         .. code-block:: python
@@ -57,36 +60,42 @@ class GetCreditsTool(BaseTool):
         .. code-block:: python
 
             result = await tool.ainvoke({})
+
+    Local accounting:
+        The balance is fetched once and then kept up to date locally from the
+        documented cost of every call made through the tools, so repeated
+        budget checks do not hit the API. It is reconciled with the server
+        periodically and after large local spending; see
+        ``langchain_scrapegraph.ledger.CreditLedger``.
     """
 
     name: str = "GetCredits"
+    service: ClassVar[str] = "credits"
     description: str = (
         "Get the current credits available in your ScrapeGraph AI account"
     )
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
+    retry_policy: Optional[RetryPolicy] = Field(default_factory=RetryPolicy)
+    use_ledger: bool = True
 
     def __init__(self, **data: Any):
         super().__init__(**data)
 
     def _run(self, run_manager: Optional[CallbackManagerForToolRun] = None) -> dict:
         """Get the available credits."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-        return self.client.get_credits()
+        if not self.use_ledger:
+            return self._call("get_credits")
+        if credit_ledger.needs_refresh(self.api_key):
+            credit_ledger.update(self.api_key, self._call("get_credits"))
+        return credit_ledger.balance(self.api_key)
 
     async def _arun(
         self,
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
-    ) -> int:
+    ) -> dict:
         """Get the available credits asynchronously."""
-        return self._run(run_manager=run_manager.get_sync() if run_manager else None)
+        if not self.use_ledger:
+            return await self._acall("get_credits")
+        if credit_ledger.needs_refresh(self.api_key):
+            credit_ledger.update(self.api_key, await self._acall("get_credits"))
+        return credit_ledger.balance(self.api_key)
@@ -1,20 +1,22 @@
-from typing import Any, Dict, Optional, Type
+from typing import Any, ClassVar, Optional, Type
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
-from langchain_core.tools import BaseTool
-from langchain_core.utils import get_from_dict_or_env
-from pydantic import BaseModel, Field, model_validator
-from scrapegraph_py import Client
+from pydantic import BaseModel, Field
+
+from ..cache import BaseCache, canonicalize_url, hash_value, make_cache_key
+from ..concurrency import request_coalescer
+from ..retry import RetryPolicy
+from .base import ScrapeGraphBaseTool
 
 
 class MarkdownifyInput(BaseModel):
     website_url: str = Field(description="Url of the website to convert to Markdown")
 
 
-class MarkdownifyTool(BaseTool):
+class MarkdownifyTool(ScrapeGraphBaseTool):
     """Tool for converting webpages to Markdown format using ScrapeGraph AI.
 
     Setup:
@@ -34,6 +36,9 @@ class MarkdownifyTool(BaseTool):
     Key init args:
         api_key: Your ScrapeGraph AI API key. If not provided, will look for SGAI_API_KEY env var.
         client: Optional pre-configured ScrapeGraph client instance.
+        cache: Optional cache (e.g. ``InMemoryCache`` or ``SQLiteCache``) for converted pages.
+        coalesce_requests: If True (default), identical concurrent requests share a single API call.
+        retry_policy: Retry policy for transient failures (default ``RetryPolicy()``); None disables retries.
 
     Instantiate:
         .. code-block:: python
@@ -46,6 +51,11 @@ class MarkdownifyTool(BaseTool):
             # Or provide API key directly
             tool = MarkdownifyTool(api_key="your-api-key")
 
+            # Share converted pages between worker processes:
+            from langchain_scrapegraph.cache import SQLiteCache
+
+            tool = MarkdownifyTool(cache=SQLiteCache("/var/cache/sgai.db"))
+
     Use the tool:
         .. code-block:: python
 
@@ -67,34 +77,48 @@ class MarkdownifyTool(BaseTool):
     """
 
     name: str = "Markdownify"
+    service: ClassVar[str] = "markdownify"
     description: str = (
         "Useful when you need to convert a webpage to Markdown, given a URL as input"
     )
     args_schema: Type[BaseModel] = MarkdownifyInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
+    retry_policy: Optional[RetryPolicy] = Field(default_factory=RetryPolicy)
+    cache: Optional[BaseCache] = None
+    coalesce_requests: bool = True
 
     def __init__(self, **data: Any):
         super().__init__(**data)
 
+    def _request_key(self, website_url: str) -> str:
+        return make_cache_key(
+            "markdownify", hash_value(self.api_key), canonicalize_url(website_url)
+        )
+
     def _run(
         self,
         website_url: str,
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Use the tool to extract data from a website."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-        response = self.client.markdownify(website_url=website_url)
+        request_key = self._request_key(website_url)
+        if self.cache is not None:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                return cached
+
+        if self.coalesce_requests:
+            return request_coalescer.do(
+                request_key, self._convert, request_key, website_url
+            )
+        return self._convert(request_key, website_url)
+
+    def _convert(self, request_key: str, website_url: str) -> str:
+        """Send one markdownify request and cache its result."""
+        response = self._call("markdownify", website_url=website_url)
+
+        if self.cache is not None and not response.get("error"):
+            self.cache.set(request_key, response["result"])
         return response["result"]
 
     async def _arun(
@@ -103,7 +127,22 @@ class MarkdownifyTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> str:
         """Use the tool asynchronously."""
-        return self._run(
-            website_url,
-            run_manager=run_manager.get_sync() if run_manager else None,
-        )
+        request_key = self._request_key(website_url)
+        if self.cache is not None:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                return cached
+
+        if self.coalesce_requests:
+            return await request_coalescer.ado(
+                request_key, self._aconvert, request_key, website_url
+            )
+        return await self._aconvert(request_key, website_url)
+
+    async def _aconvert(self, request_key: str, website_url: str) -> str:
+        """Send one markdownify request asynchronously and cache its result."""
+        response = await self._acall("markdownify", website_url=website_url)
+
+        if self.cache is not None and not response.get("error"):
+            self.cache.set(request_key, response["result"])
+        return response["result"]
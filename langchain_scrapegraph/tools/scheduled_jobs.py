@@ -1,13 +1,27 @@
-from typing import Any, Dict, Optional, Type
+from contextlib import aclosing, closing
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
-from langchain_core.tools import BaseTool
-from langchain_core.utils import get_from_dict_or_env
 from pydantic import BaseModel, Field, model_validator
-from scrapegraph_py import Client
+
+from ..concurrency import amap_as_completed, map_as_completed
+from ..cron import validate_cron
+from ..pagination import MAX_PAGE_SIZE, aiter_pages, iter_pages
+from .base import ScrapeGraphBaseTool
 
 
 class ServiceType:
@@ -34,6 +48,11 @@ class CreateScheduledJobInput(BaseModel):
         default=True, description="Whether the job should be active"
     )
 
+    @model_validator(mode="after")
+    def validate_cron_expression(self) -> "CreateScheduledJobInput":
+        validate_cron(self.cron_expression)
+        return self
+
 
 class GetScheduledJobsInput(BaseModel):
     page: int = Field(default=1, description="Page number for pagination")
@@ -62,6 +81,12 @@ class UpdateScheduledJobInput(BaseModel):
     )
     is_active: Optional[bool] = Field(default=None, description="New active status")
 
+    @model_validator(mode="after")
+    def validate_cron_expression(self) -> "UpdateScheduledJobInput":
+        if self.cron_expression is not None:
+            validate_cron(self.cron_expression)
+        return self
+
 
 class JobControlInput(BaseModel):
     job_id: str = Field(description="ID of the scheduled job")
@@ -73,7 +98,7 @@ class GetJobExecutionsInput(BaseModel):
     page_size: int = Field(default=10, description="Number of executions per page")
 
 
-class CreateScheduledJobTool(BaseTool):
+class CreateScheduledJobTool(ScrapeGraphBaseTool):
     """Tool for creating scheduled jobs with ScrapeGraph AI.
 
     This tool allows you to create recurring jobs that will automatically
@@ -81,22 +106,13 @@ class CreateScheduledJobTool(BaseTool):
     """
 
     name: str = "CreateScheduledJob"
+    service: ClassVar[str] = "scheduled_jobs"
     description: str = (
         "Create a new scheduled job that will run automatically at specified intervals. "
         "Supports SmartScraper, SearchScraper, SmartCrawler, and Markdownify services."
     )
     args_schema: Type[BaseModel] = CreateScheduledJobInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
 
     def _run(
         self,
@@ -108,10 +124,8 @@ class CreateScheduledJobTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Create a scheduled job."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-
-        response = self.client.create_scheduled_job(
+        response = self._call(
+            "create_scheduled_job",
             job_name=job_name,
             service_type=service_type,
             cron_expression=cron_expression,
@@ -130,35 +144,61 @@ class CreateScheduledJobTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> dict:
         """Create a scheduled job asynchronously."""
-        return self._run(
+        response = await self._acall(
+            "create_scheduled_job",
             job_name=job_name,
             service_type=service_type,
             cron_expression=cron_expression,
             job_config=job_config,
             is_active=is_active,
-            run_manager=run_manager.get_sync() if run_manager else None,
         )
+        return response
+
+
+class GetScheduledJobsTool(ScrapeGraphBaseTool):
+    """Tool for retrieving scheduled jobs from ScrapeGraph AI.
 
+    Full listings:
+        ``aiter_jobs`` walks every page, fetching the next ``prefetch`` pages
+        while the current one is consumed:
 
-class GetScheduledJobsTool(BaseTool):
-    """Tool for retrieving scheduled jobs from ScrapeGraph AI."""
+        .. code-block:: python
+
+            async for job in tool.aiter_jobs(service_type="smartscraper"):
+                print(job["id"], job["cron_expression"])
+    """
 
     name: str = "GetScheduledJobs"
+    service: ClassVar[str] = "scheduled_jobs"
     description: str = (
         "Retrieve a list of scheduled jobs with optional filtering by service type and active status."
     )
     args_schema: Type[BaseModel] = GetScheduledJobsInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
+    async def aiter_jobs(
+        self,
+        service_type: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: int = 4,
+    ) -> AsyncIterator[dict]:
+        """Yield every scheduled job matching the filters, page by page.
+
+        See ``langchain_scrapegraph.pagination.aiter_pages``.
+        """
+
+        async def fetch(page: int) -> Any:
+            return await self._acall(
+                "get_scheduled_jobs",
+                page=page,
+                page_size=page_size,
+                service_type=service_type,
+                is_active=is_active,
+            )
+
+        async for job in aiter_pages(fetch, "jobs", page_size, prefetch):
+            yield job
 
     def _run(
         self,
@@ -169,10 +209,8 @@ class GetScheduledJobsTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Get scheduled jobs."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-
-        response = self.client.get_scheduled_jobs(
+        response = self._call(
+            "get_scheduled_jobs",
             page=page,
             page_size=page_size,
             service_type=service_type,
@@ -189,32 +227,24 @@ class GetScheduledJobsTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> dict:
         """Get scheduled jobs asynchronously."""
-        return self._run(
+        response = await self._acall(
+            "get_scheduled_jobs",
             page=page,
             page_size=page_size,
             service_type=service_type,
             is_active=is_active,
-            run_manager=run_manager.get_sync() if run_manager else None,
         )
+        return response
 
 
-class GetScheduledJobTool(BaseTool):
+class GetScheduledJobTool(ScrapeGraphBaseTool):
     """Tool for retrieving a specific scheduled job by ID."""
 
     name: str = "GetScheduledJob"
+    service: ClassVar[str] = "scheduled_jobs"
     description: str = "Retrieve details of a specific scheduled job by its ID."
     args_schema: Type[BaseModel] = GetScheduledJobInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
 
     def _run(
         self,
@@ -222,10 +252,7 @@ class GetScheduledJobTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Get a specific scheduled job."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-
-        response = self.client.get_scheduled_job(job_id)
+        response = self._call("get_scheduled_job", job_id)
         return response
 
     async def _arun(
@@ -234,29 +261,18 @@ class GetScheduledJobTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> dict:
         """Get a specific scheduled job asynchronously."""
-        return self._run(
-            job_id=job_id,
-            run_manager=run_manager.get_sync() if run_manager else None,
-        )
+        response = await self._acall("get_scheduled_job", job_id)
+        return response
 
 
-class UpdateScheduledJobTool(BaseTool):
+class UpdateScheduledJobTool(ScrapeGraphBaseTool):
     """Tool for updating a scheduled job."""
 
     name: str = "UpdateScheduledJob"
+    service: ClassVar[str] = "scheduled_jobs"
     description: str = "Update properties of an existing scheduled job."
     args_schema: Type[BaseModel] = UpdateScheduledJobInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
 
     def _run(
         self,
@@ -268,10 +284,8 @@ class UpdateScheduledJobTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Update a scheduled job."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-
-        response = self.client.update_scheduled_job(
+        response = self._call(
+            "update_scheduled_job",
             job_id=job_id,
             job_name=job_name,
             cron_expression=cron_expression,
@@ -290,33 +304,196 @@ class UpdateScheduledJobTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> dict:
         """Update a scheduled job asynchronously."""
-        return self._run(
+        response = await self._acall(
+            "update_scheduled_job",
             job_id=job_id,
             job_name=job_name,
             cron_expression=cron_expression,
             job_config=job_config,
             is_active=is_active,
-            run_manager=run_manager.get_sync() if run_manager else None,
         )
+        return response
+
+
+class _JobControlTool(ScrapeGraphBaseTool):
+    """Base of the tools that act on a scheduled job by id.
+
+    Bulk control:
+        ``control_many``/``acontrol_many`` apply the tool's operation to many
+        jobs at once, either listed by id or selected by ``service_type`` and
+        ``is_active`` like ``GetScheduledJobsInput``. At most
+        ``max_concurrency`` requests run at a time, each through the tool's
+        rate limit (configure it for the ``"scheduled_jobs"`` service in
+        ``langchain_scrapegraph.ratelimit.rate_limiter``). Jobs selected by a
+        filter are listed in full before any of them is changed.
+
+        One outcome ``{"job_id", "result", "error", "skipped"}`` is yielded
+        per job as it completes; a failure never stops the others. Nothing is
+        requested for jobs already in the target state: a filter leaves out
+        jobs already paused (or resumed) unless ``is_active`` selects them,
+        in which case they are reported as skipped, and so are jobs already
+        deleted. Re-running a partially failed bulk operation is therefore
+        safe, except for triggers, which should be re-run for the failed ids
+        only:
+
+        .. code-block:: python
+
+            outcomes = list(PauseScheduledJobTool().control_many(is_active=True))
+            failed = [o["job_id"] for o in outcomes if o["error"]]
+    """
+
+    control_method: ClassVar[str]
+    # ``is_active`` of a job after the operation, if it sets one.
+    target_active: ClassVar[Optional[bool]] = None
+
+    def _already_done(self, error: BaseException) -> bool:
+        """Whether ``error`` means the job was already in the target state."""
+        return False
+
+    def _listing_active(self, is_active: Optional[bool]) -> Optional[bool]:
+        if is_active is None and self.target_active is not None:
+            return not self.target_active
+        return is_active
+
+    def _split(self, jobs: Iterable[dict]) -> Tuple[List[str], List[str]]:
+        """Split listed jobs into those to change and those already done."""
+        selected: List[str] = []
+        skipped: List[str] = []
+        for job in jobs:
+            done = (
+                self.target_active is not None
+                and job.get("is_active") == self.target_active
+            )
+            (skipped if done else selected).append(str(job["id"]))
+        return selected, skipped
+
+    def _outcome(
+        self, job_id: str, result: Any, error: Optional[BaseException]
+    ) -> Dict[str, Any]:
+        if error is not None and self._already_done(error):
+            return _control_item(job_id, None, None, skipped=True)
+        return _control_item(job_id, result, error)
+
+    def control_many(
+        self,
+        job_ids: Optional[Iterable[str]] = None,
+        service_type: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        max_concurrency: int = 8,
+    ) -> Iterator[Dict[str, Any]]:
+        """Apply the tool's operation to many scheduled jobs concurrently.
+
+        Args:
+            job_ids: Ids of the jobs to act on, e.g. a list (not a single
+                id string); duplicates are dropped
+            service_type: Act on the jobs of this service type instead
+            is_active: Act on the jobs with this active status instead
+            max_concurrency: Maximum number of requests in flight
+
+        Yields:
+            dict: ``{"job_id", "result", "error", "skipped"}`` per job, as
+            requests complete. ``error`` is the failure's message, if any.
+        """
+        if _selects_by_filter(job_ids, service_type, is_active):
+            listing = iter_pages(
+                lambda page: self._call(
+                    "get_scheduled_jobs",
+                    page=page,
+                    page_size=MAX_PAGE_SIZE,
+                    service_type=service_type,
+                    is_active=self._listing_active(is_active),
+                ),
+                "jobs",
+                MAX_PAGE_SIZE,
+            )
+            selected, skipped = self._split(list(listing))
+        else:
+            selected, skipped = list(dict.fromkeys(job_ids)), []
+        for job_id in skipped:
+            yield _control_item(job_id, None, None, skipped=True)
+        results = map_as_completed(
+            lambda job_id: self._call(self.control_method, job_id),
+            selected,
+            max_concurrency,
+        )
+        with closing(results):
+            for job_id, result, error in results:
+                yield self._outcome(job_id, result, error)
+
+    async def acontrol_many(
+        self,
+        job_ids: Optional[Iterable[str]] = None,
+        service_type: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        max_concurrency: int = 8,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async counterpart of :meth:`control_many`."""
+        if _selects_by_filter(job_ids, service_type, is_active):
+
+            async def fetch(page: int) -> Any:
+                return await self._acall(
+                    "get_scheduled_jobs",
+                    page=page,
+                    page_size=MAX_PAGE_SIZE,
+                    service_type=service_type,
+                    is_active=self._listing_active(is_active),
+                )
+
+            listing = [job async for job in aiter_pages(fetch, "jobs", MAX_PAGE_SIZE)]
+            selected, skipped = self._split(listing)
+        else:
+            selected, skipped = list(dict.fromkeys(job_ids)), []
+        for job_id in skipped:
+            yield _control_item(job_id, None, None, skipped=True)
+        results = amap_as_completed(
+            lambda job_id: self._acall(self.control_method, job_id),
+            selected,
+            max_concurrency,
+        )
+        async with aclosing(results):
+            async for job_id, result, error in results:
+                yield self._outcome(job_id, result, error)
+
+
+def _selects_by_filter(
+    job_ids: Optional[Iterable[str]],
+    service_type: Optional[str],
+    is_active: Optional[bool],
+) -> bool:
+    if isinstance(job_ids, str):
+        raise TypeError("job_ids must be an iterable of ids, not a single id string")
+    by_filter = service_type is not None or is_active is not None
+    if (job_ids is None) == (not by_filter):
+        raise ValueError(
+            "Pass either job_ids or a filter (service_type and/or is_active)"
+        )
+    return by_filter
+
+
+def _control_item(
+    job_id: str, result: Any, error: Optional[BaseException], skipped: bool = False
+) -> Dict[str, Any]:
+    return {
+        "job_id": job_id,
+        "result": result,
+        "error": None if error is None else str(error) or type(error).__name__,
+        "skipped": skipped,
+    }
 
 
-class PauseScheduledJobTool(BaseTool):
-    """Tool for pausing a scheduled job."""
+class PauseScheduledJobTool(_JobControlTool):
+    """Tool for pausing a scheduled job.
+
+    ``control_many``/``acontrol_many`` pause many jobs at once.
+    """
 
     name: str = "PauseScheduledJob"
+    service: ClassVar[str] = "scheduled_jobs"
     description: str = "Pause a scheduled job so it won't run until resumed."
     args_schema: Type[BaseModel] = JobControlInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
+    control_method: ClassVar[str] = "pause_scheduled_job"
+    target_active: ClassVar[Optional[bool]] = False
 
     def _run(
         self,
@@ -324,10 +501,7 @@ class PauseScheduledJobTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Pause a scheduled job."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-
-        response = self.client.pause_scheduled_job(job_id)
+        response = self._call("pause_scheduled_job", job_id)
         return response
 
     async def _arun(
@@ -336,29 +510,23 @@ class PauseScheduledJobTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> dict:
         """Pause a scheduled job asynchronously."""
-        return self._run(
-            job_id=job_id,
-            run_manager=run_manager.get_sync() if run_manager else None,
-        )
+        response = await self._acall("pause_scheduled_job", job_id)
+        return response
 
 
-class ResumeScheduledJobTool(BaseTool):
-    """Tool for resuming a paused scheduled job."""
+class ResumeScheduledJobTool(_JobControlTool):
+    """Tool for resuming a paused scheduled job.
+
+    ``control_many``/``acontrol_many`` resume many jobs at once.
+    """
 
     name: str = "ResumeScheduledJob"
+    service: ClassVar[str] = "scheduled_jobs"
     description: str = "Resume a paused scheduled job so it will start running again."
     args_schema: Type[BaseModel] = JobControlInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
+    control_method: ClassVar[str] = "resume_scheduled_job"
+    target_active: ClassVar[Optional[bool]] = True
 
     def _run(
         self,
@@ -366,10 +534,7 @@ class ResumeScheduledJobTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Resume a scheduled job."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-
-        response = self.client.resume_scheduled_job(job_id)
+        response = self._call("resume_scheduled_job", job_id)
         return response
 
     async def _arun(
@@ -378,29 +543,22 @@ class ResumeScheduledJobTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> dict:
         """Resume a scheduled job asynchronously."""
-        return self._run(
-            job_id=job_id,
-            run_manager=run_manager.get_sync() if run_manager else None,
-        )
+        response = await self._acall("resume_scheduled_job", job_id)
+        return response
+
 
+class TriggerScheduledJobTool(_JobControlTool):
+    """Tool for manually triggering a scheduled job.
 
-class TriggerScheduledJobTool(BaseTool):
-    """Tool for manually triggering a scheduled job."""
+    ``control_many``/``acontrol_many`` trigger many jobs at once.
+    """
 
     name: str = "TriggerScheduledJob"
+    service: ClassVar[str] = "scheduled_jobs"
     description: str = "Manually trigger a scheduled job to run immediately."
     args_schema: Type[BaseModel] = JobControlInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
+    control_method: ClassVar[str] = "trigger_scheduled_job"
 
     def _run(
         self,
@@ -408,10 +566,7 @@ class TriggerScheduledJobTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Trigger a scheduled job."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-
-        response = self.client.trigger_scheduled_job(job_id)
+        response = self._call("trigger_scheduled_job", job_id)
         return response
 
     async def _arun(
@@ -420,29 +575,50 @@ class TriggerScheduledJobTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> dict:
         """Trigger a scheduled job asynchronously."""
-        return self._run(
-            job_id=job_id,
-            run_manager=run_manager.get_sync() if run_manager else None,
-        )
+        response = await self._acall("trigger_scheduled_job", job_id)
+        return response
+
+
+class GetJobExecutionsTool(ScrapeGraphBaseTool):
+    """Tool for getting execution history of a scheduled job.
 
+    Full listings:
+        ``aiter_executions`` walks every page of a job's history, fetching
+        the next ``prefetch`` pages while the current one is consumed:
 
-class GetJobExecutionsTool(BaseTool):
-    """Tool for getting execution history of a scheduled job."""
+        .. code-block:: python
+
+            async for execution in tool.aiter_executions("job-id"):
+                print(execution["status"], execution["started_at"])
+    """
 
     name: str = "GetJobExecutions"
+    service: ClassVar[str] = "scheduled_jobs"
     description: str = "Retrieve execution history for a scheduled job."
     args_schema: Type[BaseModel] = GetJobExecutionsInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
+    async def aiter_executions(
+        self,
+        job_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: int = 4,
+    ) -> AsyncIterator[dict]:
+        """Yield every execution of a scheduled job, page by page.
+
+        See ``langchain_scrapegraph.pagination.aiter_pages``.
+        """
+
+        async def fetch(page: int) -> Any:
+            return await self._acall(
+                "get_job_executions",
+                job_id=job_id,
+                page=page,
+                page_size=page_size,
+            )
+
+        async for execution in aiter_pages(fetch, "executions", page_size, prefetch):
+            yield execution
 
     def _run(
         self,
@@ -452,10 +628,8 @@ class GetJobExecutionsTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Get job executions."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-
-        response = self.client.get_job_executions(
+        response = self._call(
+            "get_job_executions",
             job_id=job_id,
             page=page,
             page_size=page_size,
@@ -470,31 +644,31 @@ class GetJobExecutionsTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> dict:
         """Get job executions asynchronously."""
-        return self._run(
+        response = await self._acall(
+            "get_job_executions",
             job_id=job_id,
             page=page,
             page_size=page_size,
-            run_manager=run_manager.get_sync() if run_manager else None,
         )
+        return response
+
 
+class DeleteScheduledJobTool(_JobControlTool):
+    """Tool for deleting a scheduled job.
 
-class DeleteScheduledJobTool(BaseTool):
-    """Tool for deleting a scheduled job."""
+    ``control_many``/``acontrol_many`` delete many jobs at once.
+    """
 
     name: str = "DeleteScheduledJob"
+    service: ClassVar[str] = "scheduled_jobs"
     description: str = "Delete a scheduled job permanently."
     args_schema: Type[BaseModel] = JobControlInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
+    control_method: ClassVar[str] = "delete_scheduled_job"
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
+    def _already_done(self, error: BaseException) -> bool:
+        # Deleting a job that no longer exists.
+        return getattr(error, "status_code", None) == 404
 
     def _run(
         self,
@@ -502,10 +676,7 @@ class DeleteScheduledJobTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Delete a scheduled job."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-
-        response = self.client.delete_scheduled_job(job_id)
+        response = self._call("delete_scheduled_job", job_id)
         return response
 
     async def _arun(
@@ -514,7 +685,5 @@ class DeleteScheduledJobTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> dict:
         """Delete a scheduled job asynchronously."""
-        return self._run(
-            job_id=job_id,
-            run_manager=run_manager.get_sync() if run_manager else None,
-        )
+        response = await self._acall("delete_scheduled_job", job_id)
+        return response
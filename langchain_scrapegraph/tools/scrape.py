@@ -1,13 +1,15 @@
-from typing import Any, Dict, Optional, Type
+from typing import Any, ClassVar, Dict, Optional, Type
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
-from langchain_core.tools import BaseTool
-from langchain_core.utils import get_from_dict_or_env
-from pydantic import BaseModel, Field, model_validator
-from scrapegraph_py import Client
+from pydantic import BaseModel, Field
+
+from ..cache import BaseCache, canonicalize_url, hash_value, make_cache_key
+from ..concurrency import request_coalescer
+from ..retry import RetryPolicy
+from .base import ScrapeGraphBaseTool
 
 
 class ScrapeInput(BaseModel):
@@ -21,7 +23,7 @@ class ScrapeInput(BaseModel):
     )
 
 
-class ScrapeTool(BaseTool):
+class ScrapeTool(ScrapeGraphBaseTool):
     """Tool for getting HTML content from websites using ScrapeGraph AI.
 
     Setup:
@@ -41,6 +43,9 @@ class ScrapeTool(BaseTool):
     Key init args:
         api_key: Your ScrapeGraph AI API key. If not provided, will look for SGAI_API_KEY env var.
         client: Optional pre-configured ScrapeGraph client instance.
+        cache: Optional cache (e.g. ``InMemoryCache`` or ``SQLiteCache``) for scraped pages.
+        coalesce_requests: If True (default), identical concurrent requests share a single API call.
+        retry_policy: Retry policy for transient failures (default ``RetryPolicy()``); None disables retries.
 
     Instantiate:
         .. code-block:: python
@@ -93,26 +98,34 @@ class ScrapeTool(BaseTool):
     """
 
     name: str = "Scrape"
+    service: ClassVar[str] = "scrape"
     description: str = (
         "Get HTML content from a website. Useful when you need to retrieve the raw HTML "
         "content of a webpage, with optional heavy JavaScript rendering and custom headers."
     )
     args_schema: Type[BaseModel] = ScrapeInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
+    retry_policy: Optional[RetryPolicy] = Field(default_factory=RetryPolicy)
+    cache: Optional[BaseCache] = None
+    coalesce_requests: bool = True
 
     def __init__(self, **data: Any):
         super().__init__(**data)
 
+    def _request_key(
+        self,
+        website_url: str,
+        render_heavy_js: bool,
+        headers: Optional[Dict[str, str]],
+    ) -> str:
+        return make_cache_key(
+            "scrape",
+            hash_value(self.api_key),
+            canonicalize_url(website_url),
+            render_heavy_js,
+            hash_value(headers),
+        )
+
     def _run(
         self,
         website_url: str,
@@ -121,15 +134,40 @@ class ScrapeTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Use the tool to scrape HTML content from a website."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-
-        response = self.client.scrape(
+        request_key = self._request_key(website_url, render_heavy_js, headers)
+        if self.cache is not None:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                return cached
+
+        if self.coalesce_requests:
+            return request_coalescer.do(
+                request_key,
+                self._scrape,
+                request_key,
+                website_url,
+                render_heavy_js,
+                headers,
+            )
+        return self._scrape(request_key, website_url, render_heavy_js, headers)
+
+    def _scrape(
+        self,
+        request_key: str,
+        website_url: str,
+        render_heavy_js: bool,
+        headers: Optional[Dict[str, str]],
+    ) -> dict:
+        """Send one scrape request and cache its result."""
+        response = self._call(
+            "scrape",
             website_url=website_url,
             render_heavy_js=render_heavy_js,
             headers=headers,
         )
 
+        if self.cache is not None and not response.get("error"):
+            self.cache.set(request_key, response)
         return response
 
     async def _arun(
@@ -140,9 +178,38 @@ class ScrapeTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> dict:
         """Use the tool asynchronously."""
-        return self._run(
+        request_key = self._request_key(website_url, render_heavy_js, headers)
+        if self.cache is not None:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                return cached
+
+        if self.coalesce_requests:
+            return await request_coalescer.ado(
+                request_key,
+                self._ascrape,
+                request_key,
+                website_url,
+                render_heavy_js,
+                headers,
+            )
+        return await self._ascrape(request_key, website_url, render_heavy_js, headers)
+
+    async def _ascrape(
+        self,
+        request_key: str,
+        website_url: str,
+        render_heavy_js: bool,
+        headers: Optional[Dict[str, str]],
+    ) -> dict:
+        """Send one scrape request asynchronously and cache its result."""
+        response = await self._acall(
+            "scrape",
             website_url=website_url,
             render_heavy_js=render_heavy_js,
             headers=headers,
-            run_manager=run_manager.get_sync() if run_manager else None,
         )
+
+        if self.cache is not None and not response.get("error"):
+            self.cache.set(request_key, response)
+        return response
@@ -1,15 +1,13 @@
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import Any, ClassVar, Dict, Optional, Type
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
-from langchain_core.tools import BaseTool
-from langchain_core.utils import get_from_dict_or_env
-from pydantic import BaseModel, Field, model_validator
-from scrapegraph_py import Client
+from pydantic import BaseModel, Field
 
-T = TypeVar("T", bound=BaseModel)
+from ..retry import RetryPolicy
+from .base import ScrapeGraphBaseTool
 
 
 class SearchScraperInput(BaseModel):
@@ -22,7 +20,7 @@ class SearchScraperInput(BaseModel):
     )
 
 
-class SearchScraperTool(BaseTool):
+class SearchScraperTool(ScrapeGraphBaseTool):
     """Tool for searching and extracting structured data from the web using ScrapeGraph AI.
 
     Setup:
@@ -98,23 +96,15 @@ class SearchScraperTool(BaseTool):
     """
 
     name: str = "SearchScraper"
+    service: ClassVar[str] = "searchscraper"
     description: str = (
         "Useful when you need to search and extract structured information from the web about a specific topic or query"
     )
     args_schema: Type[BaseModel] = SearchScraperInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
+    retry_policy: Optional[RetryPolicy] = Field(default_factory=RetryPolicy)
     llm_output_schema: Optional[Type[BaseModel]] = None
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls: Type[T], values: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
-
     def __init__(self, **data: Any):
         super().__init__(**data)
 
@@ -134,12 +124,10 @@ class SearchScraperTool(BaseTool):
         Returns:
             dict: In extraction mode, returns structured data. In markdown mode, returns markdown content.
         """
-        if not self.client:
-            raise ValueError("Client not initialized")
-
         # In markdown mode, we ignore the output schema since we're returning raw markdown
         if not extraction_mode:
-            response = self.client.searchscraper(
+            response = self._call(
+                "searchscraper",
                 user_prompt=user_prompt,
                 extraction_mode=False,
             )
@@ -150,14 +138,16 @@ class SearchScraperTool(BaseTool):
 
         # In extraction mode, we can use the output schema if provided
         if self.llm_output_schema is None:
-            response = self.client.searchscraper(
+            response = self._call(
+                "searchscraper",
                 user_prompt=user_prompt,
                 extraction_mode=True,
             )
         elif isinstance(self.llm_output_schema, type) and issubclass(
             self.llm_output_schema, BaseModel
         ):
-            response = self.client.searchscraper(
+            response = self._call(
+                "searchscraper",
                 user_prompt=user_prompt,
                 extraction_mode=True,
                 output_schema=self.llm_output_schema,
@@ -174,8 +164,35 @@ class SearchScraperTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> Dict[str, Any]:
         """Use the tool asynchronously."""
-        return self._run(
-            user_prompt,
-            extraction_mode=extraction_mode,
-            run_manager=run_manager.get_sync() if run_manager else None,
-        )
+        # In markdown mode, we ignore the output schema since we're returning raw markdown
+        if not extraction_mode:
+            response = await self._acall(
+                "searchscraper",
+                user_prompt=user_prompt,
+                extraction_mode=False,
+            )
+            return {
+                "markdown_content": response.get("markdown_content", ""),
+                "reference_urls": response.get("reference_urls", []),
+            }
+
+        # In extraction mode, we can use the output schema if provided
+        if self.llm_output_schema is None:
+            response = await self._acall(
+                "searchscraper",
+                user_prompt=user_prompt,
+                extraction_mode=True,
+            )
+        elif isinstance(self.llm_output_schema, type) and issubclass(
+            self.llm_output_schema, BaseModel
+        ):
+            response = await self._acall(
+                "searchscraper",
+                user_prompt=user_prompt,
+                extraction_mode=True,
+                output_schema=self.llm_output_schema,
+            )
+        else:
+            raise ValueError("llm_output_schema must be a Pydantic model class")
+
+        return response["result"]
@@ -1,13 +1,70 @@
-from typing import Any, Dict, Optional, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+)
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
-from langchain_core.tools import BaseTool
-from langchain_core.utils import get_from_dict_or_env
-from pydantic import BaseModel, Field, model_validator
-from scrapegraph_py import Client
+from pydantic import BaseModel, Field
+
+from ..polling import PendingJob, PollBackoff, job_id_from
+from ..retry import RetryPolicy
+from .base import ScrapeGraphBaseTool
+
+CRAWL_ID_KEYS = ("id", "task_id", "crawl_id")
+# Statuses returned before a crawl is accepted, so resubmitting cannot start
+# a second one.
+SUBMIT_RETRY_STATUS_CODES = frozenset({429, 503})
+
+
+def _new_pages(response: Any, seen: Set[Any]) -> List[dict]:
+    """Pages in a crawl status response that have not been seen yet."""
+    if not isinstance(response, dict):
+        return []
+    result = response.get("result")
+    pages = result.get("pages") if isinstance(result, dict) else None
+    if pages is None:
+        pages = response.get("pages")
+    new = []
+    for index, page in enumerate(pages or []):
+        key = page.get("url", index) if isinstance(page, dict) else index
+        if key not in seen:
+            seen.add(key)
+            new.append(page)
+    return new
+
+
+def iter_crawl_pages(
+    job: PendingJob, timeout: Optional[float] = None
+) -> Iterator[dict]:
+    """Yield the pages of a submitted crawl as its status reports them.
+
+    Each page is yielded once, as soon as a poll first reports it. Once the
+    iteration ends, ``job.response`` holds the final response, including
+    the crawl-wide extraction result.
+    """
+    seen: Set[Any] = set()
+    for response in job.updates(timeout):
+        yield from _new_pages(response, seen)
+
+
+async def aiter_crawl_pages(
+    job: PendingJob, timeout: Optional[float] = None
+) -> AsyncIterator[dict]:
+    """Async counterpart of ``iter_crawl_pages``."""
+    seen: Set[Any] = set()
+    async for response in job.aupdates(timeout):
+        for page in _new_pages(response, seen):
+            yield page
 
 
 class SmartCrawlerInput(BaseModel):
@@ -29,7 +86,7 @@ class SmartCrawlerInput(BaseModel):
     )
 
 
-class SmartCrawlerTool(BaseTool):
+class SmartCrawlerTool(ScrapeGraphBaseTool):
     """Tool for crawling and extracting structured data from multiple related webpages using ScrapeGraph AI.
 
     Setup:
@@ -51,6 +108,11 @@ class SmartCrawlerTool(BaseTool):
         client: Optional pre-configured ScrapeGraph client instance.
         llm_output_schema: Optional Pydantic model or dictionary schema to structure the output.
                       If provided, the tool will ensure the output conforms to this schema.
+        poll_backoff: Optional ``PollBackoff`` setting how often submitted crawls are polled.
+        retry_policy: Retry policy for status polls (default ``RetryPolicy()``).
+        submit_retry_policy: Retry policy for starting a crawl. Starting one is
+            paid and not idempotent, so by default it is only retried on a 429
+            or 503, which the API returns before accepting the crawl.
 
     Instantiate:
         .. code-block:: python
@@ -103,29 +165,170 @@ class SmartCrawlerTool(BaseTool):
                 "prompt": "Extract company information",
                 "url": "https://example.com"
             })
+
+    Submit and poll:
+        ``submit`` starts a crawl and returns a ``PendingJob`` at once. Its
+        status is then polled with growing intervals until it finishes.
+        Awaited jobs are all polled from one task per event loop, so a single
+        worker can supervise many crawls:
+
+        .. code-block:: python
+
+            job = tool.submit(prompt="Extract pricing", url="https://example.com")
+            print(job.job_id, job.poll())
+            result = job.result(timeout=600)
+
+            jobs = [await tool.asubmit(prompt=p, url=u) for p, u in crawls]
+            results = await asyncio.gather(*(job.aresult() for job in jobs))
+
+    Streaming pages:
+        ``stream_pages``/``astream_pages`` yield each crawled page as soon as
+        the crawl reports it, so later stages can start on the first pages
+        while the rest are still being crawled:
+
+        .. code-block:: python
+
+            for page in tool.stream_pages(
+                prompt="Extract the docs", url="https://example.com", max_pages=50
+            ):
+                store(page["url"], page["markdown"])
     """
 
     name: str = "SmartCrawler"
+    service: ClassVar[str] = "crawl"
     description: str = (
         "Useful when you need to extract structured data from multiple related webpages by crawling through a website, applying LLM reasoning across pages, by providing a starting URL and extraction prompt"
     )
     args_schema: Type[BaseModel] = SmartCrawlerInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
+    retry_policy: Optional[RetryPolicy] = Field(default_factory=RetryPolicy)
+    submit_retry_policy: Optional[RetryPolicy] = Field(
+        default_factory=lambda: RetryPolicy(
+            retry_status_codes=SUBMIT_RETRY_STATUS_CODES, retry_exceptions=()
+        )
+    )
     llm_output_schema: Optional[Type[BaseModel]] = None
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
+    poll_backoff: PollBackoff = Field(default_factory=PollBackoff)
 
     def __init__(self, **data: Any):
         super().__init__(**data)
 
+    def _retry_policy_for(self, method: str) -> Optional[RetryPolicy]:
+        if method == "crawl":
+            return self.submit_retry_policy
+        return self.retry_policy
+
+    def _crawl_kwargs(
+        self,
+        prompt: str,
+        url: str,
+        cache_website: bool,
+        depth: int,
+        max_pages: int,
+        same_domain_only: bool,
+    ) -> Dict[str, Any]:
+        kwargs = {
+            "url": url,
+            "prompt": prompt,
+            "cache_website": cache_website,
+            "depth": depth,
+            "max_pages": max_pages,
+            "same_domain_only": same_domain_only,
+        }
+        if self.llm_output_schema is None:
+            return kwargs
+        if isinstance(self.llm_output_schema, type) and issubclass(
+            self.llm_output_schema, BaseModel
+        ):
+            kwargs["data_schema"] = self.llm_output_schema.model_json_schema()
+            return kwargs
+        raise ValueError("llm_output_schema must be a Pydantic model class")
+
+    def _job(self, response: Any) -> PendingJob:
+        return PendingJob(
+            self,
+            "get_crawl",
+            job_id_from(response, CRAWL_ID_KEYS),
+            response,
+            self.poll_backoff,
+        )
+
+    def submit(
+        self,
+        prompt: str,
+        url: str,
+        cache_website: bool = True,
+        depth: int = 2,
+        max_pages: int = 2,
+        same_domain_only: bool = True,
+    ) -> PendingJob:
+        """Start a crawl and return a handle on it without waiting.
+
+        Call ``result()`` on the handle to block until the crawl finishes, or
+        ``poll()`` to check on it from time to time.
+        """
+        response = self._call(
+            "crawl",
+            **self._crawl_kwargs(
+                prompt, url, cache_website, depth, max_pages, same_domain_only
+            ),
+        )
+        return self._job(response)
+
+    async def asubmit(
+        self,
+        prompt: str,
+        url: str,
+        cache_website: bool = True,
+        depth: int = 2,
+        max_pages: int = 2,
+        same_domain_only: bool = True,
+    ) -> PendingJob:
+        """Async counterpart of ``submit``; await ``aresult()`` on the handle."""
+        response = await self._acall(
+            "crawl",
+            **self._crawl_kwargs(
+                prompt, url, cache_website, depth, max_pages, same_domain_only
+            ),
+        )
+        return self._job(response)
+
+    def stream_pages(
+        self,
+        prompt: str,
+        url: str,
+        cache_website: bool = True,
+        depth: int = 2,
+        max_pages: int = 2,
+        same_domain_only: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Iterator[dict]:
+        """Start a crawl and yield its pages as they are crawled.
+
+        Use ``submit`` with ``iter_crawl_pages`` to also keep the job handle.
+        """
+        job = self.submit(
+            prompt, url, cache_website, depth, max_pages, same_domain_only
+        )
+        yield from iter_crawl_pages(job, timeout)
+
+    async def astream_pages(
+        self,
+        prompt: str,
+        url: str,
+        cache_website: bool = True,
+        depth: int = 2,
+        max_pages: int = 2,
+        same_domain_only: bool = True,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[dict]:
+        """Async counterpart of ``stream_pages``."""
+        job = await self.asubmit(
+            prompt, url, cache_website, depth, max_pages, same_domain_only
+        )
+        async for page in aiter_crawl_pages(job, timeout):
+            yield page
+
     def _run(
         self,
         prompt: str,
@@ -137,34 +340,12 @@ class SmartCrawlerTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> dict:
         """Use the tool to crawl and extract data from multiple webpages."""
-        if not self.client:
-            raise ValueError("Client not initialized")
-
-        if self.llm_output_schema is None:
-            response = self.client.crawl(
-                url=url,
-                prompt=prompt,
-                cache_website=cache_website,
-                depth=depth,
-                max_pages=max_pages,
-                same_domain_only=same_domain_only,
-            )
-        elif isinstance(self.llm_output_schema, type) and issubclass(
-            self.llm_output_schema, BaseModel
-        ):
-            response = self.client.crawl(
-                url=url,
-                prompt=prompt,
-                cache_website=cache_website,
-                depth=depth,
-                max_pages=max_pages,
-                same_domain_only=same_domain_only,
-                output_schema=self.llm_output_schema,
-            )
-        else:
-            raise ValueError("llm_output_schema must be a Pydantic model class")
-
-        return response
+        return self._call(
+            "crawl",
+            **self._crawl_kwargs(
+                prompt, url, cache_website, depth, max_pages, same_domain_only
+            ),
+        )
 
     async def _arun(
         self,
@@ -177,12 +358,9 @@ class SmartCrawlerTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> dict:
         """Use the tool asynchronously."""
-        return self._run(
-            prompt,
-            url,
-            cache_website=cache_website,
-            depth=depth,
-            max_pages=max_pages,
-            same_domain_only=same_domain_only,
-            run_manager=run_manager.get_sync() if run_manager else None,
+        return await self._acall(
+            "crawl",
+            **self._crawl_kwargs(
+                prompt, url, cache_website, depth, max_pages, same_domain_only
+            ),
         )
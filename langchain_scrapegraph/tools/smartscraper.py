@@ -1,15 +1,33 @@
-from typing import Any, Dict, Optional, Type, TypeVar
+from contextlib import aclosing, closing
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+)
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
-from langchain_core.tools import BaseTool
-from langchain_core.utils import get_from_dict_or_env
-from pydantic import BaseModel, Field, model_validator
-from scrapegraph_py import Client
-
-T = TypeVar("T", bound=BaseModel)
+from pydantic import BaseModel, Field
+
+from ..cache import (
+    BaseCache,
+    canonicalize_url,
+    hash_value,
+    make_cache_key,
+    normalize_prompt,
+)
+from ..concurrency import amap_as_completed, map_as_completed, request_coalescer
+from ..hedging import HedgingPolicy
+from ..metrics import metrics
+from ..retry import RetryPolicy
+from .base import ScrapeGraphBaseTool
 
 
 class SmartScraperInput(BaseModel):
@@ -27,7 +45,7 @@ class SmartScraperInput(BaseModel):
     )
 
 
-class SmartScraperTool(BaseTool):
+class SmartScraperTool(ScrapeGraphBaseTool):
     """Tool for extracting structured data from websites using ScrapeGraph AI.
 
     Setup:
@@ -49,6 +67,14 @@ class SmartScraperTool(BaseTool):
         client: Optional pre-configured ScrapeGraph client instance.
         llm_output_schema: Optional Pydantic model or dictionary schema to structure the output.
                       If provided, the tool will ensure the output conforms to this schema.
+        cache: Optional cache (e.g. ``InMemoryCache``) for extraction results. Requests
+               with the same URL, prompt, HTML and schema are then served from it.
+        coalesce_requests: If True (default), identical concurrent requests share a
+               single API call.
+        retry_policy: Retry policy for transient failures (default ``RetryPolicy()``);
+               None disables retries.
+        hedging: Optional ``HedgingPolicy``. When set, a call still running after the
+               chosen latency percentile is raced against one duplicate request.
 
     Instantiate:
         .. code-block:: python
@@ -70,6 +96,11 @@ class SmartScraperTool(BaseTool):
 
             tool_with_schema = SmartScraperTool(llm_output_schema=WebsiteInfo)
 
+            # Or cache repeated extractions for ten minutes:
+            from langchain_scrapegraph.cache import InMemoryCache
+
+            cached_tool = SmartScraperTool(cache=InMemoryCache(maxsize=512, ttl=600))
+
     Use the tool:
         .. code-block:: python
 
@@ -114,29 +145,78 @@ class SmartScraperTool(BaseTool):
                 "user_prompt": "Extract the main heading",
                 "website_url": "https://example.com"
             })
+
+    Bulk extraction:
+        .. code-block:: python
+
+            # Results arrive as they complete, not in input order
+            for item in tool.extract_many(urls, "Extract the product price"):
+                if item["error"]:
+                    print(item["website_url"], "failed:", item["error"])
+                else:
+                    print(item["website_url"], item["result"])
+
+            # Or asynchronously
+            async for item in tool.aextract_many(urls, "Extract the product price"):
+                ...
     """
 
     name: str = "SmartScraper"
+    service: ClassVar[str] = "smartscraper"
     description: str = (
         "Useful when you need to extract structured data from a webpage, applying also some reasoning using LLM, by providing a webpage URL and an extraction prompt"
     )
     args_schema: Type[BaseModel] = SmartScraperInput
     return_direct: bool = True
-    client: Optional[Client] = None
-    api_key: str
+    retry_policy: Optional[RetryPolicy] = Field(default_factory=RetryPolicy)
     llm_output_schema: Optional[Type[BaseModel]] = None
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls: Type[T], values: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate that api key exists in environment."""
-        values["api_key"] = get_from_dict_or_env(values, "api_key", "SGAI_API_KEY")
-        values["client"] = Client(api_key=values["api_key"])
-        return values
+    cache: Optional[BaseCache] = None
+    coalesce_requests: bool = True
+    hedging: Optional[HedgingPolicy] = None
 
     def __init__(self, **data: Any):
         super().__init__(**data)
 
+    def _request_key(
+        self, user_prompt: str, website_url: str, website_html: Optional[str]
+    ) -> str:
+        schema = (
+            self.llm_output_schema.model_json_schema()
+            if isinstance(self.llm_output_schema, type)
+            and issubclass(self.llm_output_schema, BaseModel)
+            else None
+        )
+        return make_cache_key(
+            "smartscraper",
+            hash_value(self.api_key),
+            canonicalize_url(website_url),
+            normalize_prompt(user_prompt),
+            hash_value(website_html),
+            hash_value(schema),
+        )
+
+    def _attempt(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        if self.hedging is None:
+            return super()._attempt(method, *args, **kwargs)
+        return self.hedging.call(
+            metrics.histogram(f"{self.service}.latency"),
+            super()._attempt,
+            method,
+            *args,
+            **kwargs,
+        )
+
+    async def _aattempt(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        if self.hedging is None:
+            return await super()._aattempt(method, *args, **kwargs)
+        return await self.hedging.acall(
+            metrics.histogram(f"{self.service}.latency"),
+            super()._aattempt,
+            method,
+            *args,
+            **kwargs,
+        )
+
     def _run(
         self,
         user_prompt: str,
@@ -157,11 +237,34 @@ class SmartScraperTool(BaseTool):
         Returns:
             dict: Extracted data in the requested format
         """
-        if not self.client:
-            raise ValueError("Client not initialized")
+        request_key = self._request_key(user_prompt, website_url, website_html)
+        if self.cache is not None:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                return cached
+
+        if self.coalesce_requests:
+            return request_coalescer.do(
+                request_key,
+                self._extract,
+                request_key,
+                user_prompt,
+                website_url,
+                website_html,
+            )
+        return self._extract(request_key, user_prompt, website_url, website_html)
 
+    def _extract(
+        self,
+        request_key: str,
+        user_prompt: str,
+        website_url: str,
+        website_html: Optional[str],
+    ) -> Dict[str, Any]:
+        """Send one extraction request and cache its result."""
         if self.llm_output_schema is None:
-            response = self.client.smartscraper(
+            response = self._call(
+                "smartscraper",
                 website_url=website_url,
                 user_prompt=user_prompt,
                 website_html=website_html,
@@ -169,7 +272,8 @@ class SmartScraperTool(BaseTool):
         elif isinstance(self.llm_output_schema, type) and issubclass(
             self.llm_output_schema, BaseModel
         ):
-            response = self.client.smartscraper(
+            response = self._call(
+                "smartscraper",
                 website_url=website_url,
                 user_prompt=user_prompt,
                 website_html=website_html,
@@ -178,6 +282,8 @@ class SmartScraperTool(BaseTool):
         else:
             raise ValueError("llm_output_schema must be a Pydantic model class")
 
+        if self.cache is not None and not response.get("error"):
+            self.cache.set(request_key, response["result"])
         return response["result"]
 
     async def _arun(
@@ -189,10 +295,117 @@ class SmartScraperTool(BaseTool):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> Dict[str, Any]:
         """Use the tool asynchronously."""
-        return self._run(
-            user_prompt,
-            website_url,
-            website_html=website_html,
-            render_heavy_js=render_heavy_js,
-            run_manager=run_manager.get_sync() if run_manager else None,
+        request_key = self._request_key(user_prompt, website_url, website_html)
+        if self.cache is not None:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                return cached
+
+        if self.coalesce_requests:
+            return await request_coalescer.ado(
+                request_key,
+                self._aextract,
+                request_key,
+                user_prompt,
+                website_url,
+                website_html,
+            )
+        return await self._aextract(request_key, user_prompt, website_url, website_html)
+
+    async def _aextract(
+        self,
+        request_key: str,
+        user_prompt: str,
+        website_url: str,
+        website_html: Optional[str],
+    ) -> Dict[str, Any]:
+        """Send one extraction request asynchronously and cache its result."""
+        if self.llm_output_schema is None:
+            response = await self._acall(
+                "smartscraper",
+                website_url=website_url,
+                user_prompt=user_prompt,
+                website_html=website_html,
+            )
+        elif isinstance(self.llm_output_schema, type) and issubclass(
+            self.llm_output_schema, BaseModel
+        ):
+            response = await self._acall(
+                "smartscraper",
+                website_url=website_url,
+                user_prompt=user_prompt,
+                website_html=website_html,
+                output_schema=self.llm_output_schema,
+            )
+        else:
+            raise ValueError("llm_output_schema must be a Pydantic model class")
+
+        if self.cache is not None and not response.get("error"):
+            self.cache.set(request_key, response["result"])
+        return response["result"]
+
+    def extract_many(
+        self,
+        website_urls: Iterable[str],
+        user_prompt: str,
+        max_concurrency: int = 8,
+    ) -> Iterator[Dict[str, Any]]:
+        """Extract data from many webpages with the same prompt.
+
+        Duplicate URLs (after canonicalization) are only requested once. At
+        most ``max_concurrency`` requests run at a time, and results are
+        yielded as they complete, so their order differs from the input.
+
+        Args:
+            website_urls: URLs to extract from; consumed lazily
+            user_prompt: What to extract from each webpage
+            max_concurrency: Maximum number of requests in flight
+
+        Yields:
+            dict: ``{"website_url", "result", "error"}`` per unique URL. A failed
+            extraction has ``result`` set to None and ``error`` to its message
+            instead of aborting the batch.
+        """
+        results = map_as_completed(
+            lambda url: self._run(user_prompt=user_prompt, website_url=url),
+            _unique_urls(website_urls),
+            max_concurrency,
+        )
+        with closing(results):
+            for website_url, result, error in results:
+                yield _batch_item(website_url, result, error)
+
+    async def aextract_many(
+        self,
+        website_urls: Iterable[str],
+        user_prompt: str,
+        max_concurrency: int = 8,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async counterpart of :meth:`extract_many`."""
+        results = amap_as_completed(
+            lambda url: self._arun(user_prompt=user_prompt, website_url=url),
+            _unique_urls(website_urls),
+            max_concurrency,
         )
+        async with aclosing(results):
+            async for website_url, result, error in results:
+                yield _batch_item(website_url, result, error)
+
+
+def _unique_urls(website_urls: Iterable[str]) -> Iterator[str]:
+    seen = set()
+    for url in website_urls:
+        key = canonicalize_url(url)
+        if key not in seen:
+            seen.add(key)
+            yield url
+
+
+def _batch_item(
+    website_url: str, result: Any, error: Optional[BaseException]
+) -> Dict[str, Any]:
+    return {
+        "website_url": website_url,
+        "result": result,
+        "error": None if error is None else str(error) or type(error).__name__,
+    }
@@ -1,13 +1,18 @@
-from typing import Any, Dict, Optional, Type
+import asyncio
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
+from scrapegraph_py import Client
+from scrapegraph_py.exceptions import APIError
 
 
-class MockClient:
+class MockClient(Client):
     def __init__(self, api_key: str = None, *args, **kwargs):
         """Initialize with mock methods that return proper response structures"""
         self._api_key = api_key
+        self.closed = False
 
     def smartscraper(
         self, website_url: str, user_prompt: str, website_html: str = None
@@ -224,7 +229,205 @@ class MockClient:
 
     def close(self) -> None:
         """Mock close method"""
-        pass
+        self.closed = True
+
+
+class MockCrawlClient(MockClient):
+    """MockClient whose crawls finish after ``polls_until_done`` status polls."""
+
+    polls_until_done: int = 2
+
+    def __init__(self, api_key: str = None, *args, **kwargs):
+        super().__init__(api_key)
+        self.submitted: Dict[str, dict] = {}
+        self.polls: Dict[str, int] = {}
+
+    def crawl(self, url: str, prompt: str = None, **kwargs: Any) -> dict:
+        crawl_id = str(uuid.uuid4())
+        self.submitted[crawl_id] = {"url": url, "prompt": prompt, **kwargs}
+        self.polls[crawl_id] = 0
+        return {"task_id": crawl_id, "status": "pending"}
+
+    def get_crawl(self, crawl_id: str) -> dict:
+        """Report one more crawled page per poll, up to ``max_pages``."""
+        self.polls[crawl_id] += 1
+        polls = self.polls[crawl_id]
+        crawl = self.submitted[crawl_id]
+        pages = [
+            {"url": f"{crawl['url']}/page-{i}", "markdown": f"# Page {i}"}
+            for i in range(min(polls, crawl.get("max_pages", 2)))
+        ]
+        if polls < self.polls_until_done:
+            return {"id": crawl_id, "status": "processing", "result": {"pages": pages}}
+        return {
+            "id": crawl_id,
+            "status": "success",
+            "result": {"llm_result": {"url": crawl["url"]}, "pages": pages},
+        }
+
+
+class MockAgenticClient(MockClient):
+    """MockClient whose agentic sessions finish after ``polls_until_done`` polls."""
+
+    polls_until_done: int = 2
+
+    def __init__(self, api_key: str = None, *args, **kwargs):
+        super().__init__(api_key)
+        self.sessions: Dict[str, dict] = {}
+        self.polls: Dict[str, int] = {}
+
+    def agenticscraper(self, url: str, steps: list, **kwargs: Any) -> dict:
+        request_id = str(uuid.uuid4())
+        self.sessions[request_id] = {"url": url, "steps": steps, **kwargs}
+        self.polls[request_id] = 0
+        return {"request_id": request_id, "status": "pending"}
+
+    def get_agenticscraper(self, request_id: str) -> dict:
+        self.polls[request_id] += 1
+        if self.polls[request_id] < self.polls_until_done:
+            return {"request_id": request_id, "status": "processing"}
+        return {
+            "request_id": request_id,
+            "status": "completed",
+            "result": {"steps_done": len(self.sessions[request_id]["steps"])},
+        }
+
+
+class MockPagedClient(MockClient):
+    """MockClient listing ``jobs`` scheduled jobs with ``executions`` runs each."""
+
+    def __init__(
+        self, api_key: str = None, jobs: int = 0, executions: int = 0, **kwargs
+    ):
+        super().__init__(api_key)
+        self.jobs = [
+            {
+                "id": f"job-{i}",
+                "job_name": f"job-{i}",
+                "service_type": "smartscraper",
+                "cron_expression": "0 9 * * *",
+                "job_config": {},
+                "is_active": i % 2 == 0,
+            }
+            for i in range(jobs)
+        ]
+        self.created = 0
+        self.executions = executions
+        self.requested: List[int] = []
+        self.report_total = True
+        self.controlled: List[Tuple[str, str]] = []
+        self.failing: set = set()
+        self.histories: Dict[str, List[dict]] = {}
+        self.oldest_first = False
+
+    def _page(self, key: str, items: list, page: int, page_size: int) -> dict:
+        self.requested.append(page)
+        start = (page - 1) * page_size
+        response = {key: items[start : start + page_size], "page": page}
+        if self.report_total:
+            response["total"] = len(items)
+        return response
+
+    def get_scheduled_jobs(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        service_type: str = None,
+        is_active: bool = None,
+    ) -> dict:
+        jobs = [
+            job
+            for job in self.jobs
+            if (service_type is None or job["service_type"] == service_type)
+            and (is_active is None or job["is_active"] == is_active)
+        ]
+        return self._page("jobs", jobs, page, page_size)
+
+    def get_job_executions(
+        self, job_id: str, page: int = 1, page_size: int = 10
+    ) -> dict:
+        if job_id in self.histories:
+            executions = self.histories[job_id]
+        else:
+            executions = [
+                {"id": f"{job_id}-exec-{i}", "job_id": job_id, "status": "completed"}
+                for i in range(self.executions)
+            ]
+        if self.oldest_first:
+            executions = executions[::-1]
+        return self._page("executions", executions, page, page_size)
+
+    def run_job(self, job_id: str, status: str = "completed") -> dict:
+        """Record a new execution of ``job_id``, newest first in its history."""
+        history = self.histories.setdefault(job_id, [])
+        execution = {
+            "id": f"{job_id}-run-{len(history)}",
+            "job_id": job_id,
+            "status": status,
+            "started_at": f"2024-01-01T{len(history) // 60:02d}:{len(history) % 60:02d}:00Z",
+        }
+        history.insert(0, execution)
+        return execution
+
+    def _control(self, action: str, job_id: str) -> dict:
+        self.controlled.append((action, job_id))
+        if job_id in self.failing:
+            raise APIError("Internal server error", status_code=500)
+        for job in self.jobs:
+            if job["id"] == job_id:
+                return job
+        raise APIError("Job not found", status_code=404)
+
+    def create_scheduled_job(self, **kwargs: Any) -> dict:
+        self.created += 1
+        job = {"id": f"new-{self.created}", **kwargs}
+        self.jobs.append(job)
+        return dict(job)
+
+    def update_scheduled_job(self, job_id: str, **kwargs: Any) -> dict:
+        job = self._control("update", job_id)
+        job.update({k: v for k, v in kwargs.items() if v is not None})
+        return dict(job)
+
+    def pause_scheduled_job(self, job_id: str) -> dict:
+        self._control("pause", job_id)["is_active"] = False
+        return {"job_id": job_id, "is_active": False}
+
+    def resume_scheduled_job(self, job_id: str) -> dict:
+        self._control("resume", job_id)["is_active"] = True
+        return {"job_id": job_id, "is_active": True}
+
+    def trigger_scheduled_job(self, job_id: str) -> dict:
+        self._control("trigger", job_id)
+        return {"job_id": job_id, "execution_id": f"{job_id}-exec"}
+
+    def delete_scheduled_job(self, job_id: str) -> dict:
+        self.jobs.remove(self._control("delete", job_id))
+        return {"job_id": job_id}
+
+
+class MockAsyncClient:
+    """Async counterpart of MockClient that sleeps ``delay`` seconds per call."""
+
+    delay: float = 0.0
+
+    def __init__(self, api_key: str = None, *args, **kwargs):
+        self._api_key = api_key
+        self._sync = MockClient(api_key)
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._sync, name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            return method(*args, **kwargs)
+
+        return call
+
+
+class SlowMockAsyncClient(MockAsyncClient):
+    delay: float = 0.2
 
 
 class MockSmartScraperInput(BaseModel):
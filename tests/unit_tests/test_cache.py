@@ -0,0 +1,306 @@
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, Field
+
+from langchain_scrapegraph.cache import (
+    InMemoryCache,
+    SQLiteCache,
+    canonicalize_url,
+    make_cache_key,
+)
+from langchain_scrapegraph.tools import MarkdownifyTool, ScrapeTool, SmartScraperTool
+from tests.unit_tests.mocks import MockAsyncClient, MockClient
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _write_entries(path: str, worker: int) -> int:
+    cache = SQLiteCache(path)
+    for i in range(50):
+        cache.set(f"{worker}-{i}", {"worker": worker, "i": i})
+    return sum(cache.get(f"{worker}-{i}") is not None for i in range(50))
+
+
+class TestCacheKeys:
+    def test_canonicalize_url(self):
+        """Test that equivalent URL spellings canonicalize identically."""
+        assert canonicalize_url("HTTPS://Example.COM:443?b=2&a=1#top") == (
+            canonicalize_url("https://example.com/?a=1&b=2")
+        )
+        assert canonicalize_url("http://example.com:8080/a") == (
+            "http://example.com:8080/a"
+        )
+        assert canonicalize_url("https://example.com/a") != (
+            canonicalize_url("https://example.com/b")
+        )
+
+    def test_make_cache_key_is_stable(self):
+        """Test that keys depend only on their parts."""
+        assert make_cache_key("a", {"x": 1, "y": 2}) == make_cache_key(
+            "a", {"y": 2, "x": 1}
+        )
+        assert make_cache_key("a", None) != make_cache_key("a", "")
+
+
+class TestInMemoryCache:
+    def test_ttl_expiry(self):
+        """Test that entries expire after their TTL."""
+        timer = FakeTimer()
+        cache = InMemoryCache(ttl=10, timer=timer)
+        cache.set("key", {"value": 1})
+        timer.now = 9.9
+        assert cache.get("key") == {"value": 1}
+        timer.now = 10.0
+        assert cache.get("key") is None
+        assert cache.stats.expirations == 1
+
+        cache.set("short", "v", ttl=1)
+        timer.now = 11.5
+        assert cache.get("short") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = InMemoryCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_size_bound(self):
+        """Test that the byte bound evicts old entries and skips oversized ones."""
+        cache = InMemoryCache(max_bytes=15)
+        cache.set("a", "x" * 8)
+        cache.set("b", "y" * 8)
+        assert len(cache) == 1
+        assert cache.get("b") == "y" * 8
+        cache.set("huge", "z" * 100)
+        assert cache.get("huge") is None
+
+    def test_stats_and_copies(self):
+        """Test hit/miss statistics and isolation of cached values."""
+        cache = InMemoryCache()
+        value = {"items": [1]}
+        cache.set("key", value)
+        value["items"].append(2)
+        hit = cache.get("key")
+        hit["items"].append(3)
+        assert cache.get("key") == {"items": [1]}
+        assert cache.get("missing") is None
+        assert cache.stats.hits == 2
+        assert cache.stats.misses == 1
+        assert round(cache.stats.hit_rate, 2) == 0.67
+
+
+class TestSmartScraperCaching:
+    def test_repeated_extractions_hit_the_cache(self):
+        """Test that equivalent requests are only sent once."""
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = SmartScraperTool(
+            api_key="sgai-test-api-key", client=client, cache=InMemoryCache()
+        )
+        with patch.object(client, "smartscraper", wraps=client.smartscraper) as call:
+            first = tool.invoke(
+                {"user_prompt": "Extract the title", "website_url": "https://a.com"}
+            )
+            second = tool.invoke(
+                {"user_prompt": "  extract the  TITLE", "website_url": "https://A.com/"}
+            )
+            tool.invoke(
+                {"user_prompt": "Extract the title", "website_url": "https://b.com"}
+            )
+        assert first == second
+        assert call.call_count == 2
+        assert tool.cache.stats.hits == 1
+
+    def test_schema_is_part_of_the_key(self):
+        """Test that a different output schema does not reuse cached results."""
+
+        class Title(BaseModel):
+            title: str = Field(description="Page title")
+
+        cache = InMemoryCache()
+        client = MockClient(api_key="sgai-test-api-key")
+        plain = SmartScraperTool(
+            api_key="sgai-test-api-key", client=client, cache=cache
+        )
+        typed = SmartScraperTool(
+            api_key="sgai-test-api-key",
+            client=client,
+            cache=cache,
+            llm_output_schema=Title,
+        )
+        params = {"user_prompt": "Extract the title", "website_url": "https://a.com"}
+        assert plain._request_key(**params, website_html=None) != typed._request_key(
+            **params, website_html=None
+        )
+        assert plain._request_key(**params, website_html="<p>1</p>") != (
+            plain._request_key(**params, website_html="<p>2</p>")
+        )
+
+    def test_failed_extractions_are_not_cached(self):
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = SmartScraperTool(
+            api_key="sgai-test-api-key", client=client, cache=InMemoryCache()
+        )
+        failed = {"result": {}, "error": "Extraction failed"}
+        params = {"user_prompt": "Extract the title", "website_url": "https://a.com"}
+        with patch.object(client, "smartscraper", return_value=failed):
+            tool.invoke(params)
+        assert len(tool.cache) == 0
+        tool.invoke(params)
+        assert len(tool.cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_async_extractions_are_not_cached(self):
+        tool = SmartScraperTool(api_key="sgai-test-api-key", cache=InMemoryCache())
+        tool.async_client = MockAsyncClient(api_key="sgai-test-api-key")
+        failed = {"result": {}, "error": "Extraction failed"}
+        params = {"user_prompt": "Extract the title", "website_url": "https://a.com"}
+        with patch.object(tool.async_client._sync, "smartscraper", return_value=failed):
+            await tool.ainvoke(params)
+        assert len(tool.cache) == 0
+        await tool.ainvoke(params)
+        assert len(tool.cache) == 1
+
+
+class TestMarkdownifyCaching:
+    def test_failed_conversions_are_not_cached(self):
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = MarkdownifyTool(
+            api_key="sgai-test-api-key", client=client, cache=InMemoryCache()
+        )
+        failed = {"result": "", "error": "Page could not be loaded"}
+        with patch.object(client, "markdownify", return_value=failed):
+            tool.invoke({"website_url": "https://a.com"})
+        assert len(tool.cache) == 0
+        assert tool.invoke({"website_url": "https://a.com"}).startswith("# Example")
+        assert len(tool.cache) == 1
+
+
+class TestSQLiteCache:
+    def test_roundtrip_and_ttl(self, tmp_path):
+        """Test storing, expiring and compressing values on disk."""
+        timer = FakeTimer()
+        cache = SQLiteCache(tmp_path / "cache.db", ttl=10, timer=timer)
+        page = {"result": "# Title\n\n" + "lorem ipsum " * 500}
+        cache.set("page", page)
+        cache.set("short", "v", ttl=1)
+        assert cache.get("page") == page
+        assert cache.size_bytes < len(page["result"]) / 10
+        timer.now = 5
+        assert cache.get("short") is None
+        timer.now = 10
+        assert cache.get("page") is None
+        assert cache.stats.expirations == 2
+        assert len(cache) == 0
+
+    def test_size_bounded_lru_eviction(self, tmp_path):
+        """Test that least recently used entries are evicted past max_bytes."""
+        timer = FakeTimer()
+        cache = SQLiteCache(
+            tmp_path / "cache.db", ttl=None, touch_interval=1, timer=timer
+        )
+        cache.set("probe", "x" * 64)
+        entry_size = cache.size_bytes
+        cache.clear()
+        cache.max_bytes = entry_size * 2
+        for i, key in enumerate(["a", "b", "c"]):
+            timer.now = i
+            if key == "c":
+                cache.get("a")
+            cache.set(key, "x" * 64)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats.evictions == 1
+
+    def test_size_total_tracks_every_change(self, tmp_path):
+        """Test that the running size total stays equal to the entries' sizes."""
+        timer = FakeTimer()
+        cache = SQLiteCache(tmp_path / "cache.db", ttl=10, timer=timer)
+
+        def actual() -> int:
+            row = cache._connect().execute("SELECT SUM(size) FROM cache").fetchone()
+            return row[0] or 0
+
+        cache.set("a", "x" * 500)
+        cache.set("b", {"y": list(range(100))})
+        cache.set("a", "short")
+        assert cache.size_bytes == actual() > 0
+        cache.delete("b")
+        assert cache.size_bytes == actual()
+        timer.now = 10
+        assert cache.get("a") is None
+        assert cache.size_bytes == actual() == 0
+        cache.set("c", "z" * 200)
+        cache.clear()
+        assert cache.size_bytes == 0
+        assert SQLiteCache(tmp_path / "cache.db").size_bytes == 0
+
+    def test_reads_touch_entries_at_most_once_per_interval(self, tmp_path):
+        timer = FakeTimer()
+        cache = SQLiteCache(tmp_path / "cache.db", touch_interval=60, timer=timer)
+        cache.set("a", "value")
+
+        def accessed_at() -> float:
+            return (
+                cache._connect()
+                .execute("SELECT accessed_at FROM cache WHERE key = 'a'")
+                .fetchone()[0]
+            )
+
+        timer.now = 30
+        assert cache.get("a") == "value"
+        assert accessed_at() == 0
+        timer.now = 60
+        cache.get("a")
+        assert accessed_at() == 60
+
+    def test_shared_between_processes(self, tmp_path):
+        """Test concurrent writers in separate processes share one cache."""
+        path = str(tmp_path / "cache.db")
+        SQLiteCache(path)
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            found = list(pool.map(_write_entries, [path] * 4, range(4)))
+        assert found == [50] * 4
+        cache = SQLiteCache(path)
+        assert len(cache) == 200
+        assert cache.get("3-49") == {"worker": 3, "i": 49}
+
+    def test_tools_share_disk_cache(self, tmp_path):
+        """Test that tools in different workers reuse each other's results."""
+        path = tmp_path / "cache.db"
+        first = MockClient(api_key="sgai-test-api-key")
+        second = MockClient(api_key="sgai-test-api-key")
+        worker_a = MarkdownifyTool(
+            api_key="sgai-test-api-key", client=first, cache=SQLiteCache(path)
+        )
+        worker_b = MarkdownifyTool(
+            api_key="sgai-test-api-key", client=second, cache=SQLiteCache(path)
+        )
+        scrape = ScrapeTool(
+            api_key="sgai-test-api-key", client=second, cache=SQLiteCache(path)
+        )
+        with (
+            patch.object(second, "markdownify") as markdownify,
+            patch.object(second, "scrape", wraps=second.scrape) as scrape_call,
+        ):
+            expected = worker_a.invoke({"website_url": "https://example.com"})
+            assert worker_b.invoke({"website_url": "https://EXAMPLE.com/"}) == expected
+            scrape.invoke({"website_url": "https://example.com"})
+            scrape.invoke({"website_url": "https://example.com", "headers": {"a": "b"}})
+            scrape.invoke({"website_url": "https://example.com"})
+        markdownify.assert_not_called()
+        assert scrape_call.call_count == 2
@@ -0,0 +1,197 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from scrapegraph_py.exceptions import APIError
+
+from langchain_scrapegraph.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+)
+from langchain_scrapegraph.deadline import DeadlineExceeded
+from langchain_scrapegraph.tools import SmartCrawlerTool, SmartScraperTool
+from tests.unit_tests.mocks import MockAsyncClient, MockClient, SlowMockAsyncClient
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def fail(status_code: int = 503) -> None:
+    raise APIError("Service unavailable", status_code)
+
+
+def ok() -> str:
+    return "ok"
+
+
+class TestCircuitBreaker:
+    def test_opens_on_failure_rate_and_fails_fast(self):
+        """Test that the circuit opens once the failure rate is reached."""
+        breaker = CircuitBreaker(
+            failure_rate_threshold=0.5, window_size=10, min_calls=4, timer=FakeTimer()
+        )
+        breaker.call(ok)
+        breaker.call(ok)
+        with pytest.raises(APIError):
+            breaker.call(fail)
+        assert breaker.state == "closed"
+        with pytest.raises(APIError):
+            breaker.call(fail)
+        assert breaker.state == "open"
+
+        calls = []
+        with pytest.raises(CircuitOpenError) as exc:
+            breaker.call(calls.append, 1)
+        assert calls == []
+        assert exc.value.retry_after == 30
+
+    @pytest.mark.parametrize("status_code", [400, 429])
+    def test_client_errors_do_not_count(self, status_code):
+        breaker = CircuitBreaker(min_calls=2, timer=FakeTimer())
+        for _ in range(5):
+            with pytest.raises(APIError):
+                breaker.call(fail, status_code)
+        assert breaker.state == "closed"
+        assert breaker.failure_rate == 0
+
+    def test_half_open_probe(self):
+        """Test that a successful probe closes and a failed one reopens."""
+        timer = FakeTimer()
+        breaker = CircuitBreaker(min_calls=1, open_duration=10, timer=timer)
+        with pytest.raises(APIError):
+            breaker.call(fail)
+        timer.now = 10
+        assert breaker.state == "half_open"
+        with pytest.raises(ConnectionError):
+            breaker.call(_raise, ConnectionError("reset"))
+        assert breaker.state == "open"
+
+        timer.now = 20
+        breaker.allow()
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+        breaker.record()
+        assert breaker.state == "closed"
+
+    def test_interrupted_probe_frees_the_trial(self):
+        timer = FakeTimer()
+        breaker = CircuitBreaker(min_calls=1, open_duration=10, timer=timer)
+        with pytest.raises(APIError):
+            breaker.call(fail)
+        timer.now = 10
+        with pytest.raises(KeyboardInterrupt):
+            breaker.call(_raise, KeyboardInterrupt())
+        assert breaker.state == "half_open"
+        assert breaker.call(ok) == "ok"
+        assert breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_frees_the_trial(self):
+        timer = FakeTimer()
+        breaker = CircuitBreaker(min_calls=1, open_duration=10, timer=timer)
+        with pytest.raises(APIError):
+            breaker.call(fail)
+        timer.now = 10
+        task = asyncio.create_task(breaker.acall(asyncio.sleep, 10))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert await breaker.acall(asyncio.sleep, 0) is None
+        assert breaker.state == "closed"
+
+    def test_deadline_in_the_transport_is_a_failure(self):
+        """Test that a hung service trips the breaker once callers set deadlines."""
+        breaker = CircuitBreaker(min_calls=3, timer=FakeTimer())
+        for _ in range(3):
+            with pytest.raises(DeadlineExceeded):
+                breaker.call(_raise, DeadlineExceeded("slow", during_request=True))
+        assert breaker.state == "open"
+
+    def test_deadline_before_the_request_is_not_counted(self):
+        """Test that a probe timing out before reaching the API frees its slot."""
+        timer = FakeTimer()
+        breaker = CircuitBreaker(min_calls=1, open_duration=10, timer=timer)
+        with pytest.raises(APIError):
+            breaker.call(fail)
+        timer.now = 10
+        with pytest.raises(DeadlineExceeded):
+            breaker.call(_raise, DeadlineExceeded("rate limit"))
+        assert breaker.state == "half_open"
+        with pytest.raises(DeadlineExceeded):
+            breaker.call(_raise, DeadlineExceeded("slow", during_request=True))
+        assert breaker.state == "open"
+
+    @pytest.mark.asyncio
+    async def test_async_request_cut_by_the_deadline_is_a_failure(self):
+        registry = CircuitBreakerRegistry(min_calls=2)
+        tool = SmartScraperTool(
+            api_key="sgai-test-api-key", retry_policy=None, timeout=0.05
+        )
+        tool.async_client = SlowMockAsyncClient(api_key="sgai-test-api-key")
+        with patch("langchain_scrapegraph.tools.base.circuit_breakers", registry):
+            for i in range(2):
+                with pytest.raises(DeadlineExceeded):
+                    await tool.ainvoke(
+                        {"user_prompt": "x", "website_url": f"https://{i}.example"}
+                    )
+        assert registry.state("smartscraper") == "open"
+
+
+class TestCircuitBreakerRegistry:
+    def test_states_are_readable_per_service(self):
+        registry = CircuitBreakerRegistry(min_calls=1)
+        with pytest.raises(APIError):
+            registry.get("crawl").call(fail)
+        registry.get("smartscraper").call(ok)
+        assert registry.states() == {"crawl": "open", "smartscraper": "closed"}
+        registry.reset()
+        assert registry.state("crawl") == "closed"
+
+    def test_tripped_service_fails_fast_for_tools(self):
+        """Test that a degraded crawl backend stops being called."""
+        registry = CircuitBreakerRegistry(min_calls=3)
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = SmartCrawlerTool(
+            api_key="sgai-test-api-key",
+            client=client,
+            retry_policy=None,
+            handle_tool_error=True,
+        )
+        params = {"prompt": "Extract the titles", "url": "https://example.com"}
+        with (
+            patch("langchain_scrapegraph.tools.base.circuit_breakers", registry),
+            patch.object(
+                client, "crawl", side_effect=APIError("Gateway timeout", 504)
+            ) as crawl,
+        ):
+            for _ in range(3):
+                with pytest.raises(APIError):
+                    tool.invoke(params)
+            message = tool.invoke(params)
+        assert crawl.call_count == 3
+        assert registry.state("crawl") == "open"
+        assert "crawl service is temporarily unavailable" in message
+
+    @pytest.mark.asyncio
+    async def test_async_tools_share_the_breaker(self):
+        registry = CircuitBreakerRegistry(min_calls=1)
+        with pytest.raises(ConnectionError):
+            registry.get("crawl").call(_raise, ConnectionError("reset"))
+        tool = SmartCrawlerTool(api_key="sgai-test-api-key", retry_policy=None)
+        tool.async_client = MockAsyncClient(api_key="sgai-test-api-key")
+        with patch("langchain_scrapegraph.tools.base.circuit_breakers", registry):
+            with pytest.raises(CircuitOpenError):
+                await tool.ainvoke(
+                    {"prompt": "Extract the titles", "url": "https://example.com"}
+                )
+
+
+def _raise(error: BaseException) -> None:
+    raise error
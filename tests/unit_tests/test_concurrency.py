@@ -0,0 +1,424 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from scrapegraph_py.exceptions import APIError
+
+from langchain_scrapegraph.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    AdaptiveConcurrencyRegistry,
+    SingleFlight,
+)
+from langchain_scrapegraph.deadline import DeadlineExceeded, deadline
+from langchain_scrapegraph.metrics import metrics
+from langchain_scrapegraph.tools import MarkdownifyTool, ScrapeTool, SmartScraperTool
+from tests.unit_tests.mocks import MockClient, SlowMockAsyncClient
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that threads asking for the same key wait on one call."""
+        flight = SingleFlight()
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def fetch() -> dict:
+            calls.append(1)
+            time.sleep(0.2)
+            return {"items": [1]}
+
+        def worker(_: int) -> dict:
+            barrier.wait()
+            return flight.do("key", fetch)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(worker, range(8)))
+
+        assert len(calls) == 1
+        assert all(r == {"items": [1]} for r in results)
+        results[0]["items"].append(2)
+        assert results[1] == {"items": [1]}
+
+    def test_errors_reach_every_waiter(self):
+        """Test that a failed call raises in every coalesced caller."""
+        flight = SingleFlight()
+        barrier = threading.Barrier(4)
+
+        def fail() -> None:
+            time.sleep(0.2)
+            raise RuntimeError("boom")
+
+        def worker(_: int) -> str:
+            barrier.wait()
+            try:
+                flight.do("key", fail)
+            except RuntimeError as e:
+                return str(e)
+            return "no error"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert list(pool.map(worker, range(4))) == ["boom"] * 4
+        assert flight.do("key", lambda: "again") == "again"
+
+    def test_waiter_stops_at_its_own_deadline(self):
+        """Test that a sync waiter gives up when its deadline passes."""
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def fetch() -> str:
+            started.set()
+            release.wait(5)
+            return "done"
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(flight.do, "key", fetch)
+            started.wait(5)
+            began = time.monotonic()
+            with deadline(0.1):
+                with pytest.raises(DeadlineExceeded):
+                    flight.do("key", fetch)
+            assert time.monotonic() - began < 1
+            release.set()
+            assert leader.result() == "done"
+
+    @pytest.mark.asyncio
+    async def test_async_errors_reach_every_waiter(self):
+        """Test that async waiters share both results and exceptions."""
+        flight = SingleFlight()
+        calls = []
+
+        async def fail() -> None:
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            raise ValueError("bad request")
+
+        results = await asyncio.gather(
+            *(flight.ado("key", fail) for _ in range(5)), return_exceptions=True
+        )
+        assert len(calls) == 1
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        """Test that one waiter going away leaves the shared call running."""
+        flight = SingleFlight()
+
+        async def fetch() -> str:
+            await asyncio.sleep(0.1)
+            return "done"
+
+        first = asyncio.create_task(flight.ado("key", fetch))
+        second = asyncio.create_task(flight.ado("key", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestToolCoalescing:
+    def test_identical_scrapes_send_one_request(self):
+        """Test that concurrent identical tool calls reach the API once."""
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = ScrapeTool(api_key="sgai-test-api-key", client=client)
+        scrape = client.scrape
+
+        def slow_scrape(**kwargs):
+            time.sleep(0.2)
+            return scrape(**kwargs)
+
+        with patch.object(client, "scrape", side_effect=slow_scrape) as call:
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                results = list(
+                    pool.map(
+                        lambda _: tool.invoke({"website_url": "https://example.com"}),
+                        range(6),
+                    )
+                )
+        assert call.call_count == 1
+        assert len({r["html"] for r in results}) == 1
+
+    def test_accounts_never_share_a_request(self):
+        """Test that identical calls with different API keys are not coalesced."""
+        client = MockClient(api_key="sgai-test-api-key")
+        first = MarkdownifyTool(api_key="sgai-key-a", client=client)
+        second = MarkdownifyTool(api_key="sgai-key-b", client=client)
+        markdownify = client.markdownify
+
+        def slow_markdownify(**kwargs):
+            time.sleep(0.1)
+            return markdownify(**kwargs)
+
+        with patch.object(client, "markdownify", side_effect=slow_markdownify) as call:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                list(
+                    pool.map(
+                        lambda tool: tool.invoke({"website_url": "https://a.com"}),
+                        [first, second],
+                    )
+                )
+        assert call.call_count == 2
+        assert first._request_key("https://a.com") != second._request_key(
+            "https://a.com"
+        )
+
+    def test_coalescing_can_be_disabled(self):
+        """Test that coalesce_requests=False sends every request."""
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = MarkdownifyTool(
+            api_key="sgai-test-api-key", client=client, coalesce_requests=False
+        )
+        markdownify = client.markdownify
+
+        def slow_markdownify(**kwargs):
+            time.sleep(0.1)
+            return markdownify(**kwargs)
+
+        with patch.object(client, "markdownify", side_effect=slow_markdownify) as call:
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                list(
+                    pool.map(
+                        lambda _: tool.invoke({"website_url": "https://example.com"}),
+                        range(3),
+                    )
+                )
+        assert call.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_identical_async_extractions_send_one_request(self):
+        """Test that gathered identical ainvoke calls share one request."""
+        async_client = SlowMockAsyncClient(api_key="sgai-test-api-key")
+        tool = SmartScraperTool(api_key="sgai-test-api-key")
+        tool.async_client = async_client
+        params = {"user_prompt": "Extract the title", "website_url": "https://a.com"}
+        with patch.object(
+            async_client._sync, "smartscraper", wraps=async_client._sync.smartscraper
+        ) as call:
+            results = await asyncio.gather(*(tool.ainvoke(params) for _ in range(10)))
+        assert call.call_count == 1
+        assert all(r == results[0] for r in results)
+
+
+class TestExtractMany:
+    def test_dedupes_and_yields_as_completed(self):
+        """Test that duplicates are fetched once and fast pages come first."""
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = SmartScraperTool(api_key="sgai-test-api-key", client=client)
+        smartscraper = client.smartscraper
+
+        def uneven(**kwargs):
+            time.sleep(0.3 if kwargs["website_url"].endswith("slow") else 0.01)
+            return smartscraper(**kwargs)
+
+        urls = [
+            "https://a.com/slow",
+            "https://a.com/1",
+            "https://A.com/1",
+            "https://a.com/2",
+        ]
+        with patch.object(client, "smartscraper", side_effect=uneven) as call:
+            items = list(
+                tool.extract_many(urls, "Extract the title", max_concurrency=3)
+            )
+        assert call.call_count == 3
+        assert [i["website_url"] for i in items][-1] == "https://a.com/slow"
+        assert {i["website_url"] for i in items} == {
+            "https://a.com/slow",
+            "https://a.com/1",
+            "https://a.com/2",
+        }
+        assert all(i["error"] is None for i in items)
+
+    def test_failures_do_not_abort_the_batch(self):
+        """Test that a failing page is reported and the rest still complete."""
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = SmartScraperTool(api_key="sgai-test-api-key", client=client)
+        smartscraper = client.smartscraper
+
+        def flaky(**kwargs):
+            if kwargs["website_url"].endswith("/bad"):
+                raise RuntimeError("page not found")
+            return smartscraper(**kwargs)
+
+        urls = [f"https://a.com/{i}" for i in range(20)] + ["https://a.com/bad"]
+        with patch.object(client, "smartscraper", side_effect=flaky):
+            items = list(tool.extract_many(urls, "Extract the title"))
+        failed = [i for i in items if i["error"]]
+        assert len(items) == 21
+        assert failed == [
+            {
+                "website_url": "https://a.com/bad",
+                "result": None,
+                "error": "page not found",
+            }
+        ]
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency requests run at once."""
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = SmartScraperTool(
+            api_key="sgai-test-api-key", client=client, coalesce_requests=False
+        )
+        smartscraper = client.smartscraper
+        lock = threading.Lock()
+        active = peak = 0
+
+        def tracked(**kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return smartscraper(**kwargs)
+
+        urls = (f"https://a.com/{i}" for i in range(30))
+        with patch.object(client, "smartscraper", side_effect=tracked):
+            assert len(list(tool.extract_many(urls, "x", max_concurrency=4))) == 30
+        assert peak <= 4
+
+    @pytest.mark.asyncio
+    async def test_async_bulk_extraction(self):
+        """Test the async variant dedupes, bounds and survives failures."""
+        async_client = SlowMockAsyncClient(api_key="sgai-test-api-key")
+        tool = SmartScraperTool(api_key="sgai-test-api-key")
+        tool.async_client = async_client
+        smartscraper = async_client._sync.smartscraper
+
+        def flaky(**kwargs):
+            if kwargs["website_url"].endswith("/bad"):
+                raise ValueError("bad page")
+            return smartscraper(**kwargs)
+
+        urls = [f"https://a.com/{i}" for i in range(10)] * 2 + ["https://a.com/bad"]
+        started = time.perf_counter()
+        with patch.object(
+            async_client._sync, "smartscraper", side_effect=flaky
+        ) as call:
+            items = [
+                item async for item in tool.aextract_many(urls, "x", max_concurrency=11)
+            ]
+        assert call.call_count == 11
+        assert len(items) == 11
+        assert [i["error"] for i in items if i["error"]] == ["bad page"]
+        assert time.perf_counter() - started < 2 * SlowMockAsyncClient.delay
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_window_grows_while_healthy(self):
+        """Test additive increase after each healthy window of calls."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_samples=2)
+        for _ in range(6):
+            limiter.acquire()
+            limiter.release(0.1)
+        assert limiter.limit == 4
+
+    def test_overload_shrinks_once_per_burst(self):
+        """Test that a burst of 429s halves the window only once."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        for _ in range(8):
+            limiter.acquire()
+        for _ in range(8):
+            limiter.release(0.5, APIError("Too many requests", status_code=429))
+        assert limiter.limit == 4
+        limiter.acquire()
+        limiter.release(0.0, APIError("Bad gateway", status_code=502))
+        assert limiter.limit == 2
+        limiter.acquire()
+        limiter.release(0.0, APIError("Bad request", status_code=400))
+        assert limiter.limit == 2
+
+    def test_latency_spike_shrinks_the_window(self):
+        """Test multiplicative decrease when p95 latency jumps."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, min_samples=4)
+        for latency in [0.1] * 4 + [0.1, 0.1, 0.1, 1.0, 1.0]:
+            limiter.acquire()
+            limiter.release(latency)
+        assert limiter.limit == 2
+
+    def test_threads_respect_the_window_and_gauge(self):
+        """Test that in-flight calls never exceed the window."""
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=3, max_limit=3, name="test-aimd"
+        )
+        lock = threading.Lock()
+        active = peak = 0
+
+        def work() -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            list(pool.map(lambda _: limiter.call(work), range(40)))
+        assert peak == 3
+        assert metrics.gauge("test-aimd.concurrency_limit") == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_async_waiter_frees_its_place(self):
+        """Test that cancelling a queued task does not leak a slot."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            await release.wait()
+
+        holder = asyncio.create_task(limiter.acall(hold))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(limiter.acall(hold))
+        await asyncio.sleep(0.01)
+        queued.cancel()
+        release.set()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert limiter.in_flight == 0
+        assert await asyncio.wait_for(limiter.acall(asyncio.sleep, 0), 1) is None
+
+    def test_default_gauge_names_are_scoped_by_key(self):
+        """Test that limiters of different keys publish separate gauges."""
+        registry = AdaptiveConcurrencyRegistry()
+        first = registry.configure("key-a", service="scrape", initial_limit=2)
+        second = registry.configure("key-b", service="scrape", initial_limit=5)
+        assert first.name != second.name
+        assert first.name.startswith("scrape.")
+        assert "key-a" not in first.name
+        assert registry.configure("key-a", name="custom").name == "custom"
+
+    @pytest.mark.asyncio
+    async def test_tools_use_the_configured_limiter(self):
+        """Test that tool calls go through the limiter for their service."""
+        registry = AdaptiveConcurrencyRegistry()
+        limiter = registry.configure(
+            "sgai-test-api-key", service="markdownify", initial_limit=2, max_limit=2
+        )
+        assert registry.get("sgai-test-api-key", "scrape") is None
+        tool = MarkdownifyTool(api_key="sgai-test-api-key")
+        tool.async_client = SlowMockAsyncClient(api_key="sgai-test-api-key")
+        peak = 0
+
+        async def watch() -> None:
+            nonlocal peak
+            while True:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        with patch("langchain_scrapegraph.tools.base.adaptive_concurrency", registry):
+            watcher = asyncio.create_task(watch())
+            await asyncio.gather(
+                *(
+                    tool.ainvoke({"website_url": f"https://example.com/{i}"})
+                    for i in range(6)
+                )
+            )
+            watcher.cancel()
+        assert peak == 2
+        assert metrics.histogram("markdownify.latency").count >= 6
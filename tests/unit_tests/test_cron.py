@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from langchain_scrapegraph.cron import CronExpression, find_hotspots
+from langchain_scrapegraph.tools.scheduled_jobs import (
+    CreateScheduledJobInput,
+    UpdateScheduledJobInput,
+)
+
+START = datetime(2024, 1, 1, 8, 30, tzinfo=timezone.utc)  # a Monday
+
+
+def brute_force(cron, after, count):
+    """Reference: step minute by minute."""
+    times, when = [], after.replace(second=0, microsecond=0)
+    while len(times) < count:
+        when += timedelta(minutes=1)
+        if cron.matches(when):
+            times.append(when)
+    return times
+
+
+class TestCronExpression:
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "0 9 * * *",
+            "*/15 9-17 * * mon-fri",
+            "5,35 */6 1,15 * *",
+            "0 0 13 * fri",
+            "30 2 * feb,aug sun",
+            "59 23 31 * *",
+            "0 0 * * 7",
+            "@weekly",
+            "0 0 */2 * 1",
+            "0 12 1-7 * */3",
+        ],
+    )
+    def test_next_times_match_minute_stepping(self, expression):
+        cron = CronExpression(expression)
+        assert cron.next_times(10, START) == brute_force(cron, START, 10)
+
+    def test_fire_times(self):
+        cron = CronExpression("*/15 9-17 * * mon-fri")
+        assert cron.next_times(3, START) == [
+            datetime(2024, 1, 1, 9, 0, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 9, 15, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 9, 30, tzinfo=timezone.utc),
+        ]
+        friday_night = datetime(2024, 1, 5, 17, 45)
+        assert CronExpression("*/15 9-17 * * 1-5").next_times(1, friday_night) == [
+            datetime(2024, 1, 8, 9, 0)
+        ]
+
+    def test_restricted_day_fields_match_either(self):
+        cron = CronExpression("0 0 13 * fri")
+        days = [t.day for t in cron.next_times(6, datetime(2024, 9, 1))]
+        # Fridays of September 2024 and the 13th, which is one of them.
+        assert days == [6, 13, 20, 27, 4, 11]
+
+    def test_stepped_wildcard_day_fields_match_both(self):
+        """Test that "*/2" leaves the day unrestricted, as in Vixie cron."""
+        cron = CronExpression("0 0 */2 * 1")
+        times = cron.next_times(4, datetime(2024, 9, 1))
+        # Mondays of September and October 2024 on odd days of the month.
+        assert [t.day for t in times] == [9, 23, 7, 21]
+        assert all(t.weekday() == 0 for t in times)
+
+    def test_leap_day_is_found_years_ahead(self):
+        cron = CronExpression("0 12 29 2 *")
+        assert cron.next_times(2, START) == [
+            datetime(2024, 2, 29, 12, tzinfo=timezone.utc),
+            datetime(2028, 2, 29, 12, tzinfo=timezone.utc),
+        ]
+
+    @pytest.mark.parametrize(
+        "expression, message",
+        [
+            ("0 9 * *", "5 fields"),
+            ("60 * * * *", "not within 0-59"),
+            ("* 24 * * *", "not within 0-23"),
+            ("* * 0 * *", "not within 1-31"),
+            ("* * * 13 *", "not within 1-12"),
+            ("* * * * 8", "not within 0-7"),
+            ("*/0 * * * *", "Invalid step"),
+            ("5-1 * * * *", "Invalid range"),
+            ("* * * foo *", "Invalid month"),
+            ("0 0 30 2 *", "never fires"),
+        ],
+    )
+    def test_invalid_expressions(self, expression, message):
+        with pytest.raises(ValueError, match=message):
+            CronExpression(expression)
+
+    def test_input_models_validate_cron(self):
+        job = {
+            "job_name": "prices",
+            "service_type": "smartscraper",
+            "job_config": {},
+        }
+        CreateScheduledJobInput(cron_expression="0 9 * * 1-5", **job)
+        with pytest.raises(ValidationError, match="not within 0-23"):
+            CreateScheduledJobInput(cron_expression="0 25 * * *", **job)
+        UpdateScheduledJobInput(job_id="job-1", job_name="renamed")
+        with pytest.raises(ValidationError, match="5 fields"):
+            UpdateScheduledJobInput(job_id="job-1", cron_expression="daily")
+
+
+class TestHotspots:
+    def test_jobs_firing_together_are_reported(self):
+        schedules = {
+            "a": "0 9 * * *",
+            "b": "0 9 * * *",
+            "c": "0 */3 * * *",
+            "d": "17 9 * * *",
+        }
+        start = datetime(2024, 1, 1)
+        hotspots = find_hotspots(schedules, threshold=2, start=start)
+        assert hotspots == [
+            {"time": datetime(2024, 1, 1, 9), "count": 3, "jobs": ["a", "b", "c"]}
+        ]
+        assert find_hotspots(schedules, threshold=4, start=start) == []
+
+    def test_horizon_bounds_the_search(self):
+        schedules = {"a": "0 0 * * *", "b": "@daily"}
+        start = datetime(2024, 1, 1, 0, 1)
+        spots = find_hotspots(schedules, start=start, horizon=timedelta(days=3))
+        assert [spot["time"].day for spot in spots] == [2, 3, 4]
@@ -0,0 +1,145 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+from scrapegraph_py import Client
+from scrapegraph_py.exceptions import APIError
+
+from langchain_scrapegraph.deadline import (
+    DeadlineAdapter,
+    DeadlineExceeded,
+    current_deadline,
+    deadline,
+    enforce_deadlines,
+)
+from langchain_scrapegraph.ratelimit import RateLimiter
+from langchain_scrapegraph.retry import RetryPolicy
+from langchain_scrapegraph.tools import MarkdownifyTool, SmartScraperTool
+from tests.unit_tests.mocks import MockClient, SlowMockAsyncClient
+
+API_KEY = "sgai-00000000-0000-0000-0000-000000000000"
+
+
+class TestDeadlineScope:
+    def test_nested_deadlines_only_shorten(self):
+        assert current_deadline() is None
+        with deadline(10) as outer:
+            with deadline(60) as inner:
+                assert inner is outer
+            with deadline(1) as inner:
+                assert inner.remaining() <= 1
+            with deadline(None) as same:
+                assert same is outer
+        assert current_deadline() is None
+
+    @pytest.mark.asyncio
+    async def test_deadline_follows_into_tasks(self):
+        with deadline(5) as current:
+            assert await asyncio.create_task(_get_deadline()) is current
+
+
+async def _get_deadline():
+    return current_deadline()
+
+
+class TestDeadlineAdapter:
+    def test_sdk_client_keeps_its_retries(self):
+        client = Client(api_key=API_KEY)
+        enforce_deadlines(client)
+        adapter = client.session.get_adapter("https://api.scrapegraphai.com")
+        assert isinstance(adapter, DeadlineAdapter)
+        assert adapter.max_retries.total == 3
+
+    def test_request_timeout_is_clamped_to_the_deadline(self):
+        """Test that the transport timeout never outlives the deadline."""
+        client = Client(api_key=API_KEY, timeout=120)
+        enforce_deadlines(client)
+        seen = []
+
+        def send(self, request, **kwargs):
+            seen.append(kwargs["timeout"])
+            time.sleep(min(kwargs["timeout"], 0.06))
+            raise requests.ReadTimeout("read timed out")
+
+        with patch.object(requests.adapters.HTTPAdapter, "send", send):
+            with pytest.raises(ConnectionError):
+                client.get_credits()
+            with deadline(0.0):
+                with pytest.raises(DeadlineExceeded):
+                    client.get_credits()
+            with deadline(0.05):
+                with pytest.raises(DeadlineExceeded):
+                    client.get_credits()
+        assert seen[0] == 120
+        assert len(seen) == 2
+        assert seen[1] <= 0.05
+
+
+class TestToolDeadlines:
+    def test_rate_limit_wait_respects_the_deadline(self):
+        limiter = RateLimiter()
+        limiter.configure("sgai-test-api-key", rate=0.1, capacity=1)
+        tool = MarkdownifyTool(
+            api_key="sgai-test-api-key",
+            client=MockClient(api_key="sgai-test-api-key"),
+            timeout=0.2,
+        )
+        with patch("langchain_scrapegraph.tools.base.rate_limiter", limiter):
+            tool.invoke({"website_url": "https://example.com/1"})
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                tool.invoke({"website_url": "https://example.com/2"})
+        assert time.monotonic() - started < 0.1
+
+    def test_retries_stop_at_the_deadline(self):
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = SmartScraperTool(
+            api_key="sgai-test-api-key",
+            client=client,
+            retry_policy=RetryPolicy(
+                max_attempts=10, base_delay=0.5, max_delay=0.5, use_budget=False
+            ),
+        )
+        tool.retry_policy.backoff = lambda retry: 0.3
+        with patch.object(
+            client, "smartscraper", side_effect=APIError("Unavailable", 503)
+        ) as call:
+            started = time.monotonic()
+            with deadline(0.5), pytest.raises(APIError):
+                tool.invoke({"user_prompt": "x", "website_url": "https://a.com"})
+        assert call.call_count == 2
+        assert time.monotonic() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_async_timeout_cancels_the_request(self):
+        """Test that the in-flight request is cancelled at the deadline."""
+        cancelled = asyncio.Event()
+
+        class HangingClient(SlowMockAsyncClient):
+            async def markdownify(self, **kwargs):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+        tool = MarkdownifyTool(api_key="sgai-test-api-key", timeout=0.1)
+        tool.async_client = HangingClient(api_key="sgai-test-api-key")
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            await tool.ainvoke({"website_url": "https://example.com"})
+        assert time.monotonic() - started < 1
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_per_call_deadline(self):
+        tool = SmartScraperTool(api_key="sgai-test-api-key")
+        tool.async_client = SlowMockAsyncClient(api_key="sgai-test-api-key")
+        params = {"user_prompt": "x", "website_url": "https://deadline.example"}
+        with deadline(0.05):
+            with pytest.raises(DeadlineExceeded):
+                await tool.ainvoke(params)
+        result = await tool.ainvoke(params)
+        assert result["main_heading"] == "Example Domain"
@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import pytest
+
+from langchain_scrapegraph.concurrency import AdaptiveConcurrencyRegistry
+from langchain_scrapegraph.estimate import estimate_batch
+from langchain_scrapegraph.metrics import MetricsRegistry
+from langchain_scrapegraph.ratelimit import RateLimiter
+from langchain_scrapegraph.tools import (
+    SearchScraperTool,
+    SmartCrawlerTool,
+    SmartScraperTool,
+)
+
+API_KEY = "sgai-test-api-key"
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    with patch("langchain_scrapegraph.estimate.metrics", registry):
+        yield registry
+
+
+class TestEstimateBatch:
+    def test_credits_follow_documented_costs(self, registry):
+        search = SearchScraperTool(api_key=API_KEY)
+        crawler = SmartCrawlerTool(api_key=API_KEY)
+        scraper = SmartScraperTool(api_key=API_KEY)
+        plan = [
+            (search, {"user_prompt": "a"}),
+            (search, {"user_prompt": "b", "extraction_mode": False}),
+            (crawler, {"prompt": "c", "url": "https://a.com", "max_pages": 10}),
+            (scraper, {"user_prompt": "d", "website_url": "https://a.com"}),
+        ]
+        estimate = estimate_batch(plan)
+        assert estimate["calls"] == 4
+        assert estimate["credits"] == 30 + 6 + 100 + 10
+        assert estimate["services"]["searchscraper"]["calls"] == 2
+
+    def test_duration_uses_recorded_latencies(self, registry):
+        scraper = SmartScraperTool(api_key=API_KEY)
+        crawler = SmartCrawlerTool(api_key=API_KEY)
+        for _ in range(20):
+            registry.observe("smartscraper.latency", 2.0)
+            registry.observe("crawl.latency", 0.5)
+            registry.observe("crawl.job_latency", 60.0)
+        plan = [(scraper, {"website_url": f"https://a.com/{i}"}) for i in range(40)]
+        estimate = estimate_batch(plan, max_concurrency=8)
+        # 40 calls of ~2s over 8 lanes.
+        assert estimate["duration"] == pytest.approx(10, rel=0.1)
+        assert estimate["services"]["smartscraper"]["latency_source"] == "latency"
+
+        plan.append((crawler, {"url": "https://a.com", "prompt": "p"}))
+        estimate = estimate_batch(plan, max_concurrency=8)
+        # The crawl's time to completion dominates.
+        assert estimate["duration"] == pytest.approx(60, rel=0.1)
+        assert estimate["services"]["crawl"]["latency_source"] == "job_latency"
+
+    def test_unknown_services_use_the_default(self, registry):
+        scraper = SmartScraperTool(api_key=API_KEY)
+        plan = [(scraper, {"website_url": "https://a.com"})] * 4
+        estimate = estimate_batch(plan, max_concurrency=2, default_latency=3)
+        assert estimate["duration"] == 6
+        assert estimate["services"]["smartscraper"]["latency_source"] == "default"
+        assert registry.snapshot()["latency"] == {}
+
+    def test_configured_limits_bound_the_duration(self, registry):
+        scraper = SmartScraperTool(api_key=API_KEY)
+        plan = [(scraper, {"website_url": "https://a.com"})] * 20
+        limiter = RateLimiter()
+        limiter.configure(API_KEY, rate=2, capacity=4)
+        with patch("langchain_scrapegraph.estimate.rate_limiter", limiter):
+            estimate = estimate_batch(plan, max_concurrency=20, default_latency=1)
+        assert estimate["duration"] == 8
+
+        concurrency = AdaptiveConcurrencyRegistry()
+        concurrency.configure(API_KEY, "smartscraper", initial_limit=2, max_limit=8)
+        with patch("langchain_scrapegraph.estimate.adaptive_concurrency", concurrency):
+            estimate = estimate_batch(plan, max_concurrency=20, default_latency=1)
+        assert estimate["services"]["smartscraper"]["concurrency"] == 2
+        assert estimate["duration"] == 10
@@ -0,0 +1,168 @@
+import pytest
+
+from langchain_scrapegraph.execution_sync import CursorStore, ExecutionSync
+from langchain_scrapegraph.tools import GetJobExecutionsTool
+from tests.unit_tests.mocks import MockAsyncClient, MockPagedClient
+
+API_KEY = "sgai-test-api-key"
+
+
+def syncer(jobs=3, **kwargs):
+    tool = GetJobExecutionsTool(api_key=API_KEY)
+    tool.async_client = MockAsyncClient(api_key=API_KEY)
+    client = tool.async_client._sync = MockPagedClient(API_KEY, jobs=jobs)
+    return ExecutionSync(tool, page_size=5, **kwargs), client
+
+
+def drain(queue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+class TestExecutionSync:
+    @pytest.mark.asyncio
+    async def test_first_sync_publishes_the_whole_history(self):
+        sync, client = syncer()
+        for _ in range(12):
+            client.run_job("job-0")
+        queue = sync.subscribe()
+        summary = await sync.sync()
+        assert summary == {"jobs": 3, "events": 12, "errors": {}}
+        events = drain(queue)
+        # Oldest first.
+        assert [e["execution"]["id"] for e in events] == [
+            f"job-0-run-{i}" for i in range(12)
+        ]
+        assert {e["event"] for e in events} == {"new"}
+
+    @pytest.mark.asyncio
+    async def test_later_syncs_fetch_only_new_executions(self):
+        sync, client = syncer(jobs=1)
+        for _ in range(40):
+            client.run_job("job-0")
+        queue = sync.subscribe()
+        await sync.sync(["job-0"])
+        drain(queue)
+        client.requested.clear()
+        assert (await sync.sync(["job-0"]))["events"] == 0
+        # Known records on the first page end the walk.
+        assert client.requested == [1]
+        for _ in range(7):
+            client.run_job("job-0")
+        client.requested.clear()
+        await sync.sync(["job-0"])
+        assert [e["execution"]["id"] for e in drain(queue)] == [
+            f"job-0-run-{i}" for i in range(40, 47)
+        ]
+        assert client.requested == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_oldest_first_pages_are_read_in_full(self):
+        """Test that new executions are found when the API lists oldest first."""
+        sync, client = syncer(jobs=1)
+        client.oldest_first = True
+        for _ in range(12):
+            client.run_job("job-0")
+        queue = sync.subscribe()
+        assert (await sync.sync(["job-0"]))["events"] == 12
+        assert [e["execution"]["id"] for e in drain(queue)] == [
+            f"job-0-run-{i}" for i in range(12)
+        ]
+        for _ in range(2):
+            client.run_job("job-0")
+        client.requested.clear()
+        assert (await sync.sync(["job-0"]))["events"] == 2
+        assert [e["execution"]["id"] for e in drain(queue)] == [
+            "job-0-run-12",
+            "job-0-run-13",
+        ]
+        assert client.requested == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_unfinished_executions_are_followed_until_done(self):
+        sync, client = syncer(jobs=1)
+        running = client.run_job("job-0", status="running")
+        for _ in range(8):
+            client.run_job("job-0")
+        queue = sync.subscribe()
+        await sync.sync(["job-0"])
+        assert len(drain(queue)) == 9
+        await sync.sync(["job-0"])
+        assert drain(queue) == []
+        running["status"] = "failed"
+        await sync.sync(["job-0"])
+        events = drain(queue)
+        assert [(e["event"], e["execution"]["id"]) for e in events] == [
+            ("updated", "job-0-run-0")
+        ]
+        client.requested.clear()
+        await sync.sync(["job-0"])
+        assert drain(queue) == [] and client.requested == [1]
+
+    @pytest.mark.asyncio
+    async def test_cursors_persist_across_instances(self, tmp_path):
+        store = CursorStore(str(tmp_path / "cursors.db"))
+        sync, client = syncer(jobs=1, store=store)
+        for _ in range(3):
+            client.run_job("job-0")
+        await sync.sync(["job-0"])
+        store.close()
+        again = ExecutionSync(
+            sync.tool, store=CursorStore(str(tmp_path / "cursors.db")), page_size=5
+        )
+        client.run_job("job-0")
+        queue = again.subscribe()
+        assert (await again.sync(["job-0"]))["events"] == 1
+        assert drain(queue)[0]["execution"]["id"] == "job-0-run-3"
+
+    @pytest.mark.asyncio
+    async def test_failed_job_keeps_its_cursor(self):
+        sync, client = syncer(jobs=2)
+        client.run_job("job-0")
+        client.run_job("job-1")
+        fetch = client.get_job_executions
+
+        def flaky(job_id, **kwargs):
+            if job_id == "job-1":
+                raise ConnectionError("reset")
+            return fetch(job_id, **kwargs)
+
+        client.get_job_executions = flaky
+        queue = sync.subscribe()
+        summary = await sync.sync()
+        assert summary["errors"] == {"job-1": "reset"}
+        assert len(drain(queue)) == 1
+        client.get_job_executions = fetch
+        assert (await sync.sync())["events"] == 1
+        assert drain(queue)[0]["job_id"] == "job-1"
+
+    @pytest.mark.asyncio
+    async def test_every_subscriber_gets_every_event(self):
+        sync, client = syncer(jobs=1)
+        first, second = sync.subscribe(), sync.subscribe()
+        client.run_job("job-0")
+        await sync.sync(["job-0"])
+        sync.unsubscribe(second)
+        client.run_job("job-0")
+        await sync.sync(["job-0"])
+        assert len(drain(first)) == 2
+        assert len(drain(second)) == 1
+
+    @pytest.mark.asyncio
+    async def test_naive_and_aware_timestamps_mix(self):
+        """Test that timestamps without an offset are read as UTC."""
+        sync, client = syncer(jobs=1)
+        client.run_job("job-0")
+        client.run_job("job-0")["started_at"] = "2024-01-01T00:01:00"
+        queue = sync.subscribe()
+        assert await sync.sync(["job-0"]) == {"jobs": 1, "events": 2, "errors": {}}
+        client.run_job("job-0")["started_at"] = "2024-01-01T01:02:00+01:00"
+        client.run_job("job-0")
+        drain(queue)
+        assert (await sync.sync(["job-0"]))["events"] == 2
+        assert [e["execution"]["id"] for e in drain(queue)] == [
+            "job-0-run-2",
+            "job-0-run-3",
+        ]
@@ -0,0 +1,180 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from langchain_scrapegraph.deadline import DeadlineExceeded, deadline
+from langchain_scrapegraph.hedging import HedgingPolicy
+from langchain_scrapegraph.metrics import LatencyHistogram, metrics
+from langchain_scrapegraph.tools import SmartScraperTool
+from tests.unit_tests.mocks import MockAsyncClient, MockClient
+
+
+def primed_histogram(latency: float = 0.01, samples: int = 50) -> LatencyHistogram:
+    histogram = LatencyHistogram()
+    for _ in range(samples):
+        histogram.observe(latency)
+    return histogram
+
+
+class SlowFirstCall:
+    """Async callable whose first invocation hangs."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        call = self.calls
+        try:
+            await asyncio.sleep(5 if call == 1 else 0.01)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"call {call}"
+
+
+class TestHedgingPolicy:
+    @pytest.mark.asyncio
+    async def test_no_hedging_without_history(self):
+        policy = HedgingPolicy(min_samples=20)
+        fn = SlowFirstCall()
+        fn.calls = 1
+        assert await policy.acall(LatencyHistogram(), fn) == "call 2"
+        assert policy.hedged == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged_and_loser_cancelled(self):
+        """Test that the duplicate wins and the slow original is cancelled."""
+        policy = HedgingPolicy(max_ratio=1.0)
+        fn = SlowFirstCall()
+        started = time.monotonic()
+        assert await policy.acall(primed_histogram(), fn) == "call 2"
+        await asyncio.sleep(0)
+        assert time.monotonic() - started < 1
+        assert fn.cancelled == 1
+        assert policy.hedged == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_copy_falls_back_to_the_other(self):
+        """Test that a failing hedge does not hide the original's answer."""
+        policy = HedgingPolicy(max_ratio=1.0)
+        calls = 0
+
+        async def fn() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise ConnectionError("reset")
+            await asyncio.sleep(0.2)
+            return "original"
+
+        assert await policy.acall(primed_histogram(), fn) == "original"
+
+    @pytest.mark.asyncio
+    async def test_hedges_are_capped_to_a_fraction_of_calls(self):
+        policy = HedgingPolicy(max_ratio=0.1)
+        histogram = primed_histogram(latency=0.001)
+
+        async def slowish() -> str:
+            await asyncio.sleep(0.06)
+            return "ok"
+
+        await asyncio.gather(*(policy.acall(histogram, slowish) for _ in range(30)))
+        assert 1 <= policy.hedged <= 3
+
+    def test_sync_hedging(self):
+        """Test that the sync path returns the faster duplicate."""
+        policy = HedgingPolicy(max_ratio=1.0)
+        calls = 0
+
+        def fn() -> str:
+            nonlocal calls
+            calls += 1
+            time.sleep(1 if calls == 1 else 0.01)
+            return f"call {calls}"
+
+        started = time.monotonic()
+        assert policy.call(primed_histogram(), fn) == "call 2"
+        assert time.monotonic() - started < 0.5
+
+    def test_queueing_for_a_worker_does_not_trigger_hedges(self):
+        """Test that the hedge delay starts when the call starts, not when queued."""
+        policy = HedgingPolicy(max_ratio=1.0)
+        busy = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        busy.submit(time.sleep, 0.3)
+        calls = []
+
+        def fn() -> str:
+            calls.append(1)
+            time.sleep(0.005)
+            return "ok"
+
+        with patch("langchain_scrapegraph.hedging._executor", busy):
+            assert policy.call(primed_histogram(latency=0.05), fn) == "ok"
+        busy.shutdown()
+        assert calls == [1]
+        assert policy.hedged == 0
+
+    def test_runs_inline_when_every_worker_is_busy(self):
+        """Test that a saturated pool makes calls run unhedged on the caller."""
+        policy = HedgingPolicy(max_ratio=1.0)
+        threads = []
+
+        def fn() -> str:
+            threads.append(threading.current_thread())
+            time.sleep(0.1)
+            return "ok"
+
+        with patch("langchain_scrapegraph.hedging._workers", threading.Semaphore(0)):
+            assert policy.call(primed_histogram(latency=0.01), fn) == "ok"
+        assert threads == [threading.current_thread()]
+        assert policy.hedged == 0
+
+    def test_waiting_for_a_worker_respects_the_deadline(self):
+        """Test that a call stuck behind busy workers ends at its deadline."""
+        policy = HedgingPolicy(max_ratio=1.0)
+        busy = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        busy.submit(time.sleep, 0.5)
+        started = time.monotonic()
+        with patch("langchain_scrapegraph.hedging._executor", busy):
+            with deadline(0.05), pytest.raises(DeadlineExceeded):
+                policy.call(primed_histogram(latency=0.01), lambda: "ok")
+        assert time.monotonic() - started < 0.3
+        busy.shutdown()
+
+
+class SlowFirstAsyncClient(MockAsyncClient):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    async def smartscraper(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(5 if self.calls == 1 else 0.01)
+        return self._sync.smartscraper(**kwargs)
+
+
+class TestSmartScraperHedging:
+    @pytest.mark.asyncio
+    async def test_tool_hedges_slow_extractions(self):
+        histogram = metrics.histogram("smartscraper.latency")
+        for _ in range(50):
+            histogram.observe(0.02)
+        tool = SmartScraperTool(
+            api_key="sgai-test-api-key",
+            client=MockClient(api_key="sgai-test-api-key"),
+            hedging=HedgingPolicy(max_ratio=1.0),
+        )
+        tool.async_client = SlowFirstAsyncClient(api_key="sgai-test-api-key")
+        started = time.monotonic()
+        result = await tool.ainvoke(
+            {"user_prompt": "Extract the title", "website_url": "https://a.com"}
+        )
+        assert result["main_heading"] == "Example Domain"
+        assert tool.async_client.calls == 2
+        assert time.monotonic() - started < 1
@@ -0,0 +1,116 @@
+from unittest.mock import patch
+
+import pytest
+
+from langchain_scrapegraph.ledger import CreditLedger
+from langchain_scrapegraph.metrics import MetricsRegistry
+from langchain_scrapegraph.tools import (
+    GetCreditsTool,
+    SearchScraperTool,
+    SmartScraperTool,
+)
+from tests.unit_tests.mocks import MockAsyncClient, MockClient
+
+API_KEY = "sgai-test-api-key"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def ledger():
+    ledger = CreditLedger(ttl=60, max_unreconciled=100, timer=FakeClock())
+    with (
+        patch("langchain_scrapegraph.tools.base.credit_ledger", ledger),
+        patch("langchain_scrapegraph.tools.credits.credit_ledger", ledger),
+    ):
+        yield ledger
+
+
+class TestCreditLedger:
+    def test_documented_costs(self):
+        ledger = CreditLedger()
+        assert ledger.estimate("smartscraper", {}) == 10
+        assert ledger.estimate("markdownify", {}) == 2
+        assert ledger.estimate("searchscraper", {}) == 30
+        assert ledger.estimate("searchscraper", {"num_results": 5}) == 50
+        assert ledger.estimate("searchscraper", {"extraction_mode": False}) == 6
+        assert ledger.estimate("crawl", {"max_pages": 10}) == 100
+        assert ledger.estimate("get_crawl", {"crawl_id": "x"}) == 0
+
+    def test_unknown_balance_is_affordable(self):
+        ledger = CreditLedger()
+        assert ledger.remaining(API_KEY) is None
+        assert ledger.can_afford(API_KEY, 1000)
+
+
+class TestGetCreditsWithLedger:
+    def test_repeated_checks_are_answered_locally(self, ledger):
+        client = MockClient(api_key=API_KEY)
+        credits = GetCreditsTool(api_key=API_KEY, client=client)
+        scraper = SmartScraperTool(api_key=API_KEY, client=client)
+        with patch.object(client, "get_credits", wraps=client.get_credits) as fetch:
+            assert credits.invoke({}) == {
+                "remaining_credits": 50,
+                "total_credits_used": 543,
+            }
+            scraper.invoke(
+                {"user_prompt": "Extract", "website_url": "https://example.com"}
+            )
+            assert credits.invoke({}) == {
+                "remaining_credits": 40,
+                "total_credits_used": 553,
+            }
+        assert fetch.call_count == 1
+        assert not ledger.can_afford(API_KEY, 41)
+
+    def test_reconciles_after_ttl_and_reports_drift(self, ledger):
+        client = MockClient(api_key=API_KEY)
+        credits = GetCreditsTool(api_key=API_KEY, client=client)
+        registry = MetricsRegistry()
+        with patch("langchain_scrapegraph.ledger.metrics", registry):
+            credits.invoke({})
+            ledger.charge(API_KEY, 5)
+            ledger._timer.now = 61
+            with patch.object(client, "get_credits", wraps=client.get_credits) as fetch:
+                assert credits.invoke({})["remaining_credits"] == 50
+        assert fetch.call_count == 1
+        # The local estimate (45) was 5 credits below the server's figure.
+        assert registry.gauge("credits.drift") == -5
+
+    def test_reconciles_after_large_spending(self, ledger):
+        client = MockClient(api_key=API_KEY)
+        credits = GetCreditsTool(api_key=API_KEY, client=client)
+        search = SearchScraperTool(api_key=API_KEY, client=client)
+        credits.invoke({})
+        with patch.object(client, "searchscraper", return_value={"result": {}}):
+            for _ in range(4):
+                search.invoke({"user_prompt": "Find pricing"})
+        assert ledger.remaining(API_KEY) == 50 - 120
+        assert ledger.needs_refresh(API_KEY)
+        assert credits.invoke({})["remaining_credits"] == 50
+
+    def test_ledger_can_be_bypassed(self, ledger):
+        client = MockClient(api_key=API_KEY)
+        credits = GetCreditsTool(api_key=API_KEY, client=client, use_ledger=False)
+        with patch.object(client, "get_credits", wraps=client.get_credits) as fetch:
+            credits.invoke({})
+            credits.invoke({})
+        assert fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_calls_are_charged(self, ledger):
+        credits = GetCreditsTool(api_key=API_KEY)
+        credits.async_client = MockAsyncClient(api_key=API_KEY)
+        scraper = SmartScraperTool(api_key=API_KEY)
+        scraper.async_client = credits.async_client
+        await credits.ainvoke({})
+        await scraper.ainvoke(
+            {"user_prompt": "Extract", "website_url": "https://example.com"}
+        )
+        assert (await credits.ainvoke({}))["remaining_credits"] == 40
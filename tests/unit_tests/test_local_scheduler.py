@@ -0,0 +1,209 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from scrapegraph_py.exceptions import APIError
+
+from langchain_scrapegraph.local_scheduler import LocalScheduler
+from langchain_scrapegraph.tools import (
+    CreateScheduledJobTool,
+    DeleteScheduledJobTool,
+    GetJobExecutionsTool,
+    GetScheduledJobsTool,
+    GetScheduledJobTool,
+    PauseScheduledJobTool,
+    ResumeScheduledJobTool,
+    TriggerScheduledJobTool,
+    UpdateScheduledJobTool,
+)
+
+API_KEY = "sgai-test-api-key"
+CONFIG = {"website_url": "https://example.com", "user_prompt": "Extract"}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+
+def echo(service_type, job_config):
+    return {"service_type": service_type, **job_config}
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock):
+    scheduler = LocalScheduler(runner=echo, clock=clock)
+    yield scheduler
+    scheduler.close()
+
+
+def create(scheduler, cron="*/5 * * * *", **fields):
+    job = {
+        "job_name": "prices",
+        "service_type": "smartscraper",
+        "cron_expression": cron,
+        "job_config": CONFIG,
+        **fields,
+    }
+    return scheduler.create_scheduled_job(**job)
+
+
+def executions(scheduler, job_id):
+    return scheduler.get_job_executions(job_id, page_size=100)["executions"]
+
+
+class TestLocalScheduler:
+    def test_tools_work_against_the_scheduler(self, scheduler):
+        def tool(tool_class):
+            return tool_class(api_key=API_KEY, client=scheduler.client())
+
+        job = tool(CreateScheduledJobTool).invoke(
+            {
+                "job_name": "prices",
+                "service_type": "smartscraper",
+                "cron_expression": "0 9 * * *",
+                "job_config": CONFIG,
+            }
+        )
+        assert job["next_run_at"] == "2024-01-01T09:00:00+00:00"
+        listing = tool(GetScheduledJobsTool).invoke({})
+        assert [j["id"] for j in listing["jobs"]] == [job["id"]]
+        assert listing["total"] == 1
+        update = {"job_id": job["id"], "cron_expression": "30 9 * * *"}
+        assert (
+            tool(UpdateScheduledJobTool)
+            .invoke(update)["next_run_at"]
+            .startswith("2024-01-01T09:30")
+        )
+        paused = tool(PauseScheduledJobTool).invoke({"job_id": job["id"]})
+        assert paused["is_active"] is False
+        fetched = tool(GetScheduledJobTool).invoke({"job_id": job["id"]})
+        assert fetched["is_active"] is False and fetched["next_run_at"] is None
+        tool(ResumeScheduledJobTool).invoke({"job_id": job["id"]})
+        triggered = tool(TriggerScheduledJobTool).invoke({"job_id": job["id"]})
+        history = tool(GetJobExecutionsTool)
+        wait_for(
+            lambda: history.invoke({"job_id": job["id"]})["executions"][0]["status"]
+            == "completed"
+        )
+        execution = history.invoke({"job_id": job["id"]})["executions"][0]
+        assert execution["id"] == triggered["execution_id"]
+        assert execution["credits_used"] == 10
+        assert execution["result"]["website_url"] == "https://example.com"
+        assert set(execution) >= {"id", "job_id", "status", "started_at"}
+        tool(DeleteScheduledJobTool).invoke({"job_id": job["id"]})
+        with pytest.raises(APIError) as error:
+            tool(GetScheduledJobTool).invoke({"job_id": job["id"]})
+        assert error.value.status_code == 404
+
+    def test_jobs_fire_on_their_schedule(self, scheduler, clock):
+        job = create(scheduler)
+        paused = create(scheduler, job_name="paused", is_active=False)
+        assert scheduler.run_due() == 0
+        clock.advance(minutes=5)
+        assert scheduler.run_due() == 1
+        clock.advance(minutes=12)
+        # Missed fire times are not caught up.
+        assert scheduler.run_due() == 1
+        assert scheduler.get_scheduled_job(job["id"])["next_run_at"] == (
+            "2024-01-01T00:20:00+00:00"
+        )
+        wait_for(lambda: len(executions(scheduler, job["id"])) == 2)
+        assert executions(scheduler, paused["id"]) == []
+
+    def test_updates_reschedule(self, scheduler, clock):
+        job = create(scheduler, cron="0 * * * *")
+        scheduler.update_scheduled_job(job["id"], cron_expression="*/10 * * * *")
+        clock.advance(minutes=10)
+        assert scheduler.run_due() == 1
+        scheduler.pause_scheduled_job(job["id"])
+        clock.advance(minutes=10)
+        assert scheduler.run_due() == 0
+        scheduler.delete_scheduled_job(job["id"])
+        with pytest.raises(APIError):
+            scheduler.get_job_executions(job["id"])
+
+    def test_invalid_jobs_are_rejected(self, scheduler):
+        with pytest.raises(APIError, match="not within 0-23"):
+            create(scheduler, cron="0 24 * * *")
+        with pytest.raises(APIError, match="Unsupported service type"):
+            create(scheduler, service_type="teleport")
+
+    def test_worker_pool_is_bounded(self, clock):
+        release = threading.Event()
+
+        def blocked(service_type, job_config):
+            release.wait(5)
+
+        scheduler = LocalScheduler(
+            runner=blocked, clock=clock, max_workers=1, max_pending=1
+        )
+        job = create(scheduler)
+        for _ in range(3):
+            scheduler.trigger_scheduled_job(job["id"])
+        wait_for(
+            lambda: "running" in {e["status"] for e in executions(scheduler, job["id"])}
+        )
+        statuses = sorted(e["status"] for e in executions(scheduler, job["id"]))
+        assert statuses == ["pending", "running", "skipped"]
+        release.set()
+        scheduler.close()
+
+    def test_state_survives_a_restart(self, tmp_path, clock):
+        path = str(tmp_path / "jobs.db")
+        release = threading.Event()
+        scheduler = LocalScheduler(
+            path, runner=lambda *args: release.wait(5), clock=clock
+        )
+        job = create(scheduler)
+        scheduler.trigger_scheduled_job(job["id"])
+        scheduler.stop(wait=False)
+        reopened = LocalScheduler(path, runner=echo, clock=clock)
+        assert executions(reopened, job["id"])[0]["error"] == "interrupted"
+        clock.advance(minutes=5)
+        assert reopened.run_due() == 1
+        reopened.close()
+        release.set()
+        scheduler.close()
+
+    def test_timer_thread_idles_until_a_job_is_due(self, clock):
+        with LocalScheduler(runner=echo, clock=clock) as scheduler:
+            for i in range(2000):
+                create(scheduler, cron=f"{i % 60} {i % 24} * * *", job_name=str(i))
+            started = time.process_time()
+            time.sleep(0.3)
+            assert time.process_time() - started < 0.05
+            job = create(scheduler, cron="*/5 * * * *")
+            clock.advance(minutes=5)
+            # Any change wakes the timer, which then finds the job due.
+            create(scheduler, cron="0 0 1 1 *", job_name="wake")
+            wait_for(lambda: executions(scheduler, job["id"]))
+
+    @pytest.mark.asyncio
+    async def test_async_client_pages_through_jobs(self, scheduler):
+        for i in range(250):
+            create(scheduler, job_name=str(i))
+        tool = GetScheduledJobsTool(
+            api_key=API_KEY, async_client=scheduler.async_client()
+        )
+        jobs = [job async for job in tool.aiter_jobs()]
+        assert [job["job_name"] for job in jobs] == [str(i) for i in range(250)]
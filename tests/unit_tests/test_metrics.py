@@ -0,0 +1,45 @@
+from langchain_scrapegraph.metrics import LatencyHistogram, MetricsRegistry
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_one_bucket(self):
+        """Test that percentiles are accurate to the bucket growth factor."""
+        histogram = LatencyHistogram(window=None)
+        for i in range(1, 1001):
+            histogram.observe(i / 1000)
+        assert histogram.count == 1000
+        assert 0.5 <= histogram.percentile(50) <= 0.5 * 1.1
+        assert 0.95 <= histogram.percentile(95) <= 0.95 * 1.1
+        assert LatencyHistogram().percentile(95) is None
+
+    def test_old_generations_are_dropped(self):
+        """Test that samples older than two windows no longer count."""
+        timer = FakeTimer()
+        histogram = LatencyHistogram(window=10, timer=timer)
+        histogram.observe(5.0)
+        timer.now = 11
+        histogram.observe(0.1)
+        assert histogram.count == 2
+        timer.now = 22
+        histogram.observe(0.1)
+        assert histogram.count == 2
+        assert histogram.percentile(100) < 0.2
+
+
+class TestMetricsRegistry:
+    def test_snapshot(self):
+        registry = MetricsRegistry()
+        registry.observe("scrape.latency", 0.2)
+        registry.set_gauge("scrape.concurrency_limit", 4)
+        snapshot = registry.snapshot()
+        assert snapshot["gauges"] == {"scrape.concurrency_limit": 4}
+        assert snapshot["latency"]["scrape.latency"]["count"] == 1
+        assert registry.gauge("missing") is None
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from langchain_scrapegraph.pagination import aiter_pages
+from langchain_scrapegraph.tools import GetJobExecutionsTool, GetScheduledJobsTool
+from tests.unit_tests.mocks import MockAsyncClient, MockPagedClient
+
+API_KEY = "sgai-test-api-key"
+
+
+def paged(tool_class, **kwargs):
+    tool = tool_class(api_key=API_KEY)
+    tool.async_client = MockAsyncClient(api_key=API_KEY)
+    tool.async_client._sync = MockPagedClient(api_key=API_KEY, **kwargs)
+    return tool, tool.async_client._sync
+
+
+class TestPrefetchingPaginator:
+    @pytest.mark.asyncio
+    async def test_walks_every_page_in_order(self):
+        tool, client = paged(GetScheduledJobsTool, jobs=95)
+        jobs = [job async for job in tool.aiter_jobs(page_size=10)]
+        assert [job["id"] for job in jobs] == [f"job-{i}" for i in range(95)]
+        assert sorted(client.requested) == list(range(1, 11))
+
+    @pytest.mark.asyncio
+    async def test_next_pages_are_requested_ahead(self):
+        tool, client = paged(GetScheduledJobsTool, jobs=100)
+        client_requests = []
+        async for job in tool.aiter_jobs(page_size=10, prefetch=4):
+            if job["id"] == "job-10":
+                client_requests = sorted(client.requested)
+        # Pages 2 to 5 were in flight before page 2 was consumed.
+        assert client_requests == [1, 2, 3, 4, 5]
+        # The total ends the walk without asking for an empty page.
+        assert sorted(client.requested) == list(range(1, 11))
+
+    @pytest.mark.asyncio
+    async def test_full_listing_overlaps_round_trips(self):
+        tool, client = paged(GetScheduledJobsTool, jobs=200)
+        tool.async_client.delay = 0.05
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        jobs = [job async for job in tool.aiter_jobs(page_size=10, prefetch=20)]
+        assert len(jobs) == 200
+        # Twenty pages one after another would take a second.
+        assert loop.time() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_filters_are_sent_with_every_page(self):
+        tool, client = paged(GetScheduledJobsTool, jobs=40)
+        jobs = [job async for job in tool.aiter_jobs(is_active=True, page_size=5)]
+        assert len(jobs) == 20
+        assert all(job["is_active"] for job in jobs)
+        assert len(client.requested) == 4
+
+    @pytest.mark.asyncio
+    async def test_without_total_stops_at_the_first_short_page(self):
+        tool, client = paged(GetJobExecutionsTool, executions=23)
+        client.report_total = False
+        executions = [
+            e async for e in tool.aiter_executions("job-1", page_size=5, prefetch=2)
+        ]
+        assert [e["id"] for e in executions] == [f"job-1-exec-{i}" for i in range(23)]
+        assert max(client.requested) <= 6
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_prefetched_pages(self):
+        cancelled = []
+
+        async def fetch(page):
+            if page > 2:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(page)
+                    raise
+            return {"items": list(range(10)), "total": 1000}
+
+        pages = aiter_pages(fetch, "items", page_size=10, prefetch=3)
+        items = [await pages.__anext__() for _ in range(20)]
+        assert len(items) == 20
+        await pages.aclose()
+        await asyncio.sleep(0)
+        assert cancelled == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_cancel_the_rest(self):
+        cancelled = []
+
+        async def fetch(page):
+            if page == 2:
+                raise ConnectionError("reset")
+            if page > 2:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(page)
+                    raise
+            return {"items": list(range(10)), "total": 100}
+
+        with pytest.raises(ConnectionError):
+            [item async for item in aiter_pages(fetch, "items", 10, prefetch=3)]
+        await asyncio.sleep(0)
+        assert cancelled == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError, match="prefetch"):
+            await aiter_pages(None, "items", 10, prefetch=0).__anext__()
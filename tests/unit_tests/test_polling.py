@@ -0,0 +1,304 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from langchain_scrapegraph.deadline import DeadlineExceeded, current_deadline
+from langchain_scrapegraph.polling import JobFailedError, PollBackoff, job_poller
+from langchain_scrapegraph.tools import AgenticScraperTool, SmartCrawlerTool
+from langchain_scrapegraph.tools.smartcrawler import iter_crawl_pages
+from tests.unit_tests.mocks import (
+    MockAgenticClient,
+    MockAsyncClient,
+    MockCrawlClient,
+)
+
+API_KEY = "sgai-test-api-key"
+
+
+def fast_backoff(**kwargs):
+    settings = {"initial": 0.01, "fast_polls": 2, "max_interval": 0.05, "jitter": 0}
+    return PollBackoff(**{**settings, **kwargs})
+
+
+def crawler(**kwargs):
+    return SmartCrawlerTool(
+        api_key=API_KEY,
+        client=MockCrawlClient(api_key=API_KEY),
+        poll_backoff=fast_backoff(),
+        **kwargs,
+    )
+
+
+def async_crawler(**kwargs):
+    tool = SmartCrawlerTool(api_key=API_KEY, poll_backoff=fast_backoff(), **kwargs)
+    tool.async_client = MockAsyncClient(api_key=API_KEY)
+    tool.async_client._sync = MockCrawlClient(api_key=API_KEY)
+    return tool
+
+
+class TestPollBackoff:
+    def test_short_intervals_then_exponential_capped(self):
+        backoff = PollBackoff(initial=1, fast_polls=3, multiplier=2, max_interval=10)
+        backoff.jitter = 0
+        intervals = [backoff.interval(n) for n in range(8)]
+        assert intervals == [1, 1, 1, 2, 4, 8, 10, 10]
+
+    def test_jitter_stays_within_bounds(self):
+        backoff = PollBackoff(initial=1, jitter=0.1)
+        assert all(0.9 <= backoff.interval(0) <= 1.1 for _ in range(100))
+
+
+class TestSmartCrawlerSubmit:
+    def test_submit_returns_immediately(self):
+        tool = crawler()
+        job = tool.submit(prompt="Extract", url="https://example.com", max_pages=5)
+        assert job.status == "pending"
+        assert not job.done
+        assert tool.client.submitted[job.job_id]["max_pages"] == 5
+        assert tool.client.polls[job.job_id] == 0
+
+    def test_result_polls_until_done(self):
+        tool = crawler()
+        job = tool.submit(prompt="Extract", url="https://example.com")
+        assert job.poll() == "processing"
+        result = job.result()
+        assert result["result"]["llm_result"] == {"url": "https://example.com"}
+        assert job.polls == 2
+
+    def test_failed_crawl_raises(self):
+        tool = crawler()
+        job = tool.submit(prompt="Extract", url="https://example.com")
+        failure = {"id": job.job_id, "status": "failed", "error": "robots.txt"}
+        with patch.object(tool.client, "get_crawl", return_value=failure):
+            with pytest.raises(JobFailedError, match="robots.txt"):
+                job.result()
+
+    def test_result_timeout_leaves_job_resumable(self):
+        tool = crawler()
+        tool.client.polls_until_done = 1000
+        job = tool.submit(prompt="Extract", url="https://example.com")
+        with pytest.raises(DeadlineExceeded):
+            job.result(timeout=0.1)
+        tool.client.polls_until_done = 0
+        assert job.result()["status"] == "success"
+
+    def test_synchronous_response_is_already_done(self):
+        tool = crawler()
+        response = {"status": "success", "result": {"llm_result": {}}}
+        with patch.object(tool.client, "crawl", return_value=response):
+            job = tool.submit(prompt="Extract", url="https://example.com")
+        assert job.job_id is None
+        assert job.result() is response
+
+
+class TestJobPoller:
+    @pytest.mark.asyncio
+    async def test_many_crawls_share_one_poller(self):
+        """Test that awaited crawls are supervised without a task per crawl."""
+        tool = async_crawler()
+        client = tool.async_client._sync
+        urls = [f"https://example.com/{i}" for i in range(100)]
+        jobs = [await tool.asubmit(prompt="Extract", url=url) for url in urls]
+        tasks_before = len(asyncio.all_tasks())
+        waiting = asyncio.gather(*(job.aresult() for job in jobs))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert job_poller.pending == 100
+        # One waiter per job plus the single supervisor task.
+        assert len(asyncio.all_tasks()) - tasks_before == 101
+        results = await waiting
+        assert [r["result"]["llm_result"]["url"] for r in results] == urls
+        assert set(client.polls.values()) == {2}
+        assert job_poller.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_stops_polling(self):
+        tool = async_crawler()
+        client = tool.async_client._sync
+        client.polls_until_done = 1000
+        job = await tool.asubmit(prompt="Extract", url="https://example.com")
+        waiter = asyncio.ensure_future(job.aresult())
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0.06)
+        polls = client.polls[job.job_id]
+        await asyncio.sleep(0.1)
+        assert client.polls[job.job_id] == polls
+
+    @pytest.mark.asyncio
+    async def test_async_timeout_and_poll_errors(self):
+        tool = async_crawler(retry_policy=None)
+        client = tool.async_client._sync
+        client.polls_until_done = 1000
+        job = await tool.asubmit(prompt="Extract", url="https://example.com")
+        with pytest.raises(DeadlineExceeded):
+            await job.aresult(timeout=0.05)
+        with patch.object(client, "get_crawl", side_effect=ConnectionError("reset")):
+            with pytest.raises(ConnectionError):
+                await job.aresult()
+
+
+class TestCrawlPageStreaming:
+    def test_pages_arrive_while_the_crawl_runs(self):
+        tool = crawler()
+        client = tool.client
+        client.polls_until_done = 5
+        pages = tool.stream_pages(
+            prompt="Extract", url="https://example.com", max_pages=5
+        )
+        first = next(pages)
+        crawl_id = next(iter(client.polls))
+        assert first["url"] == "https://example.com/page-0"
+        assert client.polls[crawl_id] == 1
+        rest = list(pages)
+        assert [page["url"] for page in rest] == [
+            f"https://example.com/page-{i}" for i in range(1, 5)
+        ]
+        assert client.polls[crawl_id] == 5
+
+    def test_job_keeps_the_final_result(self):
+        tool = crawler()
+        job = tool.submit(prompt="Extract", url="https://example.com")
+        assert len(list(iter_crawl_pages(job))) == 2
+        assert job.response["result"]["llm_result"] == {"url": "https://example.com"}
+
+    def test_failure_after_partial_pages(self):
+        tool = crawler()
+        job = tool.submit(prompt="Extract", url="https://example.com")
+        partial = {"status": "processing", "result": {"pages": [{"url": "a"}]}}
+        failure = {"status": "failed", "result": {"pages": [{"url": "a"}]}}
+        pages = []
+        with patch.object(tool.client, "get_crawl", side_effect=[partial, failure]):
+            with pytest.raises(JobFailedError):
+                for page in iter_crawl_pages(job):
+                    pages.append(page)
+        assert pages == [{"url": "a"}]
+
+    @pytest.mark.asyncio
+    async def test_async_stream_does_not_leak_its_deadline(self):
+        tool = async_crawler()
+        tool.async_client._sync.polls_until_done = 3
+        urls = []
+        async for page in tool.astream_pages(
+            prompt="Extract", url="https://example.com", max_pages=3, timeout=5
+        ):
+            assert current_deadline() is None
+            urls.append(page["url"])
+        assert urls == [f"https://example.com/page-{i}" for i in range(3)]
+
+
+STEPS = ["Type user@example.com in the email box", "Click on login"]
+
+
+def agentic(**kwargs):
+    return AgenticScraperTool(
+        api_key=API_KEY,
+        client=MockAgenticClient(api_key=API_KEY),
+        poll_backoff=fast_backoff(),
+        **kwargs,
+    )
+
+
+class TestAgenticScraperPolling:
+    def test_invoke_waits_for_the_session(self):
+        tool = agentic()
+        result = tool.invoke({"url": "https://example.com", "steps": STEPS})
+        assert result["status"] == "completed"
+        assert result["result"] == {"steps_done": 2}
+        assert list(tool.client.polls.values()) == [2]
+
+    def test_resume_after_timeout_does_not_rerun(self):
+        """Test that a timed-out session is picked up by request id later."""
+        tool = agentic()
+        tool.client.polls_until_done = 1000
+        job = tool.submit(url="https://example.com", steps=STEPS)
+        with pytest.raises(DeadlineExceeded, match=job.job_id):
+            job.result(timeout=0.05)
+        tool.client.polls_until_done = 0
+        other = agentic()
+        other.client = tool.client
+        result = other.resume(job.job_id).result()
+        assert result["result"] == {"steps_done": 2}
+        assert len(tool.client.sessions) == 1
+
+    def test_resume_validates_the_request_id(self):
+        with pytest.raises(ValueError, match="valid UUID"):
+            agentic().resume("not-a-uuid")
+
+    @pytest.mark.asyncio
+    async def test_async_invoke_polls_without_blocking(self):
+        tool = AgenticScraperTool(api_key=API_KEY, poll_backoff=fast_backoff())
+        tool.async_client = MockAsyncClient(api_key=API_KEY)
+        tool.async_client._sync = MockAgenticClient(api_key=API_KEY)
+        results = await asyncio.gather(
+            *(
+                tool.ainvoke({"url": f"https://example.com/{i}", "steps": STEPS})
+                for i in range(20)
+            )
+        )
+        assert all(r["status"] == "completed" for r in results)
+        assert len(tool.async_client._sync.sessions) == 20
+
+
+LOGIN = ["Type user@example.com in the email box", "Click on login"]
+
+
+class TestAgenticScraperBatch:
+    def test_every_page_gets_the_full_steps(self):
+        """Test that no page is scraped without the shared prefix steps."""
+        tool = agentic()
+        tool.client.polls_until_done = 1
+        urls = [f"https://example.com/{i}" for i in range(12)]
+        items = list(
+            tool.scrape_many(
+                urls,
+                steps=["Open the billing tab"],
+                prefix_steps=LOGIN,
+                max_concurrency=3,
+            )
+        )
+        assert sorted(i["url"] for i in items) == sorted(urls)
+        assert all(i["error"] is None for i in items)
+        sessions = tool.client.sessions.values()
+        assert len(sessions) == 12
+        assert all(s["steps"] == LOGIN + ["Open the billing tab"] for s in sessions)
+
+    def test_failures_do_not_abort_the_batch(self):
+        tool = agentic()
+        tool.client.polls_until_done = 1
+        submit = tool.client.agenticscraper
+
+        def flaky(url, steps, **kwargs):
+            if url.endswith("/bad"):
+                raise RuntimeError("session expired")
+            return submit(url, steps, **kwargs)
+
+        urls = ["https://example.com/1", "https://example.com/bad"]
+        urls += ["https://example.com/2"]
+        with patch.object(tool.client, "agenticscraper", side_effect=flaky) as call:
+            items = list(
+                tool.scrape_many(
+                    urls, steps=["Scroll"], prefix_steps=LOGIN, max_concurrency=1
+                )
+            )
+        assert [i["error"] for i in items] == [None, "session expired", None]
+        sent = [c.kwargs["steps"] for c in call.call_args_list]
+        assert sent == [LOGIN + ["Scroll"]] * 3
+
+    @pytest.mark.asyncio
+    async def test_async_batch_yields_as_completed(self):
+        tool = AgenticScraperTool(api_key=API_KEY, poll_backoff=fast_backoff())
+        tool.async_client = MockAsyncClient(api_key=API_KEY)
+        client = tool.async_client._sync = MockAgenticClient(api_key=API_KEY)
+        urls = [f"https://example.com/{i}" for i in range(8)]
+        items = [
+            item
+            async for item in tool.ascrape_many(
+                urls, steps=["Scroll"], prefix_steps=LOGIN, max_concurrency=2
+            )
+        ]
+        assert sorted(i["url"] for i in items) == sorted(urls)
+        assert all(s["steps"] == LOGIN + ["Scroll"] for s in client.sessions.values())
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from langchain_scrapegraph.ratelimit import (
+    RateLimitCancelled,
+    RateLimiter,
+    TokenBucket,
+    cancel_on,
+)
+from langchain_scrapegraph.tools import MarkdownifyTool, ScrapeTool
+from tests.unit_tests.mocks import MockAsyncClient, MockClient
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_reservations_queue_behind_the_burst(self):
+        """Test that calls past the burst wait in line at the refill rate."""
+        timer = FakeTimer()
+        bucket = TokenBucket(rate=2, capacity=2, timer=timer)
+        assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+        timer.now = 1.0
+        assert bucket.tokens == 0
+        timer.now = 10.0
+        assert bucket.tokens == 2
+
+    def test_refund_returns_abandoned_tokens(self):
+        """Test that refunded reservations free the bucket again."""
+        timer = FakeTimer()
+        bucket = TokenBucket(rate=1, capacity=1, timer=timer)
+        bucket.reserve()
+        assert bucket.reserve() == 1.0
+        bucket.refund()
+        assert bucket.reserve() == 1.0
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=1).reserve(2)
+
+
+class TestRateLimiter:
+    def test_key_and_service_buckets_both_apply(self):
+        """Test that a call needs a token from the key and its service."""
+        limiter = RateLimiter(timer=FakeTimer())
+        limiter.configure("key", rate=10, capacity=10)
+        limiter.configure("key", rate=1, capacity=1, service="smartscraper")
+        assert len(limiter.buckets("key", "smartscraper")) == 2
+        assert len(limiter.buckets("key", "scrape")) == 1
+        assert limiter.buckets("other", "scrape") == []
+
+        assert limiter.acquire("key", "smartscraper", timeout=0)
+        assert not limiter.acquire("key", "smartscraper", timeout=0)
+        for _ in range(9):
+            assert limiter.acquire("key", "scrape", timeout=0)
+        assert not limiter.acquire("key", "scrape", timeout=0)
+
+    def test_unconfigured_keys_are_not_limited(self):
+        limiter = RateLimiter()
+        assert all(limiter.acquire("key", "scrape", timeout=0) for _ in range(100))
+
+    def test_threads_are_throttled(self):
+        """Test that concurrent threads together respect the rate."""
+        limiter = RateLimiter()
+        limiter.configure("key", rate=20, capacity=1)
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: limiter.acquire("key"), range(11)))
+        assert time.monotonic() - started >= 0.45
+
+    def test_blocking_wait_can_be_cancelled(self):
+        """Test that setting the cancel event wakes a blocked caller."""
+        limiter = RateLimiter()
+        limiter.configure("key", rate=0.1, capacity=1)
+        limiter.acquire("key")
+        cancel = threading.Event()
+        threading.Timer(0.05, cancel.set).start()
+        started = time.monotonic()
+        assert not limiter.acquire("key", cancel=cancel)
+        assert time.monotonic() - started < 1
+        assert limiter.buckets("key")[0].tokens > -0.5
+
+    @pytest.mark.asyncio
+    async def test_async_cancellation_refunds_tokens(self):
+        """Test that a cancelled waiter gives its reservation back."""
+        limiter = RateLimiter()
+        limiter.configure("key", rate=0.1, capacity=1)
+        await limiter.aacquire("key")
+        waiter = asyncio.create_task(limiter.aacquire("key"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.buckets("key")[0].tokens > -0.5
+        assert not await limiter.aacquire("key", timeout=0)
+
+
+class TestToolRateLimiting:
+    def test_tools_sharing_a_key_share_the_limit(self):
+        """Test that every tool using a key draws from the same bucket."""
+        limiter = RateLimiter()
+        limiter.configure("sgai-test-api-key", rate=10, capacity=1)
+        client = MockClient(api_key="sgai-test-api-key")
+        scrape = ScrapeTool(api_key="sgai-test-api-key", client=client)
+        markdownify = MarkdownifyTool(api_key="sgai-test-api-key", client=client)
+        with patch("langchain_scrapegraph.tools.base.rate_limiter", limiter):
+            started = time.monotonic()
+            for i in range(3):
+                scrape.invoke({"website_url": f"https://example.com/{i}"})
+                markdownify.invoke({"website_url": f"https://example.com/{i}"})
+        assert time.monotonic() - started >= 0.45
+
+    def test_tool_wait_can_be_cancelled(self):
+        """Test that a tool blocked on the limit stops when its cancel event is set."""
+        limiter = RateLimiter()
+        limiter.configure("sgai-test-api-key", rate=0.1, capacity=1)
+        tool = MarkdownifyTool(
+            api_key="sgai-test-api-key", client=MockClient(api_key="sgai-test-api-key")
+        )
+        event = threading.Event()
+        with patch("langchain_scrapegraph.tools.base.rate_limiter", limiter):
+            tool.invoke({"website_url": "https://example.com/1"})
+            threading.Timer(0.05, event.set).start()
+            started = time.monotonic()
+            with cancel_on(event), pytest.raises(RateLimitCancelled):
+                tool.invoke({"website_url": "https://example.com/2"})
+        assert time.monotonic() - started < 1
+
+    @pytest.mark.asyncio
+    async def test_async_service_limit(self):
+        """Test that the per-service bucket throttles async calls."""
+        limiter = RateLimiter()
+        limiter.configure("sgai-test-api-key", rate=20, capacity=1, service="scrape")
+        tool = ScrapeTool(api_key="sgai-test-api-key")
+        tool.async_client = MockAsyncClient(api_key="sgai-test-api-key")
+        with patch("langchain_scrapegraph.tools.base.rate_limiter", limiter):
+            started = time.monotonic()
+            await asyncio.gather(
+                *(
+                    tool.ainvoke({"website_url": f"https://example.com/{i}"})
+                    for i in range(5)
+                )
+            )
+        assert time.monotonic() - started >= 0.15
@@ -0,0 +1,225 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from scrapegraph_py.exceptions import APIError
+
+from langchain_scrapegraph.clients import ClientRegistry
+from langchain_scrapegraph.retry import RetryBudget, RetryPolicy
+from langchain_scrapegraph.tools import (
+    CreateScheduledJobTool,
+    SmartCrawlerTool,
+    SmartScraperTool,
+)
+from langchain_scrapegraph.tools.smartcrawler import SUBMIT_RETRY_STATUS_CODES
+from tests.unit_tests.mocks import MockAsyncClient, MockClient, MockCrawlClient
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def fast_policy(**kwargs) -> RetryPolicy:
+    kwargs.setdefault("base_delay", 0.001)
+    kwargs.setdefault("use_budget", False)
+    return RetryPolicy(**kwargs)
+
+
+class Flaky:
+    """Fails with the given errors, then returns ``result``."""
+
+    def __init__(self, *errors: BaseException, result: str = "ok") -> None:
+        self.errors = list(errors)
+        self.result = result
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.result
+
+
+class TestRetryPolicy:
+    def test_retries_transient_errors(self):
+        """Test that 502s and connection errors are retried until success."""
+        flaky = Flaky(APIError("Bad gateway", 502), ConnectionError("reset"))
+        assert fast_policy().call(flaky) == "ok"
+        assert flaky.calls == 3
+
+    def test_does_not_retry_client_errors(self):
+        """Test that 4xx responses and other exceptions fail immediately."""
+        for error in (APIError("Bad request", 400), ValueError("bad schema")):
+            flaky = Flaky(error)
+            with pytest.raises(type(error)):
+                fast_policy().call(flaky)
+            assert flaky.calls == 1
+
+    def test_gives_up_after_max_attempts(self):
+        flaky = Flaky(*[APIError("Unavailable", 503)] * 5)
+        with pytest.raises(APIError):
+            fast_policy(max_attempts=3).call(flaky)
+        assert flaky.calls == 3
+
+    def test_max_elapsed_time(self):
+        """Test that no retry starts past the elapsed-time limit."""
+        flaky = Flaky(*[TimeoutError()] * 10)
+        policy = fast_policy(max_attempts=10, max_elapsed=0.1)
+        policy.backoff = lambda retry: 0.2
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            policy.call(flaky)
+        assert flaky.calls == 1
+        policy.max_elapsed = 0.5
+        flaky = Flaky(*[TimeoutError()] * 10)
+        with pytest.raises(TimeoutError):
+            policy.call(flaky)
+        assert flaky.calls == 3
+        assert time.monotonic() - started < 1
+
+    def test_backoff_is_jittered_and_capped(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        delays = [policy.backoff(10) for _ in range(200)]
+        assert all(0 <= d <= 5 for d in delays)
+        assert len(set(delays)) > 100
+
+    @pytest.mark.asyncio
+    async def test_async_retry_and_cancellation(self):
+        """Test async retries and that cancelling interrupts the backoff."""
+        calls = 0
+
+        async def flaky() -> str:
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                raise APIError("Too many requests", 429)
+            return "ok"
+
+        assert await fast_policy().acall(flaky) == "ok"
+
+        async def always_down() -> None:
+            raise APIError("Unavailable", 503)
+
+        slow = fast_policy(max_attempts=5, base_delay=10, max_delay=10)
+        slow.backoff = lambda retry: 10
+        task = asyncio.create_task(slow.acall(always_down))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+class TestRetryBudget:
+    def test_budget_caps_retries_during_an_outage(self):
+        """Test that retries stop once they exceed the allowed fraction."""
+        timer = FakeTimer()
+        budget = RetryBudget(ratio=0.1, min_retries=2, window=10, timer=timer)
+        policy = fast_policy(max_attempts=3, use_budget=True, budget=budget)
+        attempts = 0
+        for _ in range(50):
+            flaky = Flaky(*[APIError("Unavailable", 503)] * 3)
+            with pytest.raises(APIError):
+                policy.call(flaky)
+            attempts += flaky.calls
+        # 50 requests allow 2 + 0.1 * 50 = 7 retries.
+        assert attempts == 57
+        assert not budget.try_spend()
+        timer.now = 25
+        assert budget.try_spend()
+
+
+class TestToolRetries:
+    def test_smartscraper_retries_by_default(self):
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = SmartScraperTool(
+            api_key="sgai-test-api-key", client=client, retry_policy=fast_policy()
+        )
+        flaky = Flaky(APIError("Bad gateway", 502))
+        real = client.smartscraper
+
+        def smartscraper(**kwargs):
+            flaky()
+            return real(**kwargs)
+
+        with patch.object(client, "smartscraper", side_effect=smartscraper) as call:
+            result = tool.invoke(
+                {"user_prompt": "Extract the title", "website_url": "https://a.com"}
+            )
+        assert result["main_heading"] == "Example Domain"
+        assert call.call_count == 2
+        assert isinstance(SmartScraperTool(api_key="k").retry_policy, RetryPolicy)
+
+    @pytest.mark.asyncio
+    async def test_scheduled_job_creation_is_not_retried(self):
+        """Test that non-idempotent tools do not retry unless asked to."""
+        tool = CreateScheduledJobTool(api_key="sgai-test-api-key")
+        assert tool.retry_policy is None
+        tool.async_client = MockAsyncClient(api_key="sgai-test-api-key")
+        with patch.object(
+            tool.async_client._sync,
+            "create_scheduled_job",
+            side_effect=APIError("Bad gateway", 502),
+        ) as call:
+            with pytest.raises(APIError):
+                await tool.ainvoke(
+                    {
+                        "job_name": "Daily",
+                        "service_type": "smartscraper",
+                        "cron_expression": "0 9 * * *",
+                        "job_config": {},
+                    }
+                )
+        assert call.call_count == 1
+
+    def test_crawl_submit_is_only_retried_before_acceptance(self):
+        """Test that starting a crawl is retried on 429/503 only, polls as usual."""
+        client = MockCrawlClient(api_key="sgai-test-api-key")
+        tool = SmartCrawlerTool(
+            api_key="sgai-test-api-key",
+            client=client,
+            submit_retry_policy=fast_policy(
+                retry_status_codes=SUBMIT_RETRY_STATUS_CODES, retry_exceptions=()
+            ),
+        )
+        real = client.crawl
+        with patch.object(client, "crawl", side_effect=ConnectionError) as call:
+            with pytest.raises(ConnectionError):
+                tool.submit(prompt="Extract", url="https://a.com")
+        assert call.call_count == 1
+
+        flaky = Flaky(APIError("Too many requests", 429))
+
+        def crawl(**kwargs):
+            flaky()
+            return real(**kwargs)
+
+        with patch.object(client, "crawl", side_effect=crawl) as call:
+            tool.submit(prompt="Extract", url="https://a.com")
+        assert call.call_count == 2
+        assert tool._retry_policy_for("get_crawl") is tool.retry_policy
+
+
+class TestSdkRetries:
+    def test_pooled_clients_leave_retries_to_the_policy(self):
+        """Test that tools with a retry policy borrow clients without SDK retries."""
+        assert SmartScraperTool(api_key="k")._transport_settings(sync=True) == {
+            "max_retries": 0
+        }
+        assert SmartScraperTool(api_key="k")._transport_settings(sync=False) == {
+            "max_retries": 1
+        }
+        assert CreateScheduledJobTool(api_key="k")._transport_settings(sync=True) == {}
+
+    def test_sync_client_sends_each_request_once(self):
+        """Test that a max_retries=0 client has no urllib3 retries at all."""
+        registry = ClientRegistry()
+        client = registry.acquire("sgai-" + "0" * 32, max_retries=0)
+        adapter = client.session.get_adapter("https://api.scrapegraphai.com")
+        assert adapter.max_retries.total == 0
+        assert not adapter.max_retries.status_forcelist
+        registry.close()
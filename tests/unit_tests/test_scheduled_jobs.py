@@ -0,0 +1,240 @@
+from unittest.mock import patch
+
+import pytest
+from scrapegraph_py.exceptions import APIError
+
+from langchain_scrapegraph.reconcile import JobReconciler
+from langchain_scrapegraph.tools import (
+    DeleteScheduledJobTool,
+    GetScheduledJobsTool,
+    PauseScheduledJobTool,
+    ResumeScheduledJobTool,
+    TriggerScheduledJobTool,
+)
+from tests.unit_tests.mocks import MockAsyncClient, MockPagedClient
+
+API_KEY = "sgai-test-api-key"
+
+
+def control(tool_class, jobs=10):
+    return tool_class(api_key=API_KEY, client=MockPagedClient(API_KEY, jobs=jobs))
+
+
+class TestBulkJobControl:
+    def test_pause_by_ids_reports_each_job(self):
+        tool = control(PauseScheduledJobTool)
+        ids = ["job-0", "job-2", "job-0", "job-4"]
+        outcomes = list(tool.control_many(ids, max_concurrency=3))
+        assert sorted(o["job_id"] for o in outcomes) == ["job-0", "job-2", "job-4"]
+        assert all(o["error"] is None and not o["skipped"] for o in outcomes)
+        assert sorted(tool.client.controlled) == [
+            ("pause", "job-0"),
+            ("pause", "job-2"),
+            ("pause", "job-4"),
+        ]
+
+    def test_filter_skips_jobs_already_in_the_target_state(self):
+        tool = control(PauseScheduledJobTool, jobs=250)
+        outcomes = list(tool.control_many(service_type="smartscraper"))
+        # Only the active half is listed and paused, over two pages.
+        assert len(outcomes) == 125
+        assert len(tool.client.controlled) == 125
+        assert tool.client.requested == [1, 2]
+        assert not any(job["is_active"] for job in tool.client.jobs)
+        outcomes = list(tool.control_many(is_active=False))
+        assert len(outcomes) == 250
+        assert all(o["skipped"] for o in outcomes)
+        assert len(tool.client.controlled) == 125
+
+    def test_rerun_after_partial_failure(self):
+        tool = control(ResumeScheduledJobTool)
+        tool.client.failing = {"job-1", "job-3"}
+        outcomes = list(tool.control_many(is_active=False))
+        failed = sorted(o["job_id"] for o in outcomes if o["error"])
+        assert failed == ["job-1", "job-3"]
+        assert "500" in next(o["error"] for o in outcomes if o["error"])
+        tool.client.failing = set()
+        tool.client.controlled.clear()
+        outcomes = list(tool.control_many(service_type="smartscraper"))
+        assert sorted(tool.client.controlled) == [
+            ("resume", "job-1"),
+            ("resume", "job-3"),
+        ]
+        assert all(o["error"] is None for o in outcomes)
+
+    def test_deleting_a_missing_job_is_skipped(self):
+        tool = control(DeleteScheduledJobTool, jobs=3)
+        first = list(tool.control_many(["job-0", "job-1"]))
+        assert not any(o["skipped"] or o["error"] for o in first)
+        again = list(tool.control_many(["job-0", "job-1", "job-2"]))
+        assert {o["job_id"]: o["skipped"] for o in again} == {
+            "job-0": True,
+            "job-1": True,
+            "job-2": False,
+        }
+        assert all(o["error"] is None for o in again)
+        assert tool.client.jobs == []
+
+    def test_requires_ids_or_a_filter(self):
+        tool = control(TriggerScheduledJobTool)
+        with pytest.raises(ValueError, match="job_ids or a filter"):
+            list(tool.control_many())
+        with pytest.raises(ValueError, match="job_ids or a filter"):
+            list(tool.control_many(["job-1"], is_active=True))
+
+    @pytest.mark.asyncio
+    async def test_rejects_a_single_id_string(self):
+        tool = control(PauseScheduledJobTool)
+        with pytest.raises(TypeError, match="single id string"):
+            list(tool.control_many("job-1"))
+        with pytest.raises(TypeError, match="single id string"):
+            [o async for o in tool.acontrol_many("job-1")]
+        assert tool.client.controlled == []
+
+    @pytest.mark.asyncio
+    async def test_async_trigger_by_filter(self):
+        tool = TriggerScheduledJobTool(api_key=API_KEY)
+        tool.async_client = MockAsyncClient(api_key=API_KEY)
+        client = tool.async_client._sync = MockPagedClient(API_KEY, jobs=30)
+        tool.async_client.delay = 0.01
+        outcomes = [o async for o in tool.acontrol_many(is_active=True)]
+        assert len(outcomes) == 15
+        assert all(o["result"]["execution_id"] for o in outcomes)
+        assert {action for action, _ in client.controlled} == {"trigger"}
+
+
+def spec(name, **fields):
+    return {
+        "job_name": name,
+        "service_type": "smartscraper",
+        "cron_expression": "0 9 * * *",
+        "job_config": {},
+        "is_active": True,
+        **fields,
+    }
+
+
+def reconciler(jobs=0, **kwargs):
+    tool = GetScheduledJobsTool(
+        api_key=API_KEY, client=MockPagedClient(API_KEY, jobs=jobs)
+    )
+    return JobReconciler(tool, **kwargs), tool.client
+
+
+class TestJobReconciler:
+    def test_plan_is_a_dry_run(self):
+        jobs, client = reconciler(jobs=4)
+        desired = [
+            spec("job-0"),
+            spec("job-1", cron_expression="*/5 * * * *"),
+            spec("job-2", service_type="markdownify", is_active=False),
+            spec("fresh"),
+        ]
+        plan = jobs.plan(desired, prune=True)
+        assert plan.counts() == {"create": 1, "update": 1, "replace": 1, "delete": 1}
+        assert plan.describe().splitlines() == [
+            "~ job-1: cron_expression, is_active",
+            "-/+ job-2 (service type markdownify)",
+            "- job-3",
+            "+ fresh (smartscraper, '0 9 * * *')",
+        ]
+        assert client.controlled == []
+        assert client.created == 0
+
+    def test_apply_sends_only_the_changes(self):
+        jobs, client = reconciler(jobs=4)
+        desired = [spec("job-0"), spec("job-1", cron_expression="*/5 * * * *")]
+        plan = jobs.plan(desired)
+        with patch.object(
+            client, "update_scheduled_job", wraps=client.update_scheduled_job
+        ) as update:
+            outcomes = list(jobs.apply(plan))
+        assert [o["action"] for o in outcomes] == ["update"]
+        update.assert_called_once_with(
+            job_id="job-1", cron_expression="*/5 * * * *", is_active=True
+        )
+
+    def test_partial_desired_list_prunes_nothing_by_default(self):
+        jobs, _ = reconciler(jobs=4)
+        assert jobs.plan([spec("job-0")]).counts()["delete"] == 0
+        with pytest.raises(TypeError):
+            jobs.plan([spec("job-0")], True)
+
+    def test_replace_creates_before_deleting(self):
+        jobs, client = reconciler(jobs=2)
+        desired = [spec("job-0"), spec("job-1", service_type="markdownify")]
+        with patch.object(
+            client, "create_scheduled_job", side_effect=APIError("Bad", 422)
+        ):
+            (outcome,) = jobs.apply(jobs.plan(desired))
+        assert outcome["action"] == "replace" and outcome["error"]
+        assert [job["id"] for job in client.jobs] == ["job-0", "job-1"]
+
+        client.failing = {"job-1"}
+        (outcome,) = jobs.apply(jobs.plan(desired))
+        assert outcome["result"]["id"] == "new-1"
+        assert "both exist" in outcome["error"]
+        assert [job["id"] for job in client.jobs] == ["job-0", "job-1", "new-1"]
+
+        # The next plan keeps the new job and prunes the leftover one.
+        client.failing = set()
+        plan = jobs.plan(desired, prune=True)
+        assert plan.describe() == "- job-1"
+        assert all(o["error"] is None for o in jobs.apply(plan))
+        assert [job["id"] for job in client.jobs] == ["job-0", "new-1"]
+
+    def test_snapshot_tracks_applied_changes(self):
+        jobs, client = reconciler(jobs=150)
+        desired = [spec(f"job-{i}") for i in range(100)] + [spec("fresh")]
+        outcomes = list(jobs.apply(jobs.plan(desired, prune=True)))
+        assert all(o["error"] is None for o in outcomes)
+        assert client.requested == [1, 2]
+        assert not jobs.plan(desired, prune=True)
+        # The second plan came from the snapshot, which matches the server.
+        assert client.requested == [1, 2]
+        jobs.invalidate()
+        assert not jobs.plan(desired, prune=True)
+        assert len(client.jobs) == 101
+
+    def test_failure_discards_the_snapshot(self):
+        jobs, client = reconciler(jobs=3)
+        client.failing = {"job-1"}
+        plan = jobs.plan([spec("job-0"), spec("job-2")], prune=True)
+        outcomes = list(jobs.apply(plan))
+        assert [o["job_id"] for o in outcomes if o["error"]] == ["job-1"]
+        assert jobs.stale
+        client.failing = set()
+        plan = jobs.plan([spec("job-0"), spec("job-2")], prune=True)
+        assert plan.counts()["delete"] == 1
+
+    def test_snapshot_expires(self):
+        now = [0.0]
+        jobs, client = reconciler(jobs=2, ttl=60, timer=lambda: now[0])
+        jobs.plan([])
+        now[0] = 59
+        jobs.plan([])
+        assert client.requested == [1]
+        now[0] = 60
+        jobs.plan([])
+        assert client.requested == [1, 1]
+
+    def test_rejects_duplicate_and_invalid_specs(self):
+        jobs, _ = reconciler()
+        with pytest.raises(ValueError, match="Duplicate job_name"):
+            jobs.plan([spec("a"), spec("a")])
+        with pytest.raises(ValueError):
+            jobs.plan([{"job_name": "a"}])
+
+    @pytest.mark.asyncio
+    async def test_async_reconcile(self):
+        tool = GetScheduledJobsTool(api_key=API_KEY)
+        tool.async_client = MockAsyncClient(api_key=API_KEY)
+        client = tool.async_client._sync = MockPagedClient(API_KEY, jobs=20)
+        jobs = JobReconciler(tool)
+        desired = [spec(f"job-{i}") for i in range(10)]
+        plan = await jobs.aplan(desired, prune=True)
+        assert plan.counts() == {"create": 0, "update": 5, "replace": 0, "delete": 10}
+        outcomes = [o async for o in jobs.aapply(plan, max_concurrency=4)]
+        assert len(outcomes) == 15
+        assert not await jobs.aplan(desired, prune=True)
+        assert len(client.jobs) == 10
@@ -1,8 +1,15 @@
+import asyncio
+import gc
+import subprocess
+import sys
+import time
 from typing import Type
 from unittest.mock import patch
 
+import pytest
 from langchain_tests.unit_tests import ToolsUnitTests
 
+from langchain_scrapegraph.clients import ClientRegistry
 from langchain_scrapegraph.tools import (
     CreateScheduledJobTool,
     GetCreditsTool,
@@ -13,6 +20,7 @@ from langchain_scrapegraph.tools import (
     SmartScraperTool,
 )
 from tests.unit_tests.mocks import (
+    MockAsyncClient,
     MockClient,
     MockCreateScheduledJobTool,
     MockGetCreditsTool,
@@ -21,6 +29,7 @@ from tests.unit_tests.mocks import (
     MockScrapeTool,
     MockSearchScraperTool,
     MockSmartScraperTool,
+    SlowMockAsyncClient,
 )
 
 
@@ -31,7 +40,7 @@ class TestSmartScraperToolUnit(ToolsUnitTests):
 
     @property
     def tool_constructor_params(self) -> dict:
-        with patch("langchain_scrapegraph.tools.smartscraper.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             return {"api_key": "sgai-test-api-key"}
 
     @property
@@ -45,7 +54,7 @@ class TestSmartScraperToolUnit(ToolsUnitTests):
 class TestSmartScraperToolCustom:
     def test_invoke_with_html(self):
         """Test invoking the tool with HTML content."""
-        with patch("langchain_scrapegraph.tools.smartscraper.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             tool = MockSmartScraperTool(api_key="sgai-test-api-key")
             result = tool.invoke(
                 {
@@ -66,7 +75,7 @@ class TestSearchScraperToolUnit(ToolsUnitTests):
 
     @property
     def tool_constructor_params(self) -> dict:
-        with patch("langchain_scrapegraph.tools.searchscraper.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             return {"api_key": "sgai-test-api-key"}
 
     @property
@@ -88,7 +97,7 @@ class TestSearchScraperToolCustom:
             features: List[dict] = Field(description="List of features")
             reference_urls: List[str] = Field(description="Reference URLs")
 
-        with patch("langchain_scrapegraph.tools.searchscraper.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             tool = MockSearchScraperTool(api_key="sgai-test-api-key")
             tool.llm_output_schema = TestSchema
             result = tool.invoke(
@@ -108,7 +117,7 @@ class TestGetCreditsToolUnit(ToolsUnitTests):
 
     @property
     def tool_constructor_params(self) -> dict:
-        with patch("langchain_scrapegraph.tools.credits.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             return {"api_key": "sgai-test-api-key"}
 
     @property
@@ -123,7 +132,7 @@ class TestMarkdownifyToolUnit(ToolsUnitTests):
 
     @property
     def tool_constructor_params(self) -> dict:
-        with patch("langchain_scrapegraph.tools.markdownify.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             return {"api_key": "sgai-test-api-key"}
 
     @property
@@ -138,7 +147,7 @@ class TestScrapeToolUnit(ToolsUnitTests):
 
     @property
     def tool_constructor_params(self) -> dict:
-        with patch("langchain_scrapegraph.tools.scrape.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             return {"api_key": "sgai-test-api-key"}
 
     @property
@@ -149,7 +158,7 @@ class TestScrapeToolUnit(ToolsUnitTests):
 class TestScrapeToolCustom:
     def test_invoke_with_js_rendering(self):
         """Test invoking the scrape tool with JavaScript rendering."""
-        with patch("langchain_scrapegraph.tools.scrape.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             tool = MockScrapeTool(api_key="sgai-test-api-key")
             result = tool.invoke(
                 {"website_url": "https://example.com", "render_heavy_js": True}
@@ -161,7 +170,7 @@ class TestScrapeToolCustom:
 
     def test_invoke_with_headers(self):
         """Test invoking the scrape tool with custom headers."""
-        with patch("langchain_scrapegraph.tools.scrape.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             tool = MockScrapeTool(api_key="sgai-test-api-key")
             result = tool.invoke(
                 {
@@ -181,7 +190,7 @@ class TestCreateScheduledJobToolUnit(ToolsUnitTests):
 
     @property
     def tool_constructor_params(self) -> dict:
-        with patch("langchain_scrapegraph.tools.scheduled_jobs.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             return {"api_key": "sgai-test-api-key"}
 
     @property
@@ -198,7 +207,7 @@ class TestCreateScheduledJobToolUnit(ToolsUnitTests):
 class TestCreateScheduledJobToolCustom:
     def test_create_smartscraper_job(self):
         """Test creating a SmartScraper scheduled job."""
-        with patch("langchain_scrapegraph.tools.scheduled_jobs.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             tool = MockCreateScheduledJobTool(api_key="sgai-test-api-key")
             result = tool.invoke(
                 {
@@ -220,7 +229,7 @@ class TestCreateScheduledJobToolCustom:
 
     def test_create_searchscraper_job(self):
         """Test creating a SearchScraper scheduled job."""
-        with patch("langchain_scrapegraph.tools.scheduled_jobs.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             tool = MockCreateScheduledJobTool(api_key="sgai-test-api-key")
             result = tool.invoke(
                 {
@@ -246,7 +255,7 @@ class TestGetScheduledJobsToolUnit(ToolsUnitTests):
 
     @property
     def tool_constructor_params(self) -> dict:
-        with patch("langchain_scrapegraph.tools.scheduled_jobs.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             return {"api_key": "sgai-test-api-key"}
 
     @property
@@ -257,7 +266,7 @@ class TestGetScheduledJobsToolUnit(ToolsUnitTests):
 class TestGetScheduledJobsToolCustom:
     def test_get_jobs_with_filters(self):
         """Test getting scheduled jobs with filters."""
-        with patch("langchain_scrapegraph.tools.scheduled_jobs.Client", MockClient):
+        with patch("langchain_scrapegraph.clients.Client", MockClient):
             tool = MockGetScheduledJobsTool(api_key="sgai-test-api-key")
             result = tool.invoke(
                 {
@@ -271,3 +280,167 @@ class TestGetScheduledJobsToolCustom:
             assert "jobs" in result
             assert "total" in result
             assert isinstance(result["jobs"], list)
+
+
+@pytest.fixture
+def registry():
+    """Route tool clients through a fresh registry backed by the mock clients."""
+    registry = ClientRegistry()
+    with (
+        patch("langchain_scrapegraph.clients.Client", MockClient),
+        patch("langchain_scrapegraph.clients.AsyncClient", MockAsyncClient),
+        patch("langchain_scrapegraph.tools.base.client_registry", registry),
+    ):
+        yield registry
+
+
+class TestAsyncExecution:
+    @pytest.mark.asyncio
+    async def test_arun_uses_async_client(self, registry):
+        """Test that _arun goes through the async client, not the sync one."""
+        tool = MarkdownifyTool(api_key="sgai-test-api-key")
+        result = await tool.ainvoke({"website_url": "https://example.com"})
+        assert result == "# Example Domain\n\nTest paragraph"
+        assert isinstance(tool.async_client, MockAsyncClient)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_ainvoke_does_not_block_event_loop(self, registry):
+        """Test event-loop lag under 100 concurrent ainvoke calls on a slow client."""
+        loop = asyncio.get_running_loop()
+        interval = 0.01
+        max_lag = 0.0
+        stop = asyncio.Event()
+
+        async def monitor() -> None:
+            nonlocal max_lag
+            while not stop.is_set():
+                start = loop.time()
+                await asyncio.sleep(interval)
+                max_lag = max(max_lag, loop.time() - start - interval)
+
+        # Full collections of the test session's heap are not the tool's lag.
+        gc.collect()
+        gc.freeze()
+        with patch("langchain_scrapegraph.clients.AsyncClient", SlowMockAsyncClient):
+            tool = SmartScraperTool(api_key="sgai-test-api-key")
+            watcher = asyncio.create_task(monitor())
+            started = time.perf_counter()
+            results = await asyncio.gather(
+                *(
+                    tool.ainvoke(
+                        {
+                            "user_prompt": "Extract the main heading",
+                            "website_url": f"https://example.com/{i}",
+                        }
+                    )
+                    for i in range(100)
+                )
+            )
+            elapsed = time.perf_counter() - started
+            stop.set()
+            await watcher
+        gc.unfreeze()
+
+        assert len(results) == 100
+        assert all(r["main_heading"] == "Example Domain" for r in results)
+        # Serial execution would take 100 * 0.2s = 20s.
+        assert elapsed < 100 * SlowMockAsyncClient.delay / 4
+        assert max_lag < 0.1
+
+
+class TestClientRegistry:
+    def test_tools_share_pooled_client(self, registry):
+        """Test that tools with the same API key reuse one client."""
+        scrape = ScrapeTool(api_key="sgai-test-api-key")
+        markdownify = MarkdownifyTool(api_key="sgai-test-api-key")
+        other = ScrapeTool(api_key="sgai-other-api-key")
+        for tool in (scrape, markdownify, other):
+            tool.invoke({"website_url": "https://example.com"})
+        assert scrape.client is markdownify.client
+        assert other.client is not scrape.client
+
+        client = scrape.client
+        scrape.close()
+        assert scrape.client is None
+        assert not client.closed
+        markdownify.close()
+        assert client.closed
+
+    def test_transport_settings_are_part_of_the_key(self, registry):
+        """Test that different transport settings get separate clients."""
+        assert registry.acquire("sgai-test-api-key", timeout=5) is not (
+            registry.acquire("sgai-test-api-key", timeout=30)
+        )
+        assert registry.acquire("sgai-test-api-key", timeout=5) is (
+            registry.acquire("sgai-test-api-key", timeout=5)
+        )
+
+    def test_tools_pass_their_client_settings(self, registry):
+        """Test that a tool's transport settings reach the pooled client."""
+        slow = ScrapeTool(api_key="sgai-test-api-key", client_settings={"timeout": 90})
+        fast = ScrapeTool(api_key="sgai-test-api-key", client_settings={"timeout": 5})
+        same = MarkdownifyTool(
+            api_key="sgai-test-api-key", client_settings={"timeout": 5}
+        )
+        with patch.object(registry, "acquire", wraps=registry.acquire) as acquire:
+            for tool in (slow, fast, same):
+                tool.invoke({"website_url": "https://example.com"})
+        assert acquire.call_args_list[0].kwargs == {"max_retries": 0, "timeout": 90}
+        assert slow.client is not fast.client
+        assert fast.client is same.client
+
+    def test_pool_size_applies_to_sync_clients(self):
+        registry = ClientRegistry()
+        client = registry.acquire("sgai-" + "0" * 32, pool_maxsize=32)
+        adapter = client.session.get_adapter("https://api.scrapegraphai.com")
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+        registry.close()
+
+    def test_injected_client_is_respected(self, registry):
+        """Test that a caller-provided client is kept and never closed."""
+        client = MockClient(api_key="sgai-test-api-key")
+        tool = ScrapeTool(api_key="sgai-test-api-key", client=client)
+        assert tool.client is client
+        tool.close()
+        assert not client.closed
+
+    @pytest.mark.asyncio
+    async def test_async_clients_are_shared_and_closed(self, registry):
+        """Test async client pooling and aclose lifecycle."""
+        scrape = ScrapeTool(api_key="sgai-test-api-key")
+        markdownify = MarkdownifyTool(api_key="sgai-test-api-key")
+        await scrape.ainvoke({"website_url": "https://example.com"})
+        await markdownify.ainvoke({"website_url": "https://example.com"})
+        client = scrape.async_client
+        assert client is markdownify.async_client
+
+        await scrape.aclose()
+        assert scrape.async_client is None
+        assert not client._sync.closed
+        await markdownify.aclose()
+        assert client._sync.closed
+
+
+class TestColdStart:
+    def test_package_import_does_not_load_tool_modules(self):
+        """Test that importing the tools package defers every tool module."""
+        code = (
+            "import sys, langchain_scrapegraph.tools as tools; "
+            "loaded = [m for m in sys.modules if m.startswith(tools.__name__ + '.')]; "
+            "from langchain_scrapegraph.tools import ScrapeTool; "
+            "after = [m for m in sys.modules if m.startswith(tools.__name__ + '.')]; "
+            "print(len(loaded), sorted(after))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        assert output.strip() == (
+            "0 ['langchain_scrapegraph.tools.base', 'langchain_scrapegraph.tools.scrape']"
+        )
+
+    def test_client_is_built_on_first_run(self, registry):
+        """Test that constructing a tool does not create any client."""
+        tool = ScrapeTool(api_key="sgai-test-api-key")
+        assert tool.client is None
+        assert tool.async_client is None
+        tool.invoke({"website_url": "https://example.com"})
+        assert isinstance(tool.client, MockClient)